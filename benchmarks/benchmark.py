@@ -0,0 +1,188 @@
+"""
+Headless benchmark for the PygameUI widgets.
+
+Times construction, update and draw of every widget class at several instance counts
+and writes the results as JSON, so runs from different versions can be compared.
+
+Usage:
+    python benchmarks/benchmark.py
+    python benchmarks/benchmark.py --scales 10 100 --widgets Button Text --output results.json
+    python benchmarks/benchmark.py --output new.json --compare results.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+# Run without a window, must be set before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import pygame
+import pygameui
+
+SCREEN_SIZE = (1280, 720)
+IMAGE_PATH = os.path.join(ROOT, "assets", "imgs", "logo.png")
+
+
+def get_position(index: int, cell_size: tuple[int, int]) -> tuple[int, int]:
+    """
+    Spread the instances over the screen in a grid, wrapping around when the screen is full
+    :param index: Index of the instance
+    :param cell_size: Size of each grid cell
+    :return: tuple[int, int] with the position of the instance
+    """
+    columns = max(1, SCREEN_SIZE[0] // cell_size[0])
+    rows = max(1, SCREEN_SIZE[1] // cell_size[1])
+    index %= columns * rows
+    return (index % columns) * cell_size[0], (index // columns) * cell_size[1]
+
+
+# Each factory creates one instance of a widget from its index
+WIDGETS = {
+    "Text": lambda i: pygameui.Text(get_position(i, (120, 30)), f"Label {i}"),
+    "Image": lambda i: pygameui.Image(get_position(i, (40, 40)), IMAGE_PATH, width=32, height=32),
+    "Input": lambda i: pygameui.Input(get_position(i, (210, 60)), hint=f"Input {i}"),
+    "Button": lambda i: pygameui.Button(get_position(i, (210, 60)), label=f"Button {i}"),
+    "ProgressBar": lambda i: pygameui.ProgressBar(get_position(i, (210, 60)), progress=i % 100),
+    "DropdownMenu": lambda i: pygameui.DropdownMenu(get_position(i, (210, 60)), ["One", "Two", "Three"]),
+    "Table": lambda i: pygameui.Table(get_position(i, (210, 160)), [["Name", "Score"], [f"Player {i}", str(i)], ["Total", "0"]]),
+    "Checkbox": lambda i: pygameui.Checkbox(get_position(i, (60, 60))),
+}
+
+
+def run_benchmark(name: str, count: int, frames: int, screen: pygame.Surface) -> dict:
+    """
+    Time the construction, update and draw of a number of instances of a widget
+    :param name: Name of the widget class
+    :param count: Number of instances
+    :param frames: Number of frames to time update and draw over
+    :param screen: Surface the instances are drawn on
+    :return: dict with the timings in milliseconds
+    """
+    factory = WIDGETS[name]
+    # Every run starts cold, the elements of the previous run are collected first so nothing holds their surfaces
+    gc.collect()
+    pygameui.clear_caches()
+
+    start = time.perf_counter()
+    elements = [factory(i) for i in range(count)]
+    construct_ms = (time.perf_counter() - start) * 1000
+
+    update_ms = []
+    draw_ms = []
+    events = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        for element in elements:
+            element.update(events)
+        update_ms.append((time.perf_counter() - start) * 1000)
+
+        screen.fill((0, 0, 0))
+        start = time.perf_counter()
+        for element in elements:
+            element.draw(screen)
+        draw_ms.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "widget": name,
+        "instances": count,
+        "frames": frames,
+        "construct_ms": construct_ms,
+        "construct_us_per_instance": construct_ms * 1000 / count,
+        "update_ms_per_frame": sum(update_ms) / frames,
+        "update_ms_max": max(update_ms),
+        "draw_ms_per_frame": sum(draw_ms) / frames,
+        "draw_ms_max": max(draw_ms),
+    }
+
+
+def compare_results(results: list[dict], baseline_path: str) -> None:
+    """
+    Print how much slower or faster each run is than the same run in an earlier results file
+    :param results: Results of this run
+    :param baseline_path: Path of the earlier JSON results file
+    :return: None
+    """
+    with open(baseline_path) as file:
+        baseline = {(result["widget"], result["instances"]): result for result in json.load(file)["results"]}
+
+    print(f"\nCompared to {baseline_path} (ratio above 1 is slower):", file=sys.stderr)
+    for result in results:
+        old = baseline.get((result["widget"], result["instances"]))
+        if old is None or "error" in old or "error" in result:
+            continue
+
+        ratios = []
+        for key in ("construct_ms", "update_ms_per_frame", "draw_ms_per_frame"):
+            ratios.append(result[key] / old[key] if old[key] else float("nan"))
+        print(f"{result['widget']:>12} x{result['instances']:<6} construct {ratios[0]:6.2f}x"
+              f"   update {ratios[1]:6.2f}x   draw {ratios[2]:6.2f}x", file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark PygameUI widgets without a window")
+    parser.add_argument("--scales", type=int, nargs="+", default=[10, 100, 1000, 10000],
+                        help="Instance counts to benchmark")
+    parser.add_argument("--widgets", nargs="+", default=list(WIDGETS), choices=list(WIDGETS),
+                        help="Widget classes to benchmark")
+    parser.add_argument("--frames", type=int, default=10,
+                        help="Frames to time update and draw over")
+    parser.add_argument("--output", default=None,
+                        help="Path of the JSON results file, printed to stdout if not set")
+    parser.add_argument("--compare", default=None,
+                        help="Path of an earlier JSON results file to compare against")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+
+    results = []
+    for name in args.widgets:
+        for count in args.scales:
+            try:
+                result = run_benchmark(name, count, args.frames, screen)
+            except pygame.error as error:
+                # Record the failure and start the next run with a fresh display
+                results.append({"widget": name, "instances": count, "error": str(error)})
+                print(f"{name:>12} x{count:<6} failed: {error}", file=sys.stderr)
+                pygame.quit()
+                pygame.init()
+                screen = pygame.display.set_mode(SCREEN_SIZE)
+                continue
+
+            results.append(result)
+            print(f"{name:>12} x{count:<6} construct {result['construct_ms']:10.2f} ms"
+                  f"   update {result['update_ms_per_frame']:9.3f} ms/frame"
+                  f"   draw {result['draw_ms_per_frame']:9.3f} ms/frame", file=sys.stderr)
+
+    report = {
+        "pygameui_version": pygameui.VERSION,
+        "pygame_version": pygame.version.ver,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=4)
+    else:
+        print(json.dumps(report, indent=4))
+
+    if args.compare:
+        compare_results(results, args.compare)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
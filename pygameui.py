@@ -6,881 +6,4166 @@
 # Or even contribute to the project!
 """
 
+import bisect
+import json
+import os
 import pygame
 import re
-from typing import Literal
-
-pygame.init()
+import time
+import weakref
+from array import array
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal, Union
+
+try:
+    import numpy
+except ImportError: # NumPy is optional, the animation ticker falls back to plain arrays
+    numpy = None
 
 VERSION = "2.2.1"
 
-class Element:
+# Counters read by the profiler, font renders and other surface allocations are counted where they happen
+_counters = {"font_renders": 0, "surface_allocations": 0}
+
+class FontCache:
     """
-    Basic element consisting of a customizable rectangle/square.
+    Process-wide registry of pygame fonts, shared by every element.
+    Fonts are keyed on (family, size, bold, italic) and the least recently used font is evicted when full.
+    The fonts are dropped when pygame is shut down with pygame.quit, pygame frees them with the font module.
     """
-    def __init__(self,
-                 position: tuple[int, int],
-                 width: int,
-                 height:int,
-                 color: tuple[int, int, int] = (255, 255, 255),
-                 border_radius: int = 0,
-                 border_color: tuple[int, int, int] = None,
-                 border_width: int = 2,
-                 centered: bool = False) -> None:
+    def __init__(self, max_fonts: int = 64) -> None:
         """
-        Create a basic element
-        :param position: Where the element will be positioned (x, y coordinates)
-        :param width: Width of the element rectangle in pixels
-        :param height: Height of the element rectangle in pixels
-        :param color: Color of the element as RGB tuple (r, g, b)
-        :param border_radius: Radius of the element corners in pixels
-        :param border_color: Color of the element border as RGB tuple (r, g, b), if None, the border will not be drawn
-        :param border_width: Width of the element border in pixels
-        :param centered: If True, the element will be centered at the provided position, otherwise the topleft will be at the position
+        Create a font cache
+        :param max_fonts: Maximum number of fonts kept loaded at the same time
         """
-        # Basic attributes
-        self._rect = pygame.Rect(position, (width, height))
-        self._border_radius = border_radius
-        self._border_color = border_color # If None, the border will not be drawn
-        self._border_width = border_width # Width of the border
-        self._color = color
-        self._display = True
-        # Centered attribute, if True, the element will be centered in the position
-        self._centered = centered
-        if self._centered:
-            self._rect.center = position
-
-        # Movement attributes
-        self._is_being_animated = False
-        self._loop = False
-        self._move_point_index = 0
-        # Move points is a list of tuples with the points that the element will move to in order
-        self._move_points = []
+        self._fonts = OrderedDict()
+        self._max_fonts = max_fonts
+        # If _on_font_quit is registered to run on pygame.quit
+        self._quit_registered = False
 
-        # Framerate
-        self._framerate = 60
-
-        # Clicked
-        self._clicked = {0: False, 1: False, 2: False}
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     """
     Setters
     """
 
-    def move(self, x: int, y: int) -> None:
-        """
-        Move the position of the elment by x, y value
-        (Note moving has no effect when animating)
-        :param x: int for movement in x direction
-        :param y: int for movement in y direction
-        """
-        if self._centered:
-            self._rect.centerx += x
-            self._rect.centery += y
-        else:
-            self._rect.x += x
-            self._rect.y += y
-
-    def set_position(self, position: tuple[int, int]) -> None:
+    def set_max_fonts(self, max_fonts: int) -> None:
         """
-        Set the position of the element
-        :param position: tuple[int, int] with the new position
+        Set the maximum number of fonts kept in the cache, evicting the oldest fonts if needed
+        :param max_fonts: int with the new maximum
         :return: None
         """
-        if self._centered:
-            self._rect.center = position
-        else:
-            self._rect.topleft = position
+        self._max_fonts = max_fonts
+        self._evict()
 
-    def set_framerate(self, framerate: int) -> None:
+    """
+    Getters
+    """
+
+    def get_font(self,
+                 family: str,
+                 size: int,
+                 bold: bool = False,
+                 italic: bool = False) -> pygame.font.Font:
+        """
+        Get a font, loading it only if it is not already cached
+        :param family: Font family name, as passed to pygame.font.SysFont
+        :param size: Font size
+        :param bold: If the font is bold
+        :param italic: If the font is italic
+        :return: pygame.font.Font matching the parameters
+        """
+        # The fonts are freed when the font module is shut down, they can not be used after it
+        if self._fonts and not pygame.font.get_init():
+            self._on_font_quit()
+
+        key = (family, size, bold, italic)
+        font = self._fonts.get(key)
+
+        if font is not None:
+            self._hits += 1
+            self._fonts.move_to_end(key)
+            return font
+
+        self._misses += 1
+        # pygame is not initialized on import, the font module is brought up with the first font
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if not self._quit_registered:
+            # pygame.quit followed by pygame.init leaves the font module initialized, so the quit is caught here
+            pygame.register_quit(self._on_font_quit)
+            self._quit_registered = True
+        font = pygame.font.SysFont(family, size, bold, italic)
+        self._fonts[key] = font
+        self._evict()
+        return font
+
+    def get_stats(self) -> dict:
+        """
+        Get the cache statistics
+        :return: dict with the number of cached fonts, hits, misses and evictions
+        """
+        return {
+            "fonts": len(self._fonts),
+            "max_fonts": self._max_fonts,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+    """
+    Basic methods
+    """
+
+    def clear(self) -> None:
         """
-        Set the framerate of the element
-        :param framerate: int with the new framerate
+        Remove every font from the cache and reset the statistics
         :return: None
         """
-        self._framerate = framerate
+        self._fonts.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
-    def set_display(self, display: bool) -> None:
+    """
+    Internal methods
+    """
+
+    def _evict(self) -> None:
         """
-        Set if the element will be displayed
-        :param display: bool with the new display value
+        Evict the least recently used fonts until the cache is within its limit
         :return: None
         """
-        self._display = display
+        while len(self._fonts) > max(self._max_fonts, 1):
+            self._fonts.popitem(last=False)
+            self._evictions += 1
 
-    def set_color(self, color: tuple[int, int, int]) -> None:
+    def _on_font_quit(self) -> None:
         """
-        Set the color of the element
-        :param color: tuple[int, int, int] with the new color
+        Drop the fonts and the texts rendered with them after pygame or its font module was shut down
         :return: None
         """
-        self._color = color
+        self._fonts.clear()
+        # pygame forgets the registered functions once they are called
+        self._quit_registered = False
+        text_surface_cache.clear()
 
-    def set_border_color(self, color: tuple[int, int, int]) -> None:
+class TextSurfaceCache:
+    """
+    Process-wide cache of rendered text surfaces, shared by every element.
+    Surfaces are keyed on (content, font key, color, anti-aliasing) and the least recently used surfaces
+    are evicted when the total size of the cached pixels goes above the byte budget.
+    Cached surfaces are shared, so they must never be drawn on.
+    """
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024) -> None:
         """
-        Set the border color of the element
-        :param color: tuple[int, int, int] with the new border color
-        :return: None
+        Create a text surface cache
+        :param max_bytes: Maximum number of bytes of pixel data kept in the cache
         """
-        self._border_color = color
+        self._surfaces = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
 
-    def set_border_radius(self, radius: int) -> None:
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._evicted_bytes = 0
+
+    """
+    Setters
+    """
+
+    def set_max_bytes(self, max_bytes: int) -> None:
         """
-        Set the border radius of the element
-        :param border_radius: int with the new border radius
+        Set the byte budget of the cache, evicting the oldest surfaces if needed
+        :param max_bytes: int with the new byte budget
         :return: None
         """
-        self._border_radius = radius
+        self._max_bytes = max_bytes
+        self._evict()
 
-    def set_border_width(self, width: int) -> None:
+    """
+    Getters
+    """
+
+    def render(self,
+               content: str,
+               font_key: tuple[str, int, bool, bool],
+               color: tuple[int, int, int],
+               anti_aliasing: bool = True) -> pygame.Surface:
         """
-        Set the border width of the element
-        :param border_width: int with the new border width
-        :return: None
+        Get the rendered surface of a text, rendering it only if it is not already cached
+        :param content: The text to render
+        :param font_key: (family, size, bold, italic) of the font, as used by the font cache
+        :param color: The text color
+        :param anti_aliasing: If the text will be anti aliased
+        :return: pygame.Surface with the rendered text
         """
-        self._border_width = width
+        key = (content, font_key, tuple(color), anti_aliasing)
+        surface = self._surfaces.get(key)
 
-    def set_animate(self, state: bool) -> None:
+        if surface is not None:
+            self._hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self._misses += 1
+        _counters["font_renders"] += 1
+        surface = font_cache.get_font(*font_key).render(content, anti_aliasing, color)
+
+        size = self._get_surface_bytes(surface)
+        # Surfaces bigger than the whole budget are never cached
+        if size <= self._max_bytes:
+            self._surfaces[key] = surface
+            self._bytes += size
+            self._evict()
+
+        return surface
+
+    def get_stats(self) -> dict:
         """
-        Set if the element will move, be animated or not
-        :param move: bool with the new move value
-        :return: None
+        Get the cache statistics
+        :return: dict with the byte usage, byte budget, hits, misses and evictions
         """
-        self._is_being_animated = state
+        return {
+            "surfaces": len(self._surfaces),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "evicted_bytes": self._evicted_bytes,
+        }
 
     """
-    Getters
+    Basic methods
     """
 
-    def get_position(self) -> tuple[int, int]:
+    def clear(self) -> None:
         """
-        Get the position of the element
-        :return: tuple[int, int] with the position of the element
+        Remove every surface from the cache and reset the statistics
+        :return: None
         """
-        if self._centered:
-            return self._rect.center
+        self._surfaces.clear()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._evicted_bytes = 0
 
-        return self._rect.topleft
+    """
+    Internal methods
+    """
 
-    def get_display(self) -> bool:
+    @staticmethod
+    def _get_surface_bytes(surface: pygame.Surface) -> int:
         """
-        Get if the element will be displayed
-        :return: bool with the display value
+        Get the size of the pixel data of a surface
+        :param surface: pygame.Surface to measure
+        :return: int with the number of bytes
         """
-        return self._display
+        return surface.get_pitch() * surface.get_height()
 
-    def get_animation_state(self) -> bool:
+    def _evict(self) -> None:
         """
-        Get if the element is being animated
-        :return: bool with the animation state
+        Evict the least recently used surfaces until the cache is within its byte budget
+        :return: None
         """
-        return self._is_being_animated
+        while self._bytes > self._max_bytes and self._surfaces:
+            _, surface = self._surfaces.popitem(last=False)
+            size = self._get_surface_bytes(surface)
+            self._bytes -= size
+            self._evictions += 1
+            self._evicted_bytes += size
 
+class AssetManager:
     """
-    Toggles
+    Process-wide cache of loaded images, shared by every Image element.
+    Each path is decoded from disk once, the converted original and its scaled variants are kept
+    per (source, size, filter) and the least recently used surfaces are evicted when the total size of the cached pixels goes above the byte budget.
+    Cached surfaces are shared, so they must never be drawn on.
+    Images can also be decoded in background threads with load_async, the decoded images are converted
+    and handed to their callbacks on the main thread by update, which is called once per frame.
     """
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_workers: int = 2) -> None:
+        """
+        Create an asset manager
+        :param max_bytes: Maximum number of bytes of pixel data kept in the cache
+        :param max_workers: Number of threads decoding images loaded with load_async
+        """
+        # Keys are (path, None, None) for originals and (source, (width, height), filter) for scaled variants
+        self._surfaces = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+
+        # Asynchronous loading, the thread pool is only created when it is first needed
+        self._max_workers = max_workers
+        self._executor = None
+        self._pending = {}
+        self._callbacks = {}
+        self._error_callbacks = {}
+        # Last decoding error of each path that failed to load in the background
+        self._errors = {}
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+        self._evictions = 0
 
-    def toggle_display(self) -> None:
+    """
+    Setters
+    """
+
+    def set_max_bytes(self, max_bytes: int) -> None:
         """
-        Toggle the display of the element
+        Set the byte budget of the cache, evicting the oldest surfaces if needed
+        :param max_bytes: int with the new byte budget
         :return: None
         """
-        self._display = not self._display
+        self._max_bytes = max_bytes
+        self._evict()
 
     """
-    Movement methods
+    Getters
     """
-    # TODO - Fix the framerate of the movement so it actually takes the time to move from start to end position
-    def flow(self,
-             start_position: tuple[int, int],
-             end_position: tuple[int, int],
-             time: int,
-             loop: bool = False) -> None:
 
+    def get_image(self, path: str) -> pygame.Surface:
         """
-        Sets and starts smooth movement animation of the element between two positions.
-        :param start_position: Where the element will start to move from (x, y coordinates)
-        :param end_position: Where the element will move to (x, y coordinates)
-        :param time: Duration of movement in milliseconds
-        :param loop: If True, the element will continuously move back and forth between positions
-        :return: None
+        Get the original image of a path, decoding it only if it is not already cached
+        :param path: Path to the image file
+        :return: pygame.Surface with the original image
         """
-        # Calculate the number of frames
-        num_frames = time // (1000 // self._framerate)
-        # Calculate the distance between the start and end positions
-        distance = [end_position[0] - start_position[0], end_position[1] - start_position[1]]
-        # Calculate the speed of the element per frame
-        speed = [distance[0] / num_frames, distance[1] / num_frames]
-        # Create a list of points that the element will move to in order
-        self._move_points = [[start_position[0] + speed[0] * i, start_position[1] + speed[1] * i] for i in
-                            range(num_frames)]
-        self._move_points.append(end_position)
+        key = (path, None, None)
+        surface = self._get_cached(key)
+        if surface is not None:
+            return surface
 
-        # If loop is True, the element will move back to the start position after reaching the end position
-        if loop:
-            self._loop = True
-            self._move_point_index = 0
-            # Reverse the list of points so the element moves back to the start position
-            self._move_points += reversed(self._move_points)
+        surface = self._convert(pygame.image.load(path))
+        self._loads += 1
+        _counters["surface_allocations"] += 1
+        self._store(key, surface)
+        return surface
 
-        self.set_animate(True)
+    def get_scaled(self,
+                   path: str,
+                   size: tuple[int, int],
+                   scale_filter: Literal["scale", "smoothscale"] = "scale") -> pygame.Surface:
+        """
+        Get an image scaled to a size, scaling the cached original only if the variant is not already cached
+        :param path: Path to the image file
+        :param size: tuple[int, int] with the width and height of the image
+        :param scale_filter: "scale" for fast nearest neighbour scaling, "smoothscale" for filtered scaling
+        :return: pygame.Surface with the scaled image
+        """
+        size = (int(size[0]), int(size[1]))
+        key = (path, size, scale_filter)
+        surface = self._get_cached(key)
+        if surface is not None:
+            return surface
 
-    # TODO - Fix the framerate of the jumping so it actually takes the time to jump from start to end position
-    def jump(self,
-             start_position: tuple[int, int],
-             end_position: tuple[int, int],
-             time: int,
-             loop: bool = False,
-             ratio: float = 1) -> None:
+        return self._scale(key, self.get_image(path), scale_filter)
 
+    def get_scaled_surface(self,
+                           source,
+                           surface: pygame.Surface,
+                           size: tuple[int, int],
+                           scale_filter: Literal["scale", "smoothscale"] = "scale") -> pygame.Surface:
         """
-        Sets and starts jumping animation of the element between two positions.
-        :param start_position: Where the element will start to jump from (x, y coordinates)
-        :param end_position: Where the element will jump to (x, y coordinates)
-        :param time: Duration between jumps in milliseconds
-        :param loop: If True, the element will continuously jump back and forth between positions
-        :param ratio: Float between 0 and 1. The lower the ratio, the less time the element will spend at start_position
-        :return: None
+        Get any surface scaled to a size, the scaled variants are cached under the source key
+        Used for images that do not come from a file, like the regions of a texture atlas
+        :param source: Hashable key identifying the surface, must change if the surface pixels change
+        :param surface: pygame.Surface to scale
+        :param size: tuple[int, int] with the width and height of the image
+        :param scale_filter: "scale" for fast nearest neighbour scaling, "smoothscale" for filtered scaling
+        :return: pygame.Surface with the scaled image
         """
-        # Calculate the number of frames
-        num_frames = time // (1000 // self._framerate)
+        size = (int(size[0]), int(size[1]))
+        key = (source, size, scale_filter)
+        scaled = self._get_cached(key)
+        if scaled is not None:
+            return scaled
 
-        # Calculate ratio
-        start_pos_share = 0.5*ratio
-        ent_pos_share = 1-start_pos_share
+        return self._scale(key, surface, scale_filter)
 
-        # Create a list of points that the element will move to in order
-        self._move_points = [start_position for _ in range(int(num_frames*start_pos_share))]
-        self._move_points += [end_position for _ in range(int(num_frames*ent_pos_share))]
+    def is_loaded(self, path: str) -> bool:
+        """
+        Check if the original image of a path is in the cache
+        :param path: Path to the image file
+        :return: bool, True if the image can be used without reading the disk
+        """
+        return (path, None, None) in self._surfaces
+
+    def get_error(self, path: str) -> Exception:
+        """
+        Get the error raised when a path failed to load in the background
+        :param path: Path to the image file
+        :return: Exception raised by the decoding, None if the path did not fail
+        """
+        return self._errors.get(path)
 
-        # If loop is True, the element will jump back to the start position after reaching the end position
-        if loop:
-            self._loop = True
-            self._move_point_index = 0
-            self._move_points += reversed(self._move_points)
+    def get_pending_count(self) -> int:
+        """
+        Get the number of images that are being decoded in the background
+        :return: int with the number of pending images
+        """
+        return len(self._pending)
 
-        self.set_animate(True)
+    def get_stats(self) -> dict:
+        """
+        Get the cache statistics
+        :return: dict with the byte usage, byte budget, hits, misses, disk loads, evictions and pending loads
+        """
+        return {
+            "surfaces": len(self._surfaces),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "loads": self._loads,
+            "evictions": self._evictions,
+            "pending": len(self._pending),
+        }
 
     """
-    Internal methods
+    Basic methods
     """
 
-    def _update_movement(self) -> None:
+    def preload(self, *paths: str) -> None:
         """
-        Update the movement of the element
+        Decode images ahead of time so the first Image using them does not hit the disk
+        :param paths: Paths to the image files
+        :return: None
+        """
+        for path in paths:
+            self.get_image(path)
+
+    def load_async(self, path: str, callback=None, error_callback=None) -> None:
+        """
+        Decode an image in a background thread
+        The callback is called with the path on the main thread, during the update call where the image is ready,
+        or right away if the image is already cached
+        :param path: Path to the image file
+        :param callback: Optional function called with the path once the image can be used
+        :param error_callback: Optional function called with the path and the error if the image can not be decoded
         :return: None
         """
-        if not self._is_being_animated:
+        if self.is_loaded(path):
+            if callback:
+                callback(path)
             return
 
-        if self._loop:
-            point_to_move_to = self._move_points[self._move_point_index]
-            self._move_point_index += 1
+        if callback:
+            self._callbacks.setdefault(path, []).append(callback)
+        if error_callback:
+            self._error_callbacks.setdefault(path, []).append(error_callback)
 
-            if self._move_point_index >= len(self._move_points):
-                self._move_point_index = 0
+        if path not in self._pending:
+            self._errors.pop(path, None)
+            self._pending[path] = self._get_executor().submit(pygame.image.load, path)
 
-        else:
-            point_to_move_to = self._move_points.pop(0)
-            if not self._move_points:
-                self._is_being_animated = False
+    def update(self, budget_ms: float = 4) -> int:
+        """
+        Convert the images decoded in the background and call their callbacks
+        Images that failed to decode call their error callbacks instead, see get_error
+        At least one image is handled per call, then images are handled until the time budget is used
+        :param budget_ms: Time in milliseconds that can be spent in this call
+        :return: int with the number of images handled
+        """
+        if not self._pending:
+            return 0
 
-        self.set_position(point_to_move_to)
+        start = time.perf_counter()
+        handled = 0
 
-    """
-    Mouse and clicking methods
-    """
+        for path, future in list(self._pending.items()):
+            if not future.done():
+                continue
 
-    def is_hovered(self) -> bool:
+            del self._pending[path]
+            callbacks = self._callbacks.pop(path, [])
+            error_callbacks = self._error_callbacks.pop(path, [])
+
+            try:
+                surface = future.result()
+            except (OSError, pygame.error) as error:
+                # A missing or corrupt file only fails its own image, the other images are still handed over
+                self._errors[path] = error
+                for error_callback in error_callbacks:
+                    error_callback(path, error)
+            else:
+                if not self.is_loaded(path):
+                    self._loads += 1
+                    _counters["surface_allocations"] += 1
+                    self._store((path, None, None), self._convert(surface))
+
+                for callback in callbacks:
+                    callback(path)
+
+            handled += 1
+            if (time.perf_counter() - start) * 1000 >= budget_ms:
+                break
+
+        return handled
+
+    def shutdown(self) -> None:
         """
-        Check if the mouse is hovering over the element
-        :return: True if the mouse is hovering, False otherwise
+        Stop the background threads, images that are still being decoded are dropped
+        :return: None
         """
-        mouse_pos = pygame.mouse.get_pos()
-        return self._rect.collidepoint(mouse_pos)
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
-    def is_clicked(self, button: int = 0) -> bool:
+        self._pending.clear()
+        self._callbacks.clear()
+        self._error_callbacks.clear()
+
+    def unload(self, path: str) -> None:
         """
-        Check if the element is hovered and the mouse button is down
-        :param button: The mouse button to check (0=left, 1=middle, 2=right)
-        :return: True if the button is clicked, False otherwise
+        Remove the original and every scaled variant of a path from the cache
+        :param path: Path to the image file
+        :return: None
         """
-        return self.is_hovered() and pygame.mouse.get_pressed()[button]
+        for key in [key for key in self._surfaces if key[0] == path]:
+            self._bytes -= self._get_surface_bytes(self._surfaces.pop(key))
 
-    def was_clicked(self, button: int = 0) -> bool:
+    def clear(self) -> None:
         """
-        Check if the element was clicked and then released
-        :param button: The mouse button to check (0=left, 1=middle, 2=right)
-        :return: True if the button was clicked and released, False otherwise
+        Remove every surface from the cache and reset the statistics
+        :return: None
         """
-        if self.is_clicked(button):
-            self._clicked[button] = True
-            return False
-
-        if self._clicked[button]:
-            self._clicked[button] = False
-            return True
-
-        return False
+        self._surfaces.clear()
+        self._errors.clear()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+        self._evictions = 0
 
     """
-    Basic methods
+    Internal methods
     """
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def _get_executor(self) -> ThreadPoolExecutor:
         """
-        Draw the element in the surface
-        :param surface: pygame.Surface where the element will be drawn
+        Get the thread pool decoding the images, creating it if needed
+        :return: ThreadPoolExecutor
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="pygameui-assets")
+        return self._executor
+
+    def _get_cached(self, key: tuple) -> pygame.Surface:
+        """
+        Look up a surface and mark it as recently used
+        :param key: (source, size, filter) of the surface
+        :return: pygame.Surface or None if it is not cached
+        """
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._surfaces.move_to_end(key)
+        return surface
+
+    def _store(self, key: tuple, surface: pygame.Surface) -> None:
+        """
+        Add a surface to the cache, surfaces bigger than the whole budget are never cached
+        :param key: (source, size, filter) of the surface
+        :param surface: pygame.Surface to cache
         :return: None
         """
-        if not self._display:
+        size = self._get_surface_bytes(surface)
+        if size > self._max_bytes:
             return
 
-        pygame.draw.rect(surface, self._color, self._rect, border_radius = self._border_radius)
+        if key in self._surfaces:
+            self._bytes -= self._get_surface_bytes(self._surfaces.pop(key))
 
-        if self._border_color:
-            pygame.draw.rect(surface, self._border_color, self._rect, width=self._border_width, border_radius=self._border_radius)
+        self._surfaces[key] = surface
+        self._bytes += size
+        self._evict()
 
-    def update(self, events=None) -> None:
+    def _scale(self, key: tuple, original: pygame.Surface, scale_filter: str) -> pygame.Surface:
         """
-        Update the element's state, movement, and animations
-        :param events: Optional list of pygame events (not used in base Element class but included for API consistency)
-        :return: None
+        Scale an image and cache the result
+        :param key: (source, size, filter) of the scaled image
+        :param original: pygame.Surface with the full size image
+        :param scale_filter: "scale" or "smoothscale"
+        :return: pygame.Surface with the scaled image
         """
-        self._update_movement()
+        source, size, _ = key
+        if original.get_size() == size:
+            return original
 
-class Text(Element):
-    """
-    Used to display backgroundless text in the screen, innherited from Element class.
-    """
-    def __init__(self,
-                 position: tuple[int, int],
-                 content: str,
-                 color: tuple[int, int, int] = (255, 255, 255),
-                 font_size: int = 20,
-                 font_family: str = "Arial",
-                 width: int = 0,
-                 height: int = 0,
-                 anti_aliasing: bool = True,
-                 centered: bool = False) -> None:
+        if scale_filter == "smoothscale":
+            # smoothscale only handles 24 and 32 bit surfaces, other images fall back to scale
+            if min(size) > 0 and original.get_bitsize() >= 24:
+                level = self._get_mipmap(source, original, size)
+                if level.get_size() == size:
+                    return level
+                surface = pygame.transform.smoothscale(level, size)
+            else:
+                surface = pygame.transform.scale(original, size)
+        elif scale_filter == "scale":
+            surface = pygame.transform.scale(original, size)
+        else:
+            raise ValueError(f"Unknown scale filter: {scale_filter}")
+
+        _counters["surface_allocations"] += 1
+        surface = self._convert(surface)
+        self._store(key, surface)
+        return surface
+
+    def _get_mipmap(self, source, original: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
+        """
+        Get the smallest level of the half size pyramid of an image that is still at least as big as a size
+        Levels are cached like any smoothscaled variant, so repeated downscaling starts from a small image
+        :param source: Key identifying the image
+        :param original: pygame.Surface with the full size image
+        :param size: tuple[int, int] with the size the image will be scaled to
+        :return: pygame.Surface with the pyramid level
+        """
+        level = original
+        while level.get_width() // 2 >= size[0] and level.get_height() // 2 >= size[1]:
+            half_size = (level.get_width() // 2, level.get_height() // 2)
+            key = (source, half_size, "smoothscale")
+
+            half = self._surfaces.get(key)
+            if half is None:
+                half = self._convert(pygame.transform.smoothscale(level, half_size))
+                _counters["surface_allocations"] += 1
+                self._store(key, half)
+            else:
+                self._surfaces.move_to_end(key)
+            level = half
+
+        return level
+
+    @staticmethod
+    def _convert(surface: pygame.Surface) -> pygame.Surface:
         """
-        Create a text element
-        :param position: Where the text will be positioned
-        :param content: The text displayed
-        :param color: The text color
-        :param font_size: The size of the font
-        :param font_family: What font family the text will use
-        :param width: Width of the text element, 0 indicates that the width will be the width of the text.
-        :param height: Height of the text element, 0 indicates that the height will be the width of the text.
-        :param anti_aliasing: If the text will be anti aliased
-        :param centered: If the text will be centered in the position
+        Convert a surface to the display pixel format, which needs a display mode to be set
+        The converted copy replaces the surface, so the allocation is counted once by the callers
+        :param surface: pygame.Surface to convert
+        :return: pygame.Surface with the converted image
         """
-        # Text attributes
-        self._content = content
-        self._font_size = font_size
-        self._font_family = font_family
-        self._font = pygame.font.SysFont(self._font_family, self._font_size)
-        self._anti_aliasing = anti_aliasing
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha()
 
-        # Get the dimensions of the text
-        if width and height:
-            text_dimensions = (width, height)
-        else:
-            text_dimensions = self._get_text_rect_dimensions()
+    @staticmethod
+    def _get_surface_bytes(surface: pygame.Surface) -> int:
+        """
+        Get the size of the pixel data of a surface
+        :param surface: pygame.Surface to measure
+        :return: int with the number of bytes
+        """
+        return surface.get_pitch() * surface.get_height()
 
-        super().__init__(position, width=text_dimensions[0], height=text_dimensions[1], color=color, centered=centered)
+    def _evict(self) -> None:
+        """
+        Evict the least recently used surfaces until the cache is within its byte budget
+        :return: None
+        """
+        while self._bytes > self._max_bytes and self._surfaces:
+            _, surface = self._surfaces.popitem(last=False)
+            self._bytes -= self._get_surface_bytes(surface)
+            self._evictions += 1
 
-        # Render text
-        self._text_surface = self._render_text()
+class TextureAtlas:
+    """
+    Shared surface holding many small images, each one available as a named region.
+    Regions are subsurfaces of the atlas, so they take no extra memory and images drawn from the same atlas
+    read from the same block of pixels. Use it with the atlas parameter of the Image element.
+    """
+    # File extensions packed by from_directory
+    _image_extensions = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tga", ".webp")
+
+    def __init__(self, surface: pygame.Surface, regions: dict) -> None:
+        """
+        Create a texture atlas from an existing surface
+        :param surface: pygame.Surface with every image of the atlas
+        :param regions: dict with the name of each region and its (x, y, width, height) in the surface
+        """
+        self._surface = surface
+        self._regions = {name: pygame.Rect(rect) for name, rect in regions.items()}
+        self._subsurfaces = {}
 
     """
-    Setters
+    Getters
     """
 
-    def set_content(self, content: str) -> None:
+    def get_region(self, name: str) -> pygame.Surface:
         """
-        Change the text of the element
-        :param content: Content to be displayed. Will be converted to string if not already a string.
-        :return: None
+        Get the image of a region
+        :param name: Name of the region
+        :return: pygame.Surface sharing its pixels with the atlas
         """
-        self._content = str(content)
-        self._text_surface = self._render_text()
+        subsurface = self._subsurfaces.get(name)
+        if subsurface is None:
+            if name not in self._regions:
+                raise KeyError(f"Region {name} is not in the atlas")
+            subsurface = self._surface.subsurface(self._regions[name])
+            self._subsurfaces[name] = subsurface
+        return subsurface
 
-    def set_color(self, color: tuple[int, int, int]) -> None:
+    def get_rect(self, name: str) -> pygame.Rect:
         """
-        Change the color of the text
-        :param color: tuple[int, int, int] with the new color
-        :return: None
+        Get the area of a region in the atlas surface
+        :param name: Name of the region
+        :return: pygame.Rect with the area of the region
         """
+        return self._regions[name].copy()
 
-        self._color = color
-        self._text_surface = self._render_text() # Update the text surface with the new color
+    def get_names(self) -> list[str]:
+        """
+        Get the names of the regions
+        :return: list[str] with the region names
+        """
+        return list(self._regions)
 
-    def set_font_size(self, font_size: int) -> None:
+    def has_region(self, name: str) -> bool:
         """
-        Change the size of the font
-        :param font_size: int with the new size
-        :return: None
+        Check if the atlas has a region
+        :param name: Name of the region
+        :return: bool, True if the region exists
         """
-        self._font_size = font_size
-        self._text_surface = self._render_text()
+        return name in self._regions
 
-    def set_font_family(self, font_family: str) -> None:
+    def get_surface(self) -> pygame.Surface:
         """
-        Change the font family of the text
-        :param font_family: str with the new font family
-        :return: None
+        Get the atlas surface
+        :return: pygame.Surface with every image of the atlas
         """
-        self._font_family = font_family
-        self._text_surface = self._render_text()
+        return self._surface
 
     """
-    Getters
+    Basic methods
     """
 
+    def save(self, index_path: str) -> None:
+        """
+        Save the atlas as a PNG image and a JSON index, the image is saved next to the index with a .png extension
+        :param index_path: Path of the JSON index file
+        :return: None
+        """
+        image_path = os.path.splitext(index_path)[0] + ".png"
+        pygame.image.save(self._surface, image_path)
+        # An atlas loaded earlier from the same path is cached by the asset manager, load has to decode the new image
+        asset_manager.unload(image_path)
+
+        index = {
+            "image": os.path.basename(image_path),
+            "regions": {name: list(rect) for name, rect in self._regions.items()},
+        }
+        with open(index_path, "w") as file:
+            json.dump(index, file, indent=4)
+
+    @classmethod
+    def load(cls, index_path: str) -> "TextureAtlas":
+        """
+        Load an atlas saved with save, the image is decoded through the asset manager
+        :param index_path: Path of the JSON index file
+        :return: TextureAtlas
+        """
+        with open(index_path) as file:
+            index = json.load(file)
+
+        image_path = os.path.join(os.path.dirname(index_path), index["image"])
+        return cls(asset_manager.get_image(image_path), index["regions"])
+
+    @classmethod
+    def from_directory(cls,
+                       directory: str,
+                       cache_path: str = None,
+                       padding: int = 1,
+                       max_width: int = 1024) -> "TextureAtlas":
+        """
+        Pack every image of a directory into an atlas, each region is named after its file without the extension
+        If a cache path is given, the atlas is saved there and loaded back on later calls,
+        until an image of the directory is added, removed or modified
+        :param directory: Path of the directory with the images
+        :param cache_path: Optional path of the JSON index of the cached atlas
+        :param padding: Empty pixels around each image, keeps smooth scaling from bleeding neighbouring images in
+        :param max_width: Maximum width of the atlas, wider images get a row of their own
+        :return: TextureAtlas
+        """
+        # The cached atlas may be saved inside the directory, it is not one of its images
+        excluded = set()
+        if cache_path:
+            excluded = {os.path.normcase(os.path.abspath(path))
+                        for path in (cache_path, os.path.splitext(cache_path)[0] + ".png")}
+
+        paths = {}
+        for file_name in sorted(os.listdir(directory)):
+            name, extension = os.path.splitext(file_name)
+            path = os.path.join(directory, file_name)
+            if extension.lower() in cls._image_extensions and os.path.normcase(os.path.abspath(path)) not in excluded:
+                paths[name] = path
+
+        if cache_path and cls._is_cache_valid(cache_path, paths):
+            return cls.load(cache_path)
+
+        images = {name: pygame.image.load(path) for name, path in paths.items()}
+        atlas = cls._pack(images, padding, max_width)
+
+        if cache_path:
+            atlas.save(cache_path)
+        return atlas
+
     """
-    Getters
+    Internal methods
     """
 
-    def get_content(self) -> str:
+    @staticmethod
+    def _is_cache_valid(index_path: str, paths: dict) -> bool:
         """
-        Get the content of the text
-        :return: str with the content of the text
+        Check if a cached atlas has the same images as a directory and is newer than all of them
+        :param index_path: Path of the JSON index file
+        :param paths: dict with the region names and the paths of their images
+        :return: bool, True if the cached atlas can be used
         """
-        return self._content
+        image_path = os.path.splitext(index_path)[0] + ".png"
+        if not os.path.exists(index_path) or not os.path.exists(image_path):
+            return False
+
+        with open(index_path) as file:
+            regions = json.load(file).get("regions", {})
+        if set(regions) != set(paths):
+            return False
+
+        cache_time = min(os.path.getmtime(index_path), os.path.getmtime(image_path))
+        return all(os.path.getmtime(path) <= cache_time for path in paths.values())
+
+    @classmethod
+    def _pack(cls, images: dict, padding: int, max_width: int) -> "TextureAtlas":
+        """
+        Pack images into one surface with a shelf packer, images are sorted by height and placed
+        left to right in rows as tall as their first image
+        :param images: dict with the region names and their surfaces
+        :param padding: Empty pixels around each image
+        :param max_width: Maximum width of the atlas
+        :return: TextureAtlas
+        """
+        order = sorted(images, key=lambda name: (-images[name].get_height(), name))
+
+        regions = {}
+        x = y = padding
+        shelf_height = 0
+        width = padding
+
+        for name in order:
+            image_width, image_height = images[name].get_size()
+
+            # Start a new shelf when the image does not fit in the current one
+            if x > padding and x + image_width + padding > max_width:
+                x = padding
+                y += shelf_height + padding
+                shelf_height = 0
 
+            regions[name] = (x, y, image_width, image_height)
+            x += image_width + padding
+            shelf_height = max(shelf_height, image_height)
+            width = max(width, x)
+
+        surface = pygame.Surface((width, y + shelf_height + padding), pygame.SRCALPHA)
+        _counters["surface_allocations"] += 1
+        for name, region in regions.items():
+            surface.blit(images[name], region[:2])
+
+        return cls(AssetManager._convert(surface), regions)
+
+class MouseState:
     """
-    Internal methods
+    Mouse position and buttons as seen by the elements.
+    Reads pygame.mouse on every call, unless a snapshot was captured for the current frame,
+    which lets a UIManager query SDL once per frame instead of once per element.
     """
-
-    def _get_text_rect_dimensions(self) -> tuple[int, int]:
+    def __init__(self) -> None:
         """
-        Get the dimensions of the text, width and height
-        :return: tuple[int, int] with the width and height of the text
+        Create a mouse state without a snapshot
         """
-        font = pygame.font.SysFont(self._font_family, self._font_size)
-        text_surface = font.render(self._content, True, (255, 255, 255))
+        self._position = None
+        self._pressed = None
 
-        rect = text_surface.get_rect()
-        return rect.width, rect.height
+    """
+    Getters
+    """
 
-    def _render_text(self) -> pygame.Surface:
+    def get_pos(self) -> tuple[int, int]:
         """
-        Render the text
-        :return: pygame.Surface with the rendered text
-'       """
+        Get the mouse position
+        :return: tuple[int, int] with the position
+        """
+        if self._position is None:
+            return pygame.mouse.get_pos()
+        return self._position
 
-        font = pygame.font.SysFont(self._font_family, self._font_size)
-        text_surface = font.render(str(self._content), self._anti_aliasing, self._color)
-        return text_surface
+    def get_pressed(self) -> tuple[bool, bool, bool]:
+        """
+        Get the state of the mouse buttons
+        :return: tuple[bool, bool, bool] with the left, middle and right button states
+        """
+        if self._pressed is None:
+            return pygame.mouse.get_pressed()
+        return self._pressed
 
     """
     Basic methods
     """
-    def draw(self, surface: pygame.Surface) -> None:
+
+    def capture(self) -> None:
         """
-        Draw the text in the surface
-        :param surface: pygame.Surface where the text will be drawn
+        Read the mouse once and answer every following query with the snapshot
         :return: None
         """
+        self._position = pygame.mouse.get_pos()
+        self._pressed = pygame.mouse.get_pressed()
 
-        if not self._display:
-            return
+    def release(self) -> None:
+        """
+        Throw away the snapshot so queries read the mouse again
+        :return: None
+        """
+        self._position = None
+        self._pressed = None
 
-        rect = self._text_surface.get_rect()
-        if self._centered:
-            rect.center = self._rect.center
-        else:
-            rect.topleft = self._rect.topleft
+# Shared by every element in the library
+font_cache = FontCache()
+text_surface_cache = TextSurfaceCache()
+asset_manager = AssetManager()
+mouse_state = MouseState()
 
-        surface.blit(self._text_surface, rect)
+def init() -> None:
+    """
+    Initialize the pygame modules used by the library right away
+    Importing pygameui does not initialize pygame, fonts are initialized when the first font is loaded,
+    so calling this is only needed to pay the setup cost up front. The window is still created with pygame.display.set_mode
+    :return: None
+    """
+    pygame.display.init()
+    pygame.font.init()
 
-class Image(Element):
+def clear_caches() -> None:
     """
-    Image element for displaying images in the screen, innherited from Element class.
+    Empty every cache shared between elements, the fonts, rendered texts, images, styles and prerendered surfaces
+    Elements keep drawing after it, the surfaces they hold are only built again when they change
+    :return: None
+    """
+    font_cache.clear()
+    text_surface_cache.clear()
+    asset_manager.clear()
+    Style._styles.clear()
+    Button._state_surface_cache.clear()
+    Checkbox._mark_surfaces.clear()
+
+def _init_clipboard() -> None:
+    """
+    Initialize the pygame scrap module used to copy and paste text, once per process
+    It is called on the first copy or paste in an Input, as the scrap module needs the window to be created
+    :return: None
+    """
+    if pygame.scrap.get_init():
+        return
+
+    pygame.scrap.init()
+    pygame.scrap.set_mode(pygame.SCRAP_CLIPBOARD)
+
+def _get_ticks() -> float:
+    """
+    Get the time used by every animation
+    :return: float with a monotonic time in milliseconds
+    """
+    return time.perf_counter() * 1000
+
+# Easing curves, each maps the progress of an animation from 0 to 1 to the eased progress.
+# They only use arithmetic, so they also work on whole arrays of progress values.
+
+def _ease_linear(t):
+    """
+    Constant speed
+    """
+    return t
+
+def _ease_in(t):
+    """
+    Starts slow and speeds up
+    """
+    return t * t
+
+def _ease_out(t):
+    """
+    Starts fast and slows down
+    """
+    return t * (2 - t)
+
+def _ease_in_out(t):
+    """
+    Starts and ends slow
+    """
+    return t * t * (3 - 2 * t)
+
+def _ease_in_cubic(t):
+    """
+    Starts slower than ease_in and speeds up harder
+    """
+    return t * t * t
+
+def _ease_out_cubic(t):
+    """
+    Starts faster than ease_out and slows down harder
     """
+    return 1 - (1 - t) * (1 - t) * (1 - t)
+
+def _ease_in_out_smooth(t):
+    """
+    Starts and ends slower than ease_in_out (smootherstep)
+    """
+    return t * t * t * (t * (6 * t - 15) + 10)
+
+def _ease_out_back(t):
+    """
+    Overshoots the end a little and settles back
+    """
+    return 1 + 2.70158 * (t - 1) ** 3 + 1.70158 * (t - 1) ** 2
+
+EASINGS = {
+    "linear": _ease_linear,
+    "ease_in": _ease_in,
+    "ease_out": _ease_out,
+    "ease_in_out": _ease_in_out,
+    "ease_in_cubic": _ease_in_cubic,
+    "ease_out_cubic": _ease_out_cubic,
+    "ease_in_out_smooth": _ease_in_out_smooth,
+    "ease_out_back": _ease_out_back,
+}
+
+def _get_progress(elapsed: float, duration: float, loop: bool) -> float:
+    """
+    Get how far an animation is, before easing
+    :param elapsed: Time the animation has been running in milliseconds
+    :param duration: Duration of the animation in milliseconds
+    :param loop: If True, the animation goes to the end and back again forever
+    :return: float between 0 (start) and 1 (end)
+    """
+    if not loop:
+        return min(elapsed / duration, 1)
+
+    # Looping animations go to the end and back again
+    phase = elapsed % (2 * duration) / duration
+    return phase if phase <= 1 else 2 - phase
+
+class Animation:
+    """
+    Movement between two positions, evaluated from the elapsed time.
+    Takes the same memory no matter its duration, and finishes on time even when frames are dropped.
+    """
+    __slots__ = (
+        "_start_position", "_end_position", "_duration", "_loop", "_style", "_ratio", "_easing", "_start_time",
+        "_paused_at"
+    )
+
     def __init__(self,
-                 position: tuple[int, int],
-                 src: str,
-                 width: int = 0,
-                 height: int = 0,
-                 scale:int = 1,
-                 centered: bool = False) -> None:
+                 start_position: tuple[int, int],
+                 end_position: tuple[int, int],
+                 duration: int,
+                 loop: bool = False,
+                 style: Literal["flow", "jump"] = "flow",
+                 ratio: float = 1,
+                 easing: str = "linear",
+                 start_time: float = None) -> None:
+        """
+        Create an animation
+        :param start_position: Where the animation starts (x, y coordinates)
+        :param end_position: Where the animation ends (x, y coordinates)
+        :param duration: Duration from start to end in milliseconds
+        :param loop: If True, the animation goes back and forth between the positions forever
+        :param style: "flow" moves smoothly between the positions, "jump" teleports between them
+        :param ratio: Only for "jump", float between 0 and 1. The lower the ratio, the less time is spent at start_position
+        :param easing: Name of the easing curve, only for "flow", one of the keys of EASINGS
+        :param start_time: Time the animation starts at in milliseconds, defaults to now
+        """
+        if easing not in EASINGS:
+            raise ValueError(f"Unknown easing: {easing}")
+
+        self._start_position = start_position
+        self._end_position = end_position
+        self._duration = max(duration, 1)
+        self._loop = loop
+        self._style = style
+        self._ratio = ratio
+        self._easing = easing
+        self._start_time = _get_ticks() if start_time is None else start_time
+        self._paused_at = None
+
+    """
+    Getters
+    """
+
+    def get_progress(self, now: float) -> float:
         """
-        Create an image element
-        :param position: Where the image will be positioned
-        :param src: Path to the image file
-        :param centered: If the image will be centered in the position
-        :param width: Width of the image, 0 indicates that the image will keep its original width
-        :param height: Height of the image, 0 indicates that the image will keep its original height
-        :param scale: Factor to scale the image by compared to the original size, applies when width and height are not set
+        Get how far between the start and end position the animation is, before easing
+        :param now: The current time in milliseconds
+        :return: float between 0 (start position) and 1 (end position)
         """
-        # Image attributes
-        self._image = pygame.image.load(src)
-        self._image_path = src
-        self._scale = scale
-        self._width = width
-        self._height = height
+        return _get_progress(self._get_elapsed(now), self._duration, self._loop)
 
-        if width and height:
-            self._image = pygame.transform.scale(self._image, (width, height)).convert_alpha()
-        else:
-            self._image = pygame.transform.scale(self._image, (self._image.get_width() * self._scale, self._image.get_height() * self._scale)).convert_alpha()
-            self._width = self._image.get_width()
-            self._height = self._image.get_height()
+    def get_position(self, now: float) -> tuple[float, float]:
+        """
+        Get the position of the animation at a time
+        :param now: The current time in milliseconds
+        :return: tuple[float, float] with the position
+        """
+        if self._style == "jump":
+            return self._get_jump_position(now)
 
-        super().__init__(position, self._image.get_width(), self._image.get_height(), centered=centered)
+        progress = EASINGS[self._easing](self.get_progress(now))
+        return (self._start_position[0] + (self._end_position[0] - self._start_position[0]) * progress,
+                self._start_position[1] + (self._end_position[1] - self._start_position[1]) * progress)
+
+    def is_finished(self, now: float) -> bool:
+        """
+        Get if the animation reached its end, looping animations never finish
+        :param now: The current time in milliseconds
+        :return: bool with the finished state
+        """
+        return not self._loop and self._get_elapsed(now) >= self._duration
 
     """
-    Setters
+    Basic methods
     """
 
-    def set_image(self, src: str) -> None:
+    def pause(self, now: float) -> None:
         """
-        Change the image displayed by the element
-        :param src: Path to the new image file
+        Pause the animation
+        :param now: The current time in milliseconds
         :return: None
         """
+        if self._paused_at is None:
+            self._paused_at = now
 
-        self._image = pygame.image.load(src)
-        self._image = pygame.transform.scale(self._image, (self._width, self._height)).convert_alpha()
-
-    def scale(self, scale: int) -> None:
+    def resume(self, now: float) -> None:
         """
-        Scale the image by a factor relative to original size
-        :param scale: Scale factor to apply to the image (1 = original size, 2 = double size, etc.)
+        Continue a paused animation from where it was paused
+        :param now: The current time in milliseconds
         :return: None
         """
-        self._scale = scale
-        self._image = pygame.transform.scale(self._load_original_image(), (self._image.get_width() * self._scale, self._image.get_height() * self._scale)).convert_alpha()
+        if self._paused_at is not None:
+            self._start_time += now - self._paused_at
+            self._paused_at = None
 
     """
-    Getters
+    Internal methods
     """
 
-    def get_image(self) -> pygame.Surface:
+    def _get_elapsed(self, now: float) -> float:
         """
-        Get the image of the element
-        :return: pygame.Surface with the image
+        Get the time the animation has been running
+        :param now: The current time in milliseconds
+        :return: float with the elapsed time in milliseconds
         """
-        return self._image
+        if self._paused_at is not None:
+            now = self._paused_at
 
-    def get_scale(self) -> int:
+        return max(now - self._start_time, 0)
+
+    def _get_jump_position(self, now: float) -> tuple[int, int]:
         """
-        Get the scale of the image
-        :return: int with the scale of the image
+        Get the position of a jump animation at a time
+        :param now: The current time in milliseconds
+        :return: tuple[int, int] with either the start or the end position
         """
-        return self._scale
+        start_share = 0.5 * self._ratio * self._duration
+        elapsed = self._get_elapsed(now)
 
+        if self._loop:
+            # The back and forth cycle is start, end, end, start
+            phase = elapsed % (2 * self._duration)
+            at_start = phase < start_share or phase >= 2 * self._duration - start_share
+        else:
+            at_start = elapsed < start_share and elapsed < self._duration
+
+        return self._start_position if at_start else self._end_position
+
+class Tween:
     """
-    Internal methods
+    Animation of a property value such as a color, a size or a progress amount, evaluated from the elapsed time.
+    The value is quantized and the setter is only called when the quantized value changes,
+    so elements only re-render when the change is actually visible.
     """
+    __slots__ = (
+        "_start_value", "_end_value", "_duration", "_setter", "_easing", "_loop", "_step", "_start_time",
+        "_last_value"
+    )
 
-    def _load_original_image(self) -> None:
-        """
-        Load the original image
-        :return: pygame.Surface with the original image
-        """
-        return pygame.image.load(self._image_path).convert_alpha()
+    def __init__(self,
+                 start_value: Union[float, tuple],
+                 end_value: Union[float, tuple],
+                 duration: int,
+                 setter: callable,
+                 easing: str = "linear",
+                 loop: bool = False,
+                 step: float = 1,
+                 start_time: float = None) -> None:
+        """
+        Create a tween
+        :param start_value: Value at the start, a number or a tuple of numbers such as a color
+        :param end_value: Value at the end, same type as start_value
+        :param duration: Duration from start to end in milliseconds
+        :param setter: Function called with the new value when the quantized value changes
+        :param easing: Name of the easing curve, one of the keys of EASINGS
+        :param loop: If True, the tween goes back and forth between the values forever
+        :param step: Values are rounded to multiples of the step, a step of 1 gives integers
+        :param start_time: Time the tween starts at in milliseconds, defaults to now
+        """
+        if easing not in EASINGS:
+            raise ValueError(f"Unknown easing: {easing}")
+
+        self._start_value = start_value
+        self._end_value = end_value
+        self._duration = max(duration, 1)
+        self._setter = setter
+        self._easing = easing
+        self._loop = loop
+        self._step = step
+        self._start_time = _get_ticks() if start_time is None else start_time
+        self._last_value = None
 
     """
-    Basic methods
+    Getters
     """
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def get_value(self, now: float) -> Union[float, tuple]:
         """
-        Draw the image in the surface
-        :param surface: Where the image will be drawn
-        :return: None
+        Get the quantized value at a time
+        :param now: The current time in milliseconds
+        :return: The value, a number or a tuple like the start value
         """
+        progress = EASINGS[self._easing](_get_progress(max(now - self._start_time, 0), self._duration, self._loop))
 
-        if not self._display:
-            return
+        if isinstance(self._start_value, (tuple, list)):
+            return tuple(self._quantize(start + (end - start) * progress)
+                         for start, end in zip(self._start_value, self._end_value))
 
-        surface.blit(self._image, self._rect)
+        return self._quantize(self._start_value + (self._end_value - self._start_value) * progress)
 
-    def update(self, events=None) -> None:
+    def is_finished(self, now: float) -> bool:
         """
-        Update the image element
-        :param events: Optional list of pygame events (not used in Image class but included for API consistency)
-        :return: None
+        Get if the tween reached its end value, looping tweens never finish
+        :param now: The current time in milliseconds
+        :return: bool with the finished state
         """
-        super().update()
+        return not self._loop and now - self._start_time >= self._duration
 
-class Input(Text):
     """
-    Textbox element that can be used to get user input, innherited from Text class.
+    Internal methods
     """
-    def __init__(self,
-                 position: tuple [int, int],
-                 width: int = 200,
-                 height: int = 50,
-                 cursor: bool = True,
-                 passive_text_color: tuple[int, int, int] = (150, 150, 150),
-                 active_text_color: tuple[int, int, int] = (255, 255, 255),
-                 passive_border_color: tuple[int, int, int] = (100, 100, 100),
-                 active_border_color: tuple[int, int, int] = (200, 200, 200),
-                 border_radius: int = 0,
-                 border_width: int = 2,
-                 font_size: int = 20,
-                 font_family: str = "Arial",
-                 hint: str = "",
-                 centered: bool = False) -> None:
+
+    def _quantize(self, value: float) -> float:
         """
-        Create an input element
-        :param position: Where the input will be positioned
-        :param width: Width of the input
-        :param height: Height of the input
-        :param cursor: Enable/disable cursor in the input element.
-        :param passive_text_color: Color of the text when the input is not active
-        :param active_text_color: Color of the text when the input is active
-        :param passive_border_color: Color of the border when the input is not active
-        :param active_border_color: Color of the border when the input is active
-        :param border_radius: Radius of the border
+        Round a value to a multiple of the step
+        :param value: The value to round
+        :return: The rounded value, an int when the step is 1
+        """
+        if self._step == 1:
+            return int(round(value))
+
+        return round(value / self._step) * self._step
+
+    """
+    Basic methods
+    """
+
+    def update(self, now: float = None) -> bool:
+        """
+        Advance the tween and call the setter if the quantized value changed
+        :param now: The current time in milliseconds, defaults to now
+        :return: True if the tween is finished
+        """
+        if now is None:
+            now = _get_ticks()
+
+        value = self.get_value(now)
+        if value != self._last_value:
+            self._last_value = value
+            self._setter(value)
+
+        return self.is_finished(now)
+
+class Style(namedtuple("Style", ("color", "hover_color", "click_color",
+                                 "text_color", "text_hover_color", "text_click_color",
+                                 "border_color", "border_width", "border_radius",
+                                 "font_size", "font_family"))):
+    """
+    Immutable set of colors, border and font used to draw a clickable element.
+    Elements reference their style instead of copying every parameter, and recently used equal styles are
+    the same object. Render caches are keyed on the style values, so they are shared by every element using it.
+    """
+    __slots__ = ()
+
+    # Recently used styles, so equal styles are shared, the least recently used are dropped first
+    _styles = OrderedDict()
+    _max_styles = 256
+
+    def __new__(cls,
+                color: tuple[int, int, int] = (255, 255, 255),
+                hover_color: tuple[int, int, int] = (200, 200, 200),
+                click_color: tuple[int, int, int] = (150, 150, 150),
+                text_color: tuple[int, int, int] = (100, 100, 100),
+                text_hover_color: tuple[int, int, int] = (0, 0, 0),
+                text_click_color: tuple[int, int, int] = (0, 0, 0),
+                border_color: tuple[int, int, int] = None,
+                border_width: int = 2,
+                border_radius: int = 10,
+                font_size: int = 20,
+                font_family: str = "Arial") -> "Style":
+        """
+        Create a style, or get the existing style with the same values
+        :param color: Background color
+        :param hover_color: Background color when hovered
+        :param click_color: Background color when clicked
+        :param text_color: Text color
+        :param text_hover_color: Text color when hovered
+        :param text_click_color: Text color when clicked
+        :param border_color: Color of the border, if None, the border will not be drawn
         :param border_width: Width of the border
+        :param border_radius: Radius of the corners
         :param font_size: Size of the font
         :param font_family: Font family of the text
-        :param hint: Hint of the input
+        :return: Style
+        """
+        style = super().__new__(cls,
+                                tuple(color), tuple(hover_color), tuple(click_color),
+                                tuple(text_color), tuple(text_hover_color), tuple(text_click_color),
+                                tuple(border_color) if border_color else None, border_width, border_radius,
+                                font_size, font_family)
+        styles = cls._styles
+        existing = styles.get(style)
+        if existing is not None:
+            styles.move_to_end(style)
+            return existing
+
+        # Tweens and per frame setters create a style per value, so the registry is bounded
+        styles[style] = style
+        if len(styles) > cls._max_styles:
+            styles.popitem(last=False)
+        return style
+
+    def replace(self, **changes) -> "Style":
+        """
+        Get a style with some values changed, the style itself is never modified
+        :param changes: The values to change, with the same names as the constructor parameters
+        :return: Style with the changes
+        """
+        return Style(**{**self._asdict(), **changes})
+
+class Theme(namedtuple("Theme", ("button", "dropdown", "dropdown_selected", "table"))):
+    """
+    Immutable set of styles for each kind of element.
+    Applying a theme only swaps the style each element references, elements sharing a style
+    also share its rendered surfaces, so each distinct style is rendered once.
+    """
+    __slots__ = ()
+
+    def __new__(cls,
+                button: Style = None,
+                dropdown: Style = None,
+                dropdown_selected: Style = None,
+                table: Style = None) -> "Theme":
+        """
+        Create a theme, the elements keep their default look for the styles that are not set
+        :param button: Style of buttons
+        :param dropdown: Style of the options of drop down menus
+        :param dropdown_selected: Style of the selected option button of drop down menus
+        :param table: Style of the table cells
+        :return: Theme
+        """
+        return super().__new__(cls,
+                               button or Style(),
+                               dropdown or Style(text_color=(0, 0, 0), border_radius=0),
+                               dropdown_selected or Style(color=(200, 200, 200), hover_color=(150, 150, 150), click_color=(100, 100, 100),
+                                                          text_color=(0, 0, 0), border_radius=0),
+                               table or Style(text_color=(0, 0, 0), border_color=(200, 200, 200), border_radius=0))
+
+    def apply(self, *elements: "Element") -> None:
+        """
+        Set the styles of the theme on elements, elements without a style are skipped
+        :param elements: The elements to style
+        :return: None
         """
+        for element in elements:
+            if isinstance(element, DropdownMenu):
+                element.set_style(self.dropdown, self.dropdown_selected)
+            elif isinstance(element, Table):
+                element.set_style(self.table)
+            elif isinstance(element, Button):
+                element.set_style(self.button)
 
-        super().__init__(position,
-                         content=hint,
-                         color=passive_text_color,
-                         font_size=font_size,
-                         font_family=font_family,
-                         width=width,
-                         height=height,
-                         centered=centered)
+class Element:
+    """
+    Basic element consisting of a customizable rectangle/square.
+    """
+    # Attributes are declared as slots so elements do not carry a __dict__ each
+    __slots__ = (
+        "__weakref__", "_rect", "_border_radius", "_border_color", "_border_width", "_color", "_alpha", "_display",
+        "_centered", "_is_being_animated", "_animation", "_animation_ticker", "_tweens", "_framerate",
+        "_alpha_surface", "_alpha_layer", "_clicked", "_dirty", "_last_drawn_rect", "_spatial_index"
+    )
 
-        # Initialize the pygame scrap module
-        # This module is used to copy and paste text from the clipboard
-        pygame.scrap.init()
-        pygame.scrap.set_mode(pygame.SCRAP_CLIPBOARD)
+    # Event types passed to update by a UIManager, None passes every event
+    _event_types = None
 
-        # Visual attributes
-        self._passive_text_color = passive_text_color
-        self._active_text_color = active_text_color
-        self._passive_border_color = passive_border_color
-        self._active_border_color = active_border_color
+    def __init__(self,
+                 position: tuple[int, int],
+                 width: int,
+                 height:int,
+                 color: tuple[int, int, int] = (255, 255, 255),
+                 border_radius: int = 0,
+                 border_color: tuple[int, int, int] = None,
+                 border_width: int = 2,
+                 centered: bool = False) -> None:
+        """
+        Create a basic element
+        :param position: Where the element will be positioned (x, y coordinates)
+        :param width: Width of the element rectangle in pixels
+        :param height: Height of the element rectangle in pixels
+        :param color: Color of the element as RGB tuple (r, g, b)
+        :param border_radius: Radius of the element corners in pixels
+        :param border_color: Color of the element border as RGB tuple (r, g, b), if None, the border will not be drawn
+        :param border_width: Width of the element border in pixels
+        :param centered: If True, the element will be centered at the provided position, otherwise the topleft will be at the position
+        """
+        # Basic attributes
+        self._rect = pygame.Rect(position, (width, height))
         self._border_radius = border_radius
-        self._border_width = border_width
+        self._border_color = border_color # If None, the border will not be drawn
+        self._border_width = border_width # Width of the border
+        self._color = color
+        self._alpha = 255
+        self._display = True
+        # Centered attribute, if True, the element will be centered in the position
+        self._centered = centered
+        if self._centered:
+            self._rect.center = position
 
-        # Text attributes
-        self._hint = hint
-        self._text = "" # User input text
+        # Movement attributes
+        self._is_being_animated = False
+        # The running movement animation, evaluated from the elapsed time every update
+        self._animation = None
+        # Ticker advancing the animation instead of update, None if the element animates itself
+        self._animation_ticker = None
 
-        # States
-        self.active = False
+        # Property tweens, keyed by the name of the property they animate
+        self._tweens = {}
 
-        # Filer
-        self._max_length = 0
-        self._filter = None
-        self._filter_mode_exclude = True
+        # Framerate, kept for compatibility, animations are time based
+        self._framerate = 60
 
-        # Keys that will be ignored from the input
-        self._exclude_keys = [pygame.KMOD_SHIFT, pygame.KMOD_CAPS, pygame.K_CAPSLOCK, pygame.K_LSHIFT, pygame.K_RSHIFT]
-        # Keys that will exit the input
-        self._exit_keys = [pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_TAB, pygame.K_ESCAPE]
+        # Copy of a surface with the element alpha applied, as (source surface, alpha, copy)
+        self._alpha_surface = None
+        # Transparent layer the translucent shapes are drawn on, reused while the size does not change
+        self._alpha_layer = None
 
-        # Cursor
-        self._cursor = cursor
-        self._cursor_index = 0
+        # Mouse buttons held down on the element, one bit per button
+        self._clicked = 0
+
+        # Dirty tracking, the rect reported the last time the dirty rects were collected
+        self._dirty = True
+        self._last_drawn_rect = None
+
+        # Spatial index of the container holding the element, kept up to date when the element moves
+        self._spatial_index = None
 
     """
     Setters
     """
 
-    def set_max_length(self, max_length: int) -> None:
+    def move(self, x: int, y: int) -> None:
         """
-        Set the maximum length of the input
-        :param max_length: int with the maximum length
+        Move the position of the elment by x, y value
+        (Note moving has no effect when animating)
+        :param x: int for movement in x direction
+        :param y: int for movement in y direction
         """
-        self._max_length = max_length
+        if self._centered:
+            self._rect.centerx += x
+            self._rect.centery += y
+        else:
+            self._rect.x += x
+            self._rect.y += y
 
-    def set_filter(self, filter: str, only_allow_filter: bool = False) -> None:
+        self._mark_dirty()
+        if self._spatial_index:
+            self._spatial_index.update(self)
+
+    def set_position(self, position: tuple[int, int]) -> None:
         """
-        Set the filter of the input
-        :param filter: str with the new filter
-        :param only_allow_filter: If true, the filter only allow the characters in the filter, if false, the filter will only allow characters not in the filter
+        Set the position of the element
+        :param position: tuple[int, int] with the new position
+        :return: None
         """
-        self._filter = filter
-        self._filter_mode_exclude = not only_allow_filter
+        if self._centered:
+            self._rect.center = position
+        else:
+            self._rect.topleft = position
 
-    def set_hint(self, hint: str) -> None:
+        self._mark_dirty()
+        if self._spatial_index:
+            self._spatial_index.update(self)
+
+    def set_framerate(self, framerate: int) -> None:
         """
-        Set the hint of the input
-        :param hint: str with the new hint
+        Set the framerate of the element
+        (Note animations are time based, so the framerate no longer affects them)
+        :param framerate: int with the new framerate
+        :return: None
         """
-        self._hint = hint
+        self._framerate = framerate
 
-    def set_value(self, value: str) -> None:
+    def set_display(self, display: bool) -> None:
         """
-        Set the text of the input
-        :param value: str with the new text
+        Set if the element will be displayed
+        :param display: bool with the new display value
+        :return: None
         """
-        self._text = value
-        self.set_content(self._text)
+        if display != self._display:
+            self._mark_dirty()
+            if self._spatial_index:
+                self._spatial_index.invalidate()
+
+        self._display = display
+
+    def set_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the color of the element
+        :param color: tuple[int, int, int] with the new color
+        :return: None
+        """
+        self._color = color
+        self._mark_dirty()
+
+    def set_alpha(self, alpha: int) -> None:
+        """
+        Set the opacity of the element
+        :param alpha: int from 0 (invisible) to 255 (opaque)
+        :return: None
+        """
+        alpha = max(0, min(int(alpha), 255))
+        if alpha == self._alpha:
+            return
+
+        self._alpha = alpha
+        self._mark_dirty()
+
+    def set_size(self, size: tuple[int, int]) -> None:
+        """
+        Set the size of the element, keeping its position
+        :param size: tuple[int, int] with the new width and height
+        :return: None
+        """
+        size = (int(size[0]), int(size[1]))
+        if size == self._rect.size:
+            return
+
+        self._mark_dirty()
+        position = self.get_position()
+        self._rect.size = size
+        self.set_position(position)
+
+    def set_border_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the border color of the element
+        :param color: tuple[int, int, int] with the new border color
+        :return: None
+        """
+        self._border_color = color
+        self._mark_dirty()
+
+    def set_border_radius(self, radius: int) -> None:
+        """
+        Set the border radius of the element
+        :param border_radius: int with the new border radius
+        :return: None
+        """
+        self._border_radius = radius
+        self._mark_dirty()
+
+    def set_border_width(self, width: int) -> None:
+        """
+        Set the border width of the element
+        :param border_width: int with the new border width
+        :return: None
+        """
+        self._border_width = width
+        self._mark_dirty()
+
+    def set_animate(self, state: bool) -> None:
+        """
+        Set if the element will move, be animated or not
+        Stopping pauses the animation, and it continues from the same point when started again
+        :param move: bool with the new move value
+        :return: None
+        """
+        if self._animation and state != self._is_being_animated:
+            if state:
+                self._animation.resume(_get_ticks())
+            else:
+                self._animation.pause(_get_ticks())
+
+        self._is_being_animated = state
+        if self._animation_ticker:
+            self._animation_ticker.refresh()
 
     """
     Getters
     """
 
-    def get_value(self) -> str:
+    def get_alpha(self) -> int:
         """
-        Get the text of the input
+        Get the opacity of the element
+        :return: int from 0 (invisible) to 255 (opaque)
         """
-        return self._text
+        return self._alpha
 
-    """
-    Internal methods
-    """
+    def get_size(self) -> tuple[int, int]:
+        """
+        Get the size of the element
+        :return: tuple[int, int] with the width and height
+        """
+        return self._rect.size
 
-    def _allow_key(self, key: str) -> bool:
+    def get_position(self) -> tuple[int, int]:
         """
-        Check if the key is allowed by the filter
-        :param key: str with the key to be checked
+        Get the position of the element
+        :return: tuple[int, int] with the position of the element
         """
-        if self._max_length and len(self._text) >= self._max_length:
-            return False
+        if self._centered:
+            return self._rect.center
 
-        if not self._filter:
-            return True
+        return self._rect.topleft
 
-        if self._filter_mode_exclude:
-            if key not in self._filter:
-                return True
-        else:
-            if key in self._filter:
-                return True
+    def get_display(self) -> bool:
+        """
+        Get if the element will be displayed
+        :return: bool with the display value
+        """
+        return self._display
+
+    def get_animation_state(self) -> bool:
+        """
+        Get if the element is being animated
+        :return: bool with the animation state
+        """
+        return self._is_being_animated
+
+    def is_dirty(self) -> bool:
+        """
+        Get if the element changed in a way that needs it to be drawn again
+        :return: bool with the dirty state
+        """
+        return self._dirty
+
+    def pop_dirty_rects(self) -> list[pygame.Rect]:
+        """
+        Get the screen areas that must be redrawn since the last call, and mark the element as clean.
+        When the element changed, this is the area it covered before and the area it covers now.
+        :return: list[pygame.Rect] with the dirty areas, empty if the element did not change
+        """
+        if not self._dirty:
+            return []
+
+        self._dirty = False
+        dirty_rects = []
+
+        if self._last_drawn_rect:
+            dirty_rects.append(self._last_drawn_rect)
+
+        self._last_drawn_rect = self._get_draw_rect() if self._display else None
+        if self._last_drawn_rect:
+            dirty_rects.append(self._last_drawn_rect)
+
+        return dirty_rects
+
+    """
+    Toggles
+    """
+
+    def toggle_display(self) -> None:
+        """
+        Toggle the display of the element
+        :return: None
+        """
+        self._display = not self._display
+        self._mark_dirty()
+        if self._spatial_index:
+            self._spatial_index.invalidate()
+
+    """
+    Movement methods
+    """
+    def flow(self,
+             start_position: tuple[int, int],
+             end_position: tuple[int, int],
+             time: int,
+             loop: bool = False,
+             easing: str = "linear") -> None:
+
+        """
+        Sets and starts smooth movement animation of the element between two positions.
+        :param start_position: Where the element will start to move from (x, y coordinates)
+        :param end_position: Where the element will move to (x, y coordinates)
+        :param time: Duration of movement in milliseconds
+        :param loop: If True, the element will continuously move back and forth between positions
+        :param easing: Name of the easing curve used for the movement, one of the keys of EASINGS
+        :return: None
+        """
+        self._animation = Animation(start_position, end_position, time, loop=loop, easing=easing)
+        self._is_being_animated = True
+        if self._animation_ticker:
+            self._animation_ticker.refresh()
+
+    def jump(self,
+             start_position: tuple[int, int],
+             end_position: tuple[int, int],
+             time: int,
+             loop: bool = False,
+             ratio: float = 1) -> None:
+
+        """
+        Sets and starts jumping animation of the element between two positions.
+        :param start_position: Where the element will start to jump from (x, y coordinates)
+        :param end_position: Where the element will jump to (x, y coordinates)
+        :param time: Duration between jumps in milliseconds
+        :param loop: If True, the element will continuously jump back and forth between positions
+        :param ratio: Float between 0 and 1. The lower the ratio, the less time the element will spend at start_position
+        :return: None
+        """
+        self._animation = Animation(start_position, end_position, time, loop=loop, style="jump", ratio=ratio)
+        self._is_being_animated = True
+        if self._animation_ticker:
+            self._animation_ticker.refresh()
+
+    def tween(self,
+              property: Literal["color", "alpha", "size", "border_radius", "progress"],
+              end_value: Union[float, tuple],
+              time: int,
+              easing: str = "linear",
+              loop: bool = False,
+              start_value: Union[float, tuple] = None) -> Tween:
+        """
+        Animate a property of the element from its current value to a new value
+        The element only re-renders when the rounded value of the property changes.
+        :param property: The property to animate, "progress" is only available on progress bars
+        :param end_value: The value at the end of the animation
+        :param time: Duration of the animation in milliseconds
+        :param easing: Name of the easing curve, one of the keys of EASINGS
+        :param loop: If True, the property goes back and forth between the values forever
+        :param start_value: The value at the start of the animation, defaults to the current value
+        :return: The Tween, replacing any running tween of the same property
+        """
+        properties = self._get_tween_properties()
+        if property not in properties:
+            raise ValueError(f"Property {property} can not be animated on {type(self).__name__}")
+
+        getter, setter, step = properties[property]
+        if start_value is None:
+            start_value = getter()
+
+        self._tweens[property] = Tween(start_value, end_value, time, setter, easing=easing, loop=loop, step=step)
+        return self._tweens[property]
+
+    def stop_tween(self, property: str = None) -> None:
+        """
+        Stop animating a property, the property keeps its current value
+        :param property: The property to stop, all tweens are stopped if None
+        :return: None
+        """
+        if property is None:
+            self._tweens.clear()
+        else:
+            self._tweens.pop(property, None)
+
+    """
+    Internal methods
+    """
+
+    def _mark_dirty(self) -> None:
+        """
+        Mark the element as changed so its old and new areas are redrawn
+        :return: None
+        """
+        self._dirty = True
+
+    def _get_draw_rect(self) -> pygame.Rect:
+        """
+        Get the screen area covered when the element is drawn
+        :return: pygame.Rect with the area
+        """
+        return self._rect.copy()
+
+    def _get_tween_properties(self) -> dict:
+        """
+        Get the properties that can be animated with tween
+        :return: dict with the property name as key and a tuple of (getter, setter, rounding step) as value
+        """
+        return {
+            "color": (lambda: self._color, self.set_color, 1),
+            "alpha": (self.get_alpha, self.set_alpha, 1),
+            "size": (self.get_size, self.set_size, 1),
+            "border_radius": (lambda: self._border_radius, self.set_border_radius, 1),
+        }
+
+    def _update_tweens(self) -> None:
+        """
+        Advance the property tweens and remove the finished ones
+        :return: None
+        """
+        if not self._tweens:
+            return
+
+        now = _get_ticks()
+        for property, tween in list(self._tweens.items()):
+            if tween.update(now):
+                del self._tweens[property]
+
+    def _apply_alpha(self, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Get a surface with the element alpha applied, the copy is reused until the surface or alpha changes
+        :param surface: pygame.Surface to make translucent, it is never modified since it may be shared
+        :return: pygame.Surface to blit
+        """
+        if self._alpha == 255:
+            return surface
+
+        cached = self._alpha_surface
+        if cached is None or cached[0] is not surface or cached[1] != self._alpha:
+            translucent = surface.copy()
+            _counters["surface_allocations"] += 1
+            translucent.set_alpha(self._alpha)
+            self._alpha_surface = cached = (surface, self._alpha, translucent)
+
+        return cached[2]
+
+    def _draw_with_alpha(self, surface: pygame.Surface, draw) -> None:
+        """
+        Call a drawing method with the element alpha applied
+        Shapes can not be drawn translucent directly, so below 255 they are drawn on a cached layer first
+        :param surface: pygame.Surface to draw on
+        :param draw: Method taking the surface and the rect to draw in, like _draw_shape
+        :return: None
+        """
+        if self._alpha == 255:
+            draw(surface, self._rect)
+            return
+
+        layer = self._alpha_layer
+        if layer is None or layer.get_size() != self._rect.size:
+            layer = pygame.Surface(self._rect.size, pygame.SRCALPHA)
+            _counters["surface_allocations"] += 1
+            self._alpha_layer = layer
+        else:
+            layer.fill((0, 0, 0, 0))
+
+        draw(layer, layer.get_rect())
+        layer.set_alpha(self._alpha)
+        surface.blit(layer, self._rect)
+
+    def _draw_shape(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """
+        Draw the rectangle and border of the element
+        :param surface: pygame.Surface to draw on
+        :param rect: pygame.Rect where the element is drawn on the surface
+        :return: None
+        """
+        pygame.draw.rect(surface, self._color, rect, border_radius = self._border_radius)
+
+        if self._border_color:
+            pygame.draw.rect(surface, self._border_color, rect, width=self._border_width, border_radius=self._border_radius)
+
+    def _set_spatial_index(self, spatial_index: "SpatialGrid") -> None:
+        """
+        Set the spatial index of the UIManager the element belongs to, the element keeps it up to date when it moves
+        :param spatial_index: SpatialGrid the element is stored in, None when it is removed from the manager
+        :return: None
+        """
+        self._spatial_index = spatial_index
+
+    def _update_movement(self) -> None:
+        """
+        Update the movement of the element
+        :return: None
+        """
+        if not self._is_being_animated or not self._animation or self._animation_ticker:
+            return
+
+        now = _get_ticks()
+        self.set_position(self._animation.get_position(now))
+
+        if self._animation.is_finished(now):
+            self._is_being_animated = False
+
+    """
+    Mouse and clicking methods
+    """
+
+    def is_hovered(self) -> bool:
+        """
+        Check if the mouse is hovering over the element
+        :return: True if the mouse is hovering, False otherwise
+        """
+        mouse_pos = mouse_state.get_pos()
+        if self._spatial_index is not None:
+            # Only the top-most element of a UIManager is hovered, found once per frame in its spatial index
+            return self._spatial_index.query_hovered(mouse_pos) is self
+
+        return self._rect.collidepoint(mouse_pos)
+
+    def is_clicked(self, button: int = 0) -> bool:
+        """
+        Check if the element is hovered and the mouse button is down
+        :param button: The mouse button to check (0=left, 1=middle, 2=right)
+        :return: True if the button is clicked, False otherwise
+        """
+        return self.is_hovered() and mouse_state.get_pressed()[button]
+
+    def was_clicked(self, button: int = 0) -> bool:
+        """
+        Check if the element was clicked and then released
+        :param button: The mouse button to check (0=left, 1=middle, 2=right)
+        :return: True if the button was clicked and released, False otherwise
+        """
+        mask = 1 << button
+        if self.is_clicked(button):
+            if not self._clicked & mask:
+                self._clicked |= mask
+                self._mark_dirty()
+            return False
+
+        if self._clicked & mask:
+            self._clicked &= ~mask
+            self._mark_dirty()
+            return True
+
+        return False
+
+    """
+    Basic methods
+    """
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Draw the element in the surface
+        :param surface: pygame.Surface where the element will be drawn
+        :return: None
+        """
+        if not self._display:
+            return
+
+        self._draw_with_alpha(surface, self._draw_shape)
+
+    def update(self, events=None) -> None:
+        """
+        Update the element's state, movement, and animations
+        :param events: Optional list of pygame events (not used in base Element class but included for API consistency)
+        :return: None
+        """
+        self._update_movement()
+        self._update_tweens()
+
+class Text(Element):
+    """
+    Used to display backgroundless text in the screen, innherited from Element class.
+    """
+    __slots__ = ("_content", "_font_size", "_font_family", "_anti_aliasing", "_text_surface")
+
+    # Event types passed to update by a UIManager
+    _event_types = ()
+
+    def __init__(self,
+                 position: tuple[int, int],
+                 content: str,
+                 color: tuple[int, int, int] = (255, 255, 255),
+                 font_size: int = 20,
+                 font_family: str = "Arial",
+                 width: int = 0,
+                 height: int = 0,
+                 anti_aliasing: bool = True,
+                 centered: bool = False) -> None:
+        """
+        Create a text element
+        :param position: Where the text will be positioned
+        :param content: The text displayed
+        :param color: The text color
+        :param font_size: The size of the font
+        :param font_family: What font family the text will use
+        :param width: Width of the text element, 0 indicates that the width will be the width of the text.
+        :param height: Height of the text element, 0 indicates that the height will be the width of the text.
+        :param anti_aliasing: If the text will be anti aliased
+        :param centered: If the text will be centered in the position
+        """
+        # Text attributes
+        self._content = content
+        self._font_size = font_size
+        self._font_family = font_family
+        self._anti_aliasing = anti_aliasing
+
+        # Get the dimensions of the text
+        if width and height:
+            text_dimensions = (width, height)
+        else:
+            text_dimensions = self._get_text_rect_dimensions()
+
+        super().__init__(position, width=text_dimensions[0], height=text_dimensions[1], color=color, centered=centered)
+
+        # Render text
+        self._text_surface = self._render_text()
+
+    """
+    Setters
+    """
+
+    def set_content(self, content: str) -> None:
+        """
+        Change the text of the element
+        :param content: Content to be displayed. Will be converted to string if not already a string.
+        :return: None
+        """
+        content = str(content)
+        if content == self._content:
+            return
+
+        self._content = content
+        self._text_surface = self._render_text()
+        self._mark_dirty()
+
+    def set_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Change the color of the text
+        :param color: tuple[int, int, int] with the new color
+        :return: None
+        """
+        if color == self._color:
+            return
+
+        self._color = color
+        self._text_surface = self._render_text() # Update the text surface with the new color
+        self._mark_dirty()
+
+    def set_font_size(self, font_size: int) -> None:
+        """
+        Change the size of the font
+        :param font_size: int with the new size
+        :return: None
+        """
+        if font_size == self._font_size:
+            return
+
+        self._font_size = font_size
+        self._text_surface = self._render_text()
+        self._mark_dirty()
+
+    def set_font_family(self, font_family: str) -> None:
+        """
+        Change the font family of the text
+        :param font_family: str with the new font family
+        :return: None
+        """
+        if font_family == self._font_family:
+            return
+
+        self._font_family = font_family
+        self._text_surface = self._render_text()
+        self._mark_dirty()
+
+    """
+    Getters
+    """
+
+    """
+    Getters
+    """
+
+    def get_content(self) -> str:
+        """
+        Get the content of the text
+        :return: str with the content of the text
+        """
+        return self._content
+
+    """
+    Internal methods
+    """
+
+    def _get_text_rect_dimensions(self) -> tuple[int, int]:
+        """
+        Get the dimensions of the text, width and height
+        :return: tuple[int, int] with the width and height of the text
+        """
+        return self._get_font().size(str(self._content))
+
+    def _render_text(self, color: tuple[int, int, int] = None) -> pygame.Surface:
+        """
+        Render the text
+        :param color: Color to render the text with, the text color is used if None
+        :return: pygame.Surface with the rendered text
+        """
+        if color is None:
+            color = self._color
+
+        text_surface = text_surface_cache.render(str(self._content), self._get_font_key(), color, self._anti_aliasing)
+        return text_surface
+
+    def _get_font_key(self) -> tuple[str, int, bool, bool]:
+        """
+        Get the key of the font used by the text in the shared caches
+        :return: tuple with the font family, size, bold and italic flags
+        """
+        return self._font_family, self._font_size, False, False
+
+    def _get_font(self) -> pygame.font.Font:
+        """
+        Get the font used by the text from the shared font cache
+        :return: pygame.font.Font with the current font family and size
+        """
+        return font_cache.get_font(*self._get_font_key())
+
+    def _get_text_rect(self) -> pygame.Rect:
+        """
+        Get the screen area the rendered text is drawn in
+        :return: pygame.Rect with the area
+        """
+        rect = self._text_surface.get_rect()
+        if self._centered:
+            rect.center = self._rect.center
+        else:
+            rect.topleft = self._rect.topleft
+
+        return rect
+
+    def _get_draw_rect(self) -> pygame.Rect:
+        """
+        Get the screen area covered when the text is drawn
+        :return: pygame.Rect with the area
+        """
+        return self._rect.union(self._get_text_rect())
+
+    """
+    Basic methods
+    """
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Draw the text in the surface
+        :param surface: pygame.Surface where the text will be drawn
+        :return: None
+        """
+
+        if not self._display:
+            return
+
+        surface.blit(self._apply_alpha(self._text_surface), self._get_text_rect())
+
+class Image(Element):
+    """
+    Image element for displaying images in the screen, innherited from Element class.
+    """
+    __slots__ = (
+        "_image_path", "_scale", "_width", "_height", "_atlas", "_scale_filter", "_async_load", "_placeholder",
+        "_loaded", "_load_error", "_image"
+    )
+
+    # Event types passed to update by a UIManager
+    _event_types = ()
+
+    # Size of a color placeholder when the image has no width and height
+    _placeholder_size = (64, 64)
+
+    def __init__(self,
+                 position: tuple[int, int],
+                 src: str,
+                 width: int = 0,
+                 height: int = 0,
+                 scale:int = 1,
+                 centered: bool = False,
+                 async_load: bool = False,
+                 placeholder: Union[pygame.Surface, tuple[int, int, int]] = None,
+                 atlas: TextureAtlas = None,
+                 scale_filter: Literal["scale", "smoothscale"] = "scale") -> None:
+        """
+        Create an image element
+        :param position: Where the image will be positioned
+        :param src: Path to the image file, or name of the region if an atlas is used
+        :param centered: If the image will be centered in the position
+        :param width: Width of the image, 0 indicates that the image will keep its original width
+        :param height: Height of the image, 0 indicates that the image will keep its original height
+        :param scale: Factor to scale the image by compared to the original size, applies when width and height are not set
+        :param async_load: If the image will be decoded in the background, the placeholder is drawn until it is ready
+        :param placeholder: Surface or color drawn while the image is loading, nothing is drawn if not set,
+            a color fills the width and height of the image, or 64x64 pixels if they are not set
+        :param atlas: Optional TextureAtlas the image is taken from, src is then the name of the region
+        :param scale_filter: "scale" for fast scaling, "smoothscale" for filtered scaling that looks better when shrinking
+        """
+        # Image attributes
+        self._image_path = src
+        self._scale = scale
+        self._width = width
+        self._height = height
+        self._atlas = atlas
+        self._scale_filter = scale_filter
+
+        # Asynchronous loading
+        self._async_load = async_load
+        self._placeholder = placeholder
+        self._loaded = not async_load or atlas is not None or asset_manager.is_loaded(src)
+        # Error raised when the image failed to load in the background, the placeholder stays drawn
+        self._load_error = None
+
+        if self._loaded:
+            self._image = self._get_scaled_image(src)
+        else:
+            self._image = self._get_placeholder_surface()
+
+        super().__init__(position, self._image.get_width(), self._image.get_height(), centered=centered)
+
+        if not self._loaded:
+            asset_manager.load_async(src, self._on_image_loaded, self._on_image_failed)
+
+    """
+    Setters
+    """
+
+    def set_image(self, src: str) -> None:
+        """
+        Change the image displayed by the element
+        :param src: Path to the new image file, or name of the region if an atlas is used
+        :return: None
+        """
+
+        self._image_path = src
+
+        # The current image is kept until the new one is decoded
+        self._load_error = None
+        if self._async_load and self._atlas is None and not asset_manager.is_loaded(src):
+            asset_manager.load_async(src, self._on_image_loaded, self._on_image_failed)
+            return
+
+        self._loaded = True
+        self._image = self._get_scaled_image(src)
+        self._mark_dirty()
+
+    def scale(self, scale: int) -> None:
+        """
+        Scale the image by a factor relative to original size
+        :param scale: Scale factor to apply to the image (1 = original size, 2 = double size, etc.)
+        :return: None
+        """
+        self._scale = scale
+        # Applied when the image is loaded
+        if not self._loaded:
+            return
+
+        self._image = self._get_source_image(self._image_path, (self._image.get_width() * self._scale, self._image.get_height() * self._scale))
+        self._mark_dirty()
+
+    def set_scale_filter(self, scale_filter: Literal["scale", "smoothscale"]) -> None:
+        """
+        Set how the image is scaled
+        :param scale_filter: "scale" for fast scaling, "smoothscale" for filtered scaling
+        :return: None
+        """
+        if scale_filter == self._scale_filter:
+            return
+
+        self._scale_filter = scale_filter
+        if self._loaded:
+            self._image = self._get_source_image(self._image_path, self._image.get_size())
+            self._mark_dirty()
+
+    def set_size(self, size: tuple[int, int]) -> None:
+        """
+        Set the size of the image, the original image is scaled to the new size
+        :param size: tuple[int, int] with the new width and height
+        :return: None
+        """
+        size = (int(size[0]), int(size[1]))
+        if size == self._rect.size:
+            return
+
+        super().set_size(size)
+        self._width, self._height = size
+        if self._loaded:
+            self._image = self._get_source_image(self._image_path, size)
+        else:
+            self._image = self._get_placeholder_surface()
+
+    """
+    Getters
+    """
+
+    def get_image(self) -> pygame.Surface:
+        """
+        Get the image of the element
+        :return: pygame.Surface with the image
+        """
+        return self._image
+
+    def get_scale(self) -> int:
+        """
+        Get the scale of the image
+        :return: int with the scale of the image
+        """
+        return self._scale
+
+    def get_scale_filter(self) -> str:
+        """
+        Get how the image is scaled
+        :return: str, "scale" or "smoothscale"
+        """
+        return self._scale_filter
+
+    def is_loaded(self) -> bool:
+        """
+        Check if the image is loaded, asynchronously loaded images show their placeholder until then
+        :return: bool, True if the image is loaded
+        """
+        return self._loaded
+
+    def get_load_error(self) -> Exception:
+        """
+        Get the error raised when the image failed to load in the background
+        :return: Exception raised by the decoding, None if the image did not fail
+        """
+        return self._load_error
+
+    """
+    Internal methods
+    """
+
+    def _get_tween_properties(self) -> dict:
+        """
+        Get the properties that can be animated with tween, the image is drawn without a color or rounded corners
+        :return: dict with the property name as key and a tuple of (getter, setter, rounding step) as value
+        """
+        properties = super()._get_tween_properties()
+        del properties["color"]
+        del properties["border_radius"]
+        return properties
+
+    def _get_scaled_image(self, src: str) -> pygame.Surface:
+        """
+        Get the image scaled to the size of the element, or by the scale factor if no size is set
+        :param src: Path to the image file
+        :return: pygame.Surface with the scaled image
+        """
+        if self._width and self._height:
+            return self._get_source_image(src, (self._width, self._height))
+
+        original = self._get_source_image(src)
+        image = self._get_source_image(src, (original.get_width() * self._scale, original.get_height() * self._scale))
+        self._width, self._height = image.get_size()
+        return image
+
+    def _get_source_image(self, src: str, size: tuple[int, int] = None) -> pygame.Surface:
+        """
+        Get an image from the atlas if one is used, or from the asset manager
+        :param src: Path to the image file, or name of the region if an atlas is used
+        :param size: Optional tuple[int, int] with the size to scale the image to
+        :return: pygame.Surface with the image
+        """
+        if self._atlas is None:
+            if size is None:
+                return asset_manager.get_image(src)
+            return asset_manager.get_scaled(src, size, self._scale_filter)
+
+        region = self._atlas.get_region(src)
+        if size is None:
+            return region
+        return asset_manager.get_scaled_surface((self._atlas, src), region, size, self._scale_filter)
+
+    def _get_placeholder_surface(self) -> pygame.Surface:
+        """
+        Get the surface drawn while the image is loading, sized to the element if a size is set
+        :return: pygame.Surface with the placeholder
+        """
+        size = (self._width, self._height) if self._width and self._height else None
+
+        if isinstance(self._placeholder, pygame.Surface):
+            if size and self._placeholder.get_size() != size:
+                _counters["surface_allocations"] += 1
+                return pygame.transform.scale(self._placeholder, size)
+            return self._placeholder
+
+        if self._placeholder:
+            # A color has no size of its own, so it fills the size set on the image or a default size
+            surface = pygame.Surface((self._width or self._placeholder_size[0], self._height or self._placeholder_size[1]), pygame.SRCALPHA)
+            surface.fill(self._placeholder)
+        else:
+            surface = pygame.Surface(size or (0, 0), pygame.SRCALPHA)
+        _counters["surface_allocations"] += 1
+        return surface
+
+    def _on_image_loaded(self, path: str) -> None:
+        """
+        Swap the placeholder for the image once the asset manager has decoded it
+        :param path: Path of the decoded image
+        :return: None
+        """
+        # The image was changed while this one was loading
+        if path != self._image_path:
+            return
+
+        self._loaded = True
+        self._image = self._get_scaled_image(path)
+        super().set_size(self._image.get_size())
+        self._mark_dirty()
+
+    def _on_image_failed(self, path: str, error: Exception) -> None:
+        """
+        Keep the placeholder when the asset manager could not decode the image
+        :param path: Path of the image that failed
+        :param error: Exception raised by the decoding
+        :return: None
+        """
+        # The image was changed while this one was loading
+        if path != self._image_path:
+            return
+
+        self._load_error = error
+
+    def _load_original_image(self) -> None:
+        """
+        Get the original image from the atlas or the asset manager, which only reads it from disk once
+        :return: pygame.Surface with the original image
+        """
+        return self._get_source_image(self._image_path)
+
+    """
+    Basic methods
+    """
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Draw the image in the surface
+        :param surface: Where the image will be drawn
+        :return: None
+        """
+
+        if not self._display:
+            return
+
+        surface.blit(self._apply_alpha(self._image), self._rect)
+
+    def _get_draw_rect(self) -> pygame.Rect:
+        """
+        Get the screen area covered when the image is drawn
+        :return: pygame.Rect with the area
+        """
+        return pygame.Rect(self._rect.topleft, self._image.get_size())
+
+    def update(self, events=None) -> None:
+        """
+        Update the image element
+        :param events: Optional list of pygame events (not used in Image class but included for API consistency)
+        :return: None
+        """
+        super().update()
+
+class Input(Text):
+    """
+    Textbox element that can be used to get user input, innherited from Text class.
+    """
+    __slots__ = (
+        "_passive_text_color", "_active_text_color", "_passive_border_color", "_active_border_color", "_hint",
+        "_text", "active", "_max_length", "_filter", "_filter_mode_exclude", "_exclude_keys", "_exit_keys", "_cursor",
+        "_cursor_index", "_prefix_widths", "_prefix_widths_key", "_cursor_surface", "_cursor_surface_key",
+        "_cursor_offset", "_cursor_offset_key", "_cursor_blink_interval", "_cursor_blink_start", "_cursor_shown"
+    )
+
+    # Event types passed to update by a UIManager
+    _event_types = (pygame.KEYDOWN,)
+
+    def __init__(self,
+                 position: tuple [int, int],
+                 width: int = 200,
+                 height: int = 50,
+                 cursor: bool = True,
+                 cursor_blink_interval: int = 0,
+                 passive_text_color: tuple[int, int, int] = (150, 150, 150),
+                 active_text_color: tuple[int, int, int] = (255, 255, 255),
+                 passive_border_color: tuple[int, int, int] = (100, 100, 100),
+                 active_border_color: tuple[int, int, int] = (200, 200, 200),
+                 border_radius: int = 0,
+                 border_width: int = 2,
+                 font_size: int = 20,
+                 font_family: str = "Arial",
+                 hint: str = "",
+                 centered: bool = False) -> None:
+        """
+        Create an input element
+        :param position: Where the input will be positioned
+        :param width: Width of the input
+        :param height: Height of the input
+        :param cursor: Enable/disable cursor in the input element.
+        :param cursor_blink_interval: Time in milliseconds the cursor is shown and hidden when blinking, 0 disables blinking
+        :param passive_text_color: Color of the text when the input is not active
+        :param active_text_color: Color of the text when the input is active
+        :param passive_border_color: Color of the border when the input is not active
+        :param active_border_color: Color of the border when the input is active
+        :param border_radius: Radius of the border
+        :param border_width: Width of the border
+        :param font_size: Size of the font
+        :param font_family: Font family of the text
+        :param hint: Hint of the input
+        """
+
+        super().__init__(position,
+                         content=hint,
+                         color=passive_text_color,
+                         font_size=font_size,
+                         font_family=font_family,
+                         width=width,
+                         height=height,
+                         centered=centered)
+
+        # Visual attributes
+        self._passive_text_color = passive_text_color
+        self._active_text_color = active_text_color
+        self._passive_border_color = passive_border_color
+        self._active_border_color = active_border_color
+        self._border_radius = border_radius
+        self._border_width = border_width
+
+        # Text attributes
+        self._hint = hint
+        self._text = "" # User input text
+
+        # States
+        self.active = False
+
+        # Filer
+        self._max_length = 0
+        self._filter = None
+        self._filter_mode_exclude = True
+
+        # Keys that will be ignored from the input
+        self._exclude_keys = [pygame.KMOD_SHIFT, pygame.KMOD_CAPS, pygame.K_CAPSLOCK, pygame.K_LSHIFT, pygame.K_RSHIFT]
+        # Keys that will exit the input
+        self._exit_keys = [pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_TAB, pygame.K_ESCAPE]
+
+        # Cursor
+        self._cursor = cursor
+        self._cursor_index = 0
+
+        # Width of every prefix of the text, used to place the cursor
+        self._prefix_widths = [0]
+        self._prefix_widths_key = None
+
+        # Cached cursor surface and its offset from the input topleft, rebuilt when their inputs change
+        self._cursor_surface = None
+        self._cursor_surface_key = None
+        self._cursor_offset = (0, 0)
+        self._cursor_offset_key = None
+
+        # Blinking
+        self._cursor_blink_interval = cursor_blink_interval
+        self._cursor_blink_start = 0
+        self._cursor_shown = True
+
+    """
+    Setters
+    """
+
+    def set_max_length(self, max_length: int) -> None:
+        """
+        Set the maximum length of the input
+        :param max_length: int with the maximum length
+        """
+        self._max_length = max_length
+
+    def set_filter(self, filter: str, only_allow_filter: bool = False) -> None:
+        """
+        Set the filter of the input
+        :param filter: str with the new filter
+        :param only_allow_filter: If true, the filter only allow the characters in the filter, if false, the filter will only allow characters not in the filter
+        """
+        self._filter = filter
+        self._filter_mode_exclude = not only_allow_filter
+
+    def set_cursor_blink_interval(self, interval: int) -> None:
+        """
+        Set how fast the cursor blinks
+        :param interval: int with the time in milliseconds the cursor is shown and hidden, 0 disables blinking
+        """
+        self._cursor_blink_interval = interval
+
+    def set_hint(self, hint: str) -> None:
+        """
+        Set the hint of the input
+        :param hint: str with the new hint
+        """
+        self._hint = hint
+
+    def set_value(self, value: str) -> None:
+        """
+        Set the text of the input
+        :param value: str with the new text
+        """
+        self._text = value
+        self.set_content(self._text)
+
+    """
+    Getters
+    """
+
+    def get_value(self) -> str:
+        """
+        Get the text of the input
+        """
+        return self._text
+
+    """
+    Internal methods
+    """
+
+    def _allow_key(self, key: str) -> bool:
+        """
+        Check if the key is allowed by the filter
+        :param key: str with the key to be checked
+        """
+        if self._max_length and len(self._text) >= self._max_length:
+            return False
+
+        if not self._filter:
+            return True
+
+        if self._filter_mode_exclude:
+            if key not in self._filter:
+                return True
+        else:
+            if key in self._filter:
+                return True
+
+        return False
+
+    def _handle_keys(self, events: list) -> None:
+        """
+        Handle the typing of the input
+        :param events: List of pygame events to process for keyboard input
+        :return: None
+        """
+        for event in events:
+            if event.type != pygame.KEYDOWN: # We only want to handle key down events
+                continue
+            # Handle copy/paste
+            if event.key in (pygame.K_v, pygame.K_c, pygame.K_x) and event.mod & pygame.KMOD_CTRL:
+                _init_clipboard()
+
+            if event.key == pygame.K_v and event.mod & pygame.KMOD_CTRL:
+                # Nothing is returned when the clipboard is empty
+                pasted_text = (pygame.scrap.get("text/plain;charset=utf-8") or b"").decode()
+                # Remove all non-printable characters
+                pasted_text = re.sub(r'[^\x20-\x7E]+', '', pasted_text)
+
+                for char in pasted_text:
+                    if not self._allow_key(char):
+                        pasted_text = pasted_text.replace(char, "")
+
+                if self._max_length and len(pasted_text) + len(self._text) > self._max_length:
+                    pasted_text = pasted_text[:self._max_length - len(self._text)]
+
+                self._text = self._text[:self._cursor_index] + pasted_text + self._text[self._cursor_index:]
+                self._cursor_index += len(pasted_text)
+                continue
+            elif event.key == pygame.K_c and event.mod & pygame.KMOD_CTRL:
+                pygame.scrap.put(pygame.SCRAP_TEXT, self._text.encode('utf-8'))
+                continue
+            elif event.key == pygame.K_x and event.mod & pygame.KMOD_CTRL:
+                pygame.scrap.put(pygame.SCRAP_TEXT, self._text.encode('utf-8'))
+                self._text = ""
+                self._cursor_index = 0
+                continue
+            elif event.key in self._exit_keys: # Check if the key should exit the input
+                self.active = False
+            elif event.key in self._exclude_keys: # Check the key should be ignored
+                continue
+            # Cursor
+            elif event.key == pygame.K_RIGHT:
+                if not self._cursor:
+                    continue
+                if self._cursor_index >= len(self._text):
+                    continue
+                self._cursor_index += 1
+            elif event.key == pygame.K_LEFT:
+                if not self._cursor:
+                    continue
+                if self._cursor_index <= 0:
+                    continue
+                self._cursor_index -= 1
+            # Backspace and delete
+            elif event.key == pygame.K_BACKSPACE:
+                if self._cursor_index == 0:
+                    continue
+
+                self._text = self._text[:self._cursor_index-1] + self._text[self._cursor_index:]
+                self._cursor_index -= 1
+            elif event.key == pygame.K_DELETE:
+                if self._cursor_index == len(self._text):
+                    continue
+
+                self._text = self._text[:self._cursor_index] + self._text[self._cursor_index+1:]
+            # Normal keys
+            else:
+                if not self._allow_key(event.unicode):
+                    continue
+
+                self._text = self._text[:self._cursor_index] + event.unicode + self._text[self._cursor_index:]
+                self._cursor_index += 1
+
+        self.set_content(self._text)
+
+    def _get_prefix_widths(self) -> list[int]:
+        """
+        Get the rendered width of every prefix of the input text, element i is the width of the first i characters.
+        The widths are cached and only measured again when the text or the font changed.
+        :return: list[int] with len(text) + 1 widths
+        """
+        key = (self._text, self._get_font_key())
+        if self._prefix_widths_key != key:
+            font = self._get_font()
+            self._prefix_widths = [font.size(self._text[:i])[0] for i in range(len(self._text) + 1)]
+            self._prefix_widths_key = key
+
+        return self._prefix_widths
+
+    def _get_text_x(self) -> int:
+        """
+        Get the x coordinate where the input text starts on the screen
+        :return: int with the x coordinate
+        """
+        if self._centered:
+            return self._rect.centerx - self._get_prefix_widths()[-1] // 2
+
+        return self._rect.x
+
+    def _get_cursor_surface(self) -> pygame.Surface:
+        """
+        Get the rendered cursor, only rendered again when the font or the active text color changed
+        :return: pygame.Surface with the cursor
+        """
+        key = (self._get_font_key(), self._active_text_color)
+        if self._cursor_surface_key != key:
+            self._cursor_surface = text_surface_cache.render("|", key[0], self._active_text_color)
+            self._cursor_surface_key = key
+
+        return self._cursor_surface
+
+    def _get_cursor_offset(self) -> tuple[int, int]:
+        """
+        Get the position of the cursor relative to the input topleft,
+        only computed again when the text, the cursor index, the font or the input size changed
+        :return: tuple[int, int] with the offset
+        """
+        key = (self._text, self._cursor_index, self._get_font_key(), self._rect.size)
+        if self._cursor_offset_key != key:
+            prefix_widths = self._get_prefix_widths()
+            offset_x = self._get_text_x() - self._rect.x + prefix_widths[min(self._cursor_index, len(prefix_widths) - 1)] - 2
+            offset_y = self._rect.height//4 if self._centered else 0
+
+            self._cursor_offset = (offset_x, offset_y)
+            self._cursor_offset_key = key
+            # Show the cursor right away after it moved
+            self._cursor_blink_start = _get_ticks()
+
+        return self._cursor_offset
+
+    def _is_cursor_shown(self) -> bool:
+        """
+        Get if the cursor is in the visible part of its blink
+        :return: bool, always True when blinking is disabled
+        """
+        if not self._cursor_blink_interval:
+            return True
+
+        elapsed = _get_ticks() - self._cursor_blink_start
+        return not (elapsed // self._cursor_blink_interval) % 2
+
+    def _get_draw_rect(self) -> pygame.Rect:
+        """
+        Get the screen area covered when the input is drawn, including the cursor
+        :return: pygame.Rect with the area
+        """
+        rect = super()._get_draw_rect()
+        if self.active and self._cursor:
+            offset = self._get_cursor_offset()
+            cursor_rect = self._get_cursor_surface().get_rect(topleft=(self._rect.x + offset[0], self._rect.y + offset[1]))
+            rect.union_ip(cursor_rect)
+
+        return rect
+
+    def _draw_cursor(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """
+        Draw the cursor
+        :param surface: pygame.Surface where the cursor will be drawn
+        :param rect: pygame.Rect where the input is drawn on the surface
+        """
+        if not self._cursor:
+            return
+
+        offset = self._get_cursor_offset()
+
+        if not self._is_cursor_shown():
+            return
+
+        surface.blit(self._get_cursor_surface(), (rect.x + offset[0], rect.y + offset[1]))
+
+    def _handle_cursor_clicks(self) -> None:
+        """
+        Handle the clicks on the cursor
+        :return: None
+        """
+        mouse_pos = mouse_state.get_pos()
+        if not self._rect.collidepoint(mouse_pos):
+            return
+
+        if not self._cursor:
+            return
+
+        if not self.active:
+            return
+
+        if not mouse_state.get_pressed()[0]:
+            return
+
+        # Get the position of the mouse in the input text
+        mouse_x = mouse_pos[0] - self._get_text_x()
+
+        # The cursor goes before the first character whose prefix reaches the mouse position
+        self._cursor_index = bisect.bisect_left(self._get_prefix_widths(), mouse_x)
+
+    """
+    Basic methods
+    """
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Draw the input and the cursor
+        :param surface: pygame.Surface where the input will be drawn
+        """
+
+        super().draw(surface)
+        self._draw_with_alpha(surface, self._draw_frame)
+
+    def _draw_frame(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """
+        Draw the cursor and the border of the input
+        :param surface: pygame.Surface to draw on
+        :param rect: pygame.Rect where the input is drawn on the surface
+        :return: None
+        """
+        if self.active:
+            self._draw_cursor(surface, rect)
+            pygame.draw.rect(surface, self._active_border_color, rect, self._border_width, border_radius=self._border_radius)
+        else:
+            pygame.draw.rect(surface, self._passive_border_color, rect, self._border_width, border_radius=self._border_radius)
+
+    def update(self, events: list) -> None:
+        """
+        Update the input
+        :param events: list with the events
+        """
+        super().update()
+
+        was_active = self.active
+        cursor_index = self._cursor_index
+
+        # Check if the input was clicked
+        if self.was_clicked():
+            self.active = True
+        # Check if the input was clicked outside, if so, deactivate it
+        elif self.active:
+            self._handle_cursor_clicks()
+            self._handle_keys(events)
+            if mouse_state.get_pressed()[0] == 1 and not self.is_clicked():
+                self.active = False
+                if self._text != "":
+                    self.set_content(self._text)
+                else:
+                    self.set_content(self._hint)
+
+        # The active state changes the border and the cursor
+        if self.active != was_active or self._cursor_index != cursor_index:
+            self._mark_dirty()
+
+        if self.active and self._cursor:
+            cursor_shown = self._is_cursor_shown()
+            if cursor_shown != self._cursor_shown:
+                self._cursor_shown = cursor_shown
+                self._mark_dirty()
+
+class _StateSurface:
+    """
+    Prerendered surface of a button state and its offset from the button topleft.
+    """
+    __slots__ = ("surface", "offset", "__weakref__")
+
+    def __init__(self, surface: pygame.Surface, offset: tuple[int, int]) -> None:
+        """
+        Create a state surface
+        :param surface: pygame.Surface with the button drawn in the state
+        :param offset: tuple[int, int] with the offset of the surface from the button topleft
+        """
+        self.surface = surface
+        self.offset = offset
+
+class Button(Element):
+    """
+    Clickable button that also displays text, innherited from Element class.
+    Aggrigates a Text object to display the text in the button.
+    """
+    __slots__ = ("_text_object", "_label", "_style", "_hovered", "_state_surfaces")
+
+    # Event types passed to update by a UIManager
+    _event_types = ()
+
+    # Prerendered _StateSurface of each (style, size, label, state), shared by every button
+    # The buttons hold their own surfaces, so an entry lives as long as a button uses it
+    _state_surface_cache = weakref.WeakValueDictionary()
+
+    def __init__(self,
+                 position: tuple[int, int],
+                 width: int = 200,
+                 height: int = 50,
+                 border_radius: int = 10,
+                 border_color: tuple[int, int, int] = None,
+                 border_width: int = 2,
+                 label: str = "Click me.",
+                 color: tuple[int, int, int] = (255, 255, 255),
+                 hover_color: tuple[int, int, int] = (200, 200, 200),
+                 click_color: tuple[int, int, int] = (150, 150, 150),
+                 text_color: tuple[int, int, int] = (100, 100, 100),
+                 text_hover_color: tuple[int, int, int] = (0, 0, 0),
+                 text_click_color: tuple[int, int, int] = (0, 0, 0),
+                 font_size: int = 20,
+                 font_family: str = "Arial",
+                 centered: bool = False,
+                 style: Style = None) -> None:
+        """
+        Create a button element
+        :param position: Where the button will be positioned
+        :param width: Width of the button
+        :param height: Height of the button
+        :param label: Text of the button
+        :param color: Color of the button
+        :param hover_color: Color of the button when hovered
+        :param click_color: Color of the button when clicked
+        :param font_size: Size of the font
+        :param font_family: Font family of the text
+        :param centered: If the button will be centered in the position
+        :param style: Optional Style with the colors, border and font, replaces the other appearance parameters
+        """
+        if style is None:
+            style = Style(color, hover_color, click_color,
+                          text_color, text_hover_color, text_click_color,
+                          border_color, border_width, border_radius,
+                          font_size, font_family)
+
+        super().__init__(position, width, height, style.color, style.border_radius, style.border_color, style.border_width, centered)
+
+        self._text_object = Text(
+            position=self._rect.center,
+            content=label,
+            color=style.text_color,
+            font_size=style.font_size,
+            font_family=style.font_family,
+            width=width,
+            height=height,
+            centered=True # Center the text in the button
+        )
+
+        # Button attributes
+        self._label = label
+        # Colors, border and font, shared with the buttons using the same style
+        self._style = style
+
+        # States
+        self._hovered = False
+        # Surfaces of the current look, kept alive while the button uses them
+        self._state_surfaces = {}
+
+    """
+    Setters
+    """
+
+    def set_label(self, label: str) -> None:
+        """
+        Set the text of the button
+        :param label: Text to display on the button
+        :return: None
+        """
+        self._label = label
+        self._text_object.set_content(label)
+        self._mark_dirty()
+
+    def set_style(self, style: Style) -> None:
+        """
+        Set the colors, border and font of the button
+        :param style: Style of the button
+        :return: None
+        """
+        if style is self._style:
+            return
+
+        self._style = style
+        self._color = style.color
+        self._border_color = style.border_color
+        self._border_width = style.border_width
+        self._border_radius = style.border_radius
+
+        self._text_object.set_color(style.text_color)
+        self._text_object.set_font_size(style.font_size)
+        self._text_object.set_font_family(style.font_family)
+        self._mark_dirty()
+
+    def set_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the background color of the button
+        :param color: tuple[int, int, int] with the new color
+        """
+        self.set_style(self._style.replace(color=color))
+
+    def set_hover_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the hover color of the button
+        :param color: tuple[int, int, int]
+        """
+        self.set_style(self._style.replace(hover_color=color))
+
+    def set_click_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the click color of the button
+        :param color: tuple[int, int, int]
+        """
+        self.set_style(self._style.replace(click_color=color))
+
+    def set_text_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the text color of the button
+        :param color: tuple[int, int, int]
+        """
+        self.set_style(self._style.replace(text_color=color))
+
+    def set_text_hover_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the hover color of the text
+        :param color: tuple[int, int, int]
+        """
+        self.set_style(self._style.replace(text_hover_color=color))
+
+    def set_text_click_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the color of the text when the button is clicked
+        :param color: RGB tuple (r, g, b) for the text color when clicked
+        :return: None
+        """
+        self.set_style(self._style.replace(text_click_color=color))
+
+    def set_border_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the border color of the button
+        :param color: tuple[int, int, int] with the new border color
+        :return: None
+        """
+        self.set_style(self._style.replace(border_color=color))
+
+    def set_border_radius(self, radius: int) -> None:
+        """
+        Set the border radius of the button
+        :param radius: int with the new border radius
+        :return: None
+        """
+        self.set_style(self._style.replace(border_radius=radius))
+
+    def set_border_width(self, width: int) -> None:
+        """
+        Set the border width of the button
+        :param width: int with the new border width
+        :return: None
+        """
+        self.set_style(self._style.replace(border_width=width))
+
+    """
+    Getters
+    """
+
+    def get_style(self) -> Style:
+        """
+        Get the colors, border and font of the button
+        :return: Style of the button
+        """
+        return self._style
+
+    """
+    Internal methods
+    """
+
+    def _get_state(self) -> str:
+        """
+        Get the current visual state of the button
+        :return: "click", "hover" or "normal"
+        """
+        if self._clicked:
+            return "click"
+        if self._hovered:
+            return "hover"
+        return "normal"
+
+    def _get_state_surface(self, state: str) -> tuple[pygame.Surface, tuple[int, int]]:
+        """
+        Get the prerendered surface of a state, building it if needed
+        :param state: "normal", "hover" or "click"
+        :return: tuple with the surface and its offset from the button topleft
+        """
+        key = (self._style, self._rect.size, self._label, state)
+        state_surface = self._state_surfaces.get(key)
+        if state_surface is None:
+            state_surface = Button._state_surface_cache.get(key)
+            if state_surface is None:
+                state_surface = self._render_state_surface(state)
+                Button._state_surface_cache[key] = state_surface
+
+            # Release the surfaces of an earlier style, size or label
+            if self._state_surfaces and next(iter(self._state_surfaces))[:3] != key[:3]:
+                self._state_surfaces.clear()
+            self._state_surfaces[key] = state_surface
+
+        return state_surface.surface, state_surface.offset
+
+    def _render_state_surface(self, state: str) -> _StateSurface:
+        """
+        Draw the button in a state
+        :param state: "normal", "hover" or "click"
+        :return: _StateSurface with the drawn button
+        """
+        style = self._style
+        if state == "click":
+            color, text_color = style.click_color, style.text_click_color
+        elif state == "hover":
+            color, text_color = style.hover_color, style.text_hover_color
+        else:
+            color, text_color = style.color, style.text_color
+
+        rect = pygame.Rect(0, 0, self._rect.width, self._rect.height)
+        label_surface = self._text_object._render_text(text_color)
+        label_rect = label_surface.get_rect(center=rect.center)
+
+        # The label may be larger than the button, so the surface covers both
+        area = rect.union(label_rect)
+        rect.move_ip(-area.x, -area.y)
+        label_rect.move_ip(-area.x, -area.y)
+
+        surface = pygame.Surface(area.size, pygame.SRCALPHA)
+        _counters["surface_allocations"] += 1
+        pygame.draw.rect(surface, color, rect, border_radius=style.border_radius)
+        surface.blit(label_surface, label_rect)
+        if style.border_color:
+            pygame.draw.rect(surface, style.border_color, rect, width=style.border_width, border_radius=style.border_radius)
+
+        return _StateSurface(surface, area.topleft)
+
+    def _get_draw_rect(self) -> pygame.Rect:
+        """
+        Get the screen area covered when the button is drawn, including a label larger than the button
+        :return: pygame.Rect with the area
+        """
+        state_surface, offset = self._get_state_surface(self._get_state())
+        return state_surface.get_rect(topleft=(self._rect.x + offset[0], self._rect.y + offset[1]))
+
+    """
+    Basic methods
+    """
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Draw the button
+        :param surface: pygame.Surface where the button will be drawn
+        """
+
+        if not self._display:
+            return
+
+        state_surface, offset = self._get_state_surface(self._get_state())
+        surface.blit(self._apply_alpha(state_surface), (self._rect.x + offset[0], self._rect.y + offset[1]))
+
+    def update(self,  _=None) -> None:
+        """
+        Update the button,
+        Collects the events and updates the button
+        """
+        super().update()
+
+        # Check if the button is hovered
+        hovered = self.is_hovered()
+        if hovered != self._hovered:
+            self._hovered = hovered
+            self._mark_dirty()
+
+class ProgressBar(Element):
+    """
+    Its a progress bar, innherited from Element class.
+    """
+    __slots__ = (
+        "_progress", "_max_progress", "_min_progress", "_progress_bar", "_progress_bar_color", "_progress_bar_width",
+        "_progress_bar_height", "_progress_bar_centered", "_background_color"
+    )
+
+    # Event types passed to update by a UIManager
+    _event_types = ()
+
+    def __init__(self,
+                 position: tuple[int, int],
+                 width: int = 200,
+                 height: int = 50,
+                 progress: int = 0,
+                 max_progress: int = 100,
+                 min_progress: int = 0,
+                 color: tuple[int, int, int] = (150, 255, 150),
+                 background_color: tuple[int, int, int] = (100, 100, 100),
+                 border_radius: int = 0,
+                 border_color: tuple[int, int, int] = (200, 200, 200),
+                 border_width: int = 2,
+                 centered: bool = False) -> None:
+        """
+        Create a progress element
+        :param position: Where the progress will be positioned
+        :param width: Width of the progress
+        :param height: Height of the progress
+        :param progress: Current progress amount
+        :param max_progress: Maximum progress amount
+        :param min_progress: Minimum progress amount
+        :param color: Color of the progress
+        :param border_radius: Radius of the border
+        :param background_color: Color of the background, set to None to disable the background
+        :param border_color: Color of the border, set to None to disable the border
+        :param border_width: Width of the border
+        :param centered: If the progress will be centered in the position
+        """
+        super().__init__(position, width, height, color, border_radius, centered=centered)
+
+        # Progress attributes
+        self._progress = progress
+        self._max_progress = max_progress
+        self._min_progress = min_progress
+
+        # Progress bar attributes
+        self._progress_bar = pygame.Rect(self._rect.x, self._rect.y, 0, self._rect.height)
+        self._progress_bar_color = color
+        self._progress_bar_width = width
+        self._progress_bar_height = height
+        self._progress_bar_centered = centered
+
+        # Border attributes
+        self._border_color = border_color
+        self._border_width = border_width
+        self._border_radius = border_radius
+
+        # Background attributes
+        self._background_color = background_color
+
+    """
+    Setters
+    """
+
+    def move(self, x: int, y: int) -> None:
+        """
+        Move the position of the elment by x, y value
+        (Note moving has no effect when animating)
+        :param x: int for movement in x direction
+        :param y: int for movement in y direction
+        """
+        super().move(x, y)
+        if self._centered:
+            self._progress_bar.centerx += x
+            self._progress_bar.centery += y
+        else:
+            self._progress_bar.x += x
+            self._progress_bar.y += y
+
+    def set_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the color of the progress bar
+        :param color: tuple[int, int, int] with the new color
+        :return: None
+        """
+        super().set_color(color)
+        self._progress_bar_color = color
+
+    def set_progress(self, progress: int) -> None:
+        """
+        Set the progress amount
+        :param progress: int with the new progress amount
+        """
+        self._progress = progress
+
+        if self._progress > self._max_progress:
+            self._progress = self._max_progress
+        elif self._progress < self._min_progress:
+            self._progress = self._min_progress
+
+        self._update_progress_bar()
+
+    def set_max_progress(self, max_progress: int) -> None:
+        """
+        Set the maximum progress amount
+        :param max_progress: int with the new maximum progress amount
+        """
+        self._max_progress = max_progress
+
+        self._update_progress_bar()
+
+    def set_min_progress(self, min_progress: int) -> None:
+        """
+        Set the minimum progress amount
+        :param min_progress: int with the new minimum progress amount
+        """
+        self._min_progress = min_progress
+        # Update the progress bar width
+        if self._progress < self._min_progress:
+            self._progress = self._min_progress
+
+        self._update_progress_bar()
+
+    def change_progress(self, amount: float) -> None:
+        """
+        Change the progress amount
+        :param amount: Float or int with the amount to change the progress by
+        :return: None
+        """
+        self._progress += amount
+
+        self.set_progress(self._progress)
+
+    """
+    Getters
+    """
+
+    def get_progress(self) -> int:
+        """
+        Get the progress amount
+        :return: int with the progress amount
+        """
+        return self._progress
+
+    """
+    Internal methods
+    """
+
+    def _get_tween_properties(self) -> dict:
+        """
+        Get the properties that can be animated with tween, including the progress
+        :return: dict with the property name as key and a tuple of (getter, setter, rounding step) as value
+        """
+        properties = super()._get_tween_properties()
+        # Progress only changes the drawing when the bar grows by a whole pixel
+        step = (self._max_progress - self._min_progress) / max(self._rect.width, 1)
+        properties["progress"] = (self.get_progress, self.set_progress, step)
+        return properties
+
+    def _update_progress_bar(self) -> None:
+        """
+        Update the progress bar width, and keep the bar at the position and height of the element
+        :return: None
+        """
+        self._progress_bar.topleft = self._rect.topleft
+        self._progress_bar.height = self._rect.height
+
+        width = int(self._rect.width * (self._progress / self._max_progress))
+        if width != self._progress_bar.width:
+            self._progress_bar.width = width
+            self._mark_dirty()
+
+    """
+    Basic methods
+    """
+
+    def _draw_shape(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """
+        Draw the progress bar, drawn by the draw method innherited from Element
+        :param surface: pygame.Surface to draw on
+        :param rect: pygame.Rect where the progress bar is drawn on the surface
+        :return: None
+        """
+        # Draw the background
+        if self._background_color:
+            pygame.draw.rect(surface, self._background_color, rect, border_radius=self._border_radius)
+        # Draw the progress bar
+        progress_bar = self._progress_bar.move(rect.x - self._rect.x, rect.y - self._rect.y)
+        pygame.draw.rect(surface, self._progress_bar_color, progress_bar, border_radius=self._border_radius)
+        # Draw the border
+        if self._border_color:
+            pygame.draw.rect(surface, self._border_color, rect, self._border_width, border_radius=self._border_radius)
+
+    def update(self, events=None) -> None:
+        """
+        Update the progress bar state
+        :param events: Optional list of pygame events (not used in ProgressBar class but included for API consistency)
+        :return: None
+        """
+        super().update()
+        self._update_progress_bar()
+
+class DropdownMenu(Element):
+    """
+    Dropdown menu element for displaying a list of options, innherited from Element class.
+    Aggrigates a Button object to display the dropdown items.
+    """
+    __slots__ = (
+        "_style", "_selected_style", "_onchange", "_element_width",
+        "_element_height", "_element_spacing", "_options", "_selected_option_index", "_wrap_direction",
+        "_max_elements_per_column", "_options_buttons", "_selected_button", "_is_open"
+    )
+
+    # Event types passed to update by a UIManager
+    _event_types = ()
+
+    def __init__(self,
+                 position: tuple[int, int],
+                 options: list[str],
+                 width: int = 200,
+                 height: int = 50,
+                 on_change: callable = None,
+                 element_width: int = 200,
+                 element_height: int = 50,
+                 element_spacing: int = 2,
+                 max_elements_per_column: int = 5,
+                 wrap_reverse: bool = False,
+                 color = (255, 255, 255),
+                 hover_color = (200, 200, 200),
+                 click_color = (150, 150, 150),
+                 font_size = 20,
+                 font_family = "Arial",
+                 text_color = (0, 0, 0),
+                 text_hover_color = (0, 0, 0),
+                 text_click_color = (0, 0, 0),
+                 selected_option_color = (200, 200, 200),
+                 selected_option_hover_color = (150, 150, 150),
+                 selected_option_click_color = (100, 100, 100),
+                 selected_option_text_color = (0, 0, 0),
+                 selected_option_text_hover_color = (0, 0, 0),
+                 selected_option_text_click_color = (0, 0, 0),
+                 border_radius = 0,
+                 centered = False,
+                 style: Style = None,
+                 selected_style: Style = None) -> None:
+        """
+        Create a dropdown menu element
+        :param position: Where the dropdown menu will be positioned
+        :param options: List of options to be displayed in the dropdown menu
+        :param width: Width of the dropdown menu
+        :param height: Height of the dropdown menu
+        :param on_change: Function to be called when the selected option changes
+        :param element_width: Width of each option button in the dropdown
+        :param element_height: Height of each option button in the dropdown
+        :param element_spacing: Spacing between option buttons
+        :param max_elements_per_column: Maximum number of options per column before wrapping
+        :param wrap_reverse: If True, wraps options in reverse order
+        :param color: Default background color of the option buttons
+        :param hover_color: Background color when an option is hovered over
+        :param click_color: Background color when an option is clicked
+        :param font_size: Size of the text font
+        :param font_family: Font family used for text
+        :param text_color: Default text color
+        :param text_hover_color: Text color when hovered over
+        :param text_click_color: Text color when clicked
+        :param selected_option_color: Background color of the main button
+        :param selected_option_hover_color: Background color of the main button when hovered
+        :param selected_option_click_color: Background color of the main button when clicked
+        :param selected_option_text_color: Text color of the main button
+        :param selected_option_text_hover_color: Text color of the main button when hovered
+        :param selected_option_text_click_color: Text color of the main button when clicked
+        :param border_radius: Radius for rounded corners
+        :param centered: If True, the dropdown is centered on the provided position
+        :param style: Optional Style of the option buttons, replaces the option appearance parameters
+        :param selected_style: Optional Style of the selected option button, replaces the selected option appearance parameters
+        """
+        if style is None:
+            style = Style(color, hover_color, click_color,
+                          text_color, text_hover_color, text_click_color,
+                          border_radius=border_radius, font_size=font_size, font_family=font_family)
+        if selected_style is None:
+            selected_style = Style(selected_option_color, selected_option_hover_color, selected_option_click_color,
+                                   selected_option_text_color, selected_option_text_hover_color, selected_option_text_click_color,
+                                   border_radius=border_radius, font_size=font_size, font_family=font_family)
+
+        super().__init__(position, width, height, style.color, style.border_radius, centered=centered)
+
+        # Visuals, the styles of the option buttons and of the selected option button
+        self._style = style
+        self._selected_style = selected_style
+
+        self._onchange = on_change
+
+        self._element_width = element_width
+        self._element_height = element_height
+        self._element_spacing = element_spacing
+
+        # Drop down menu attributes
+        self._options = options
+        self._selected_option_index = 0
+        self._wrap_direction = -1 if wrap_reverse else 1
+        self._max_elements_per_column = max_elements_per_column
+        self._options_buttons = self._generate_options_buttons()
+        self._selected_button = self._generate_selected_button()
+        self._is_open = False
+
+    """
+    Setters
+    """
+
+    def move(self, x: int, y: int) -> None:
+        """
+        Move the position of the elment by x, y value
+        (Note moving has no effect when animating)
+        :param x: int for movement in x direction
+        :param y: int for movement in y direction
+        """
+        super().move(x, y)
+        for button in self._options_buttons:
+            button.move(x, y)
+        self._selected_button.move(x,y)
+
+    def set_position(self, position: tuple[int, int]) -> None:
+        """
+        Set the position of the drop down menu, the buttons are moved by the same offset
+        (Animations move the menu through this method, so the buttons follow without being rebuilt)
+        :param position: tuple[int, int] with the new position
+        :return: None
+        """
+        old_x, old_y = self._rect.topleft
+        super().set_position(position)
+        x = self._rect.x - old_x
+        y = self._rect.y - old_y
+        if x == 0 and y == 0:
+            return
+
+        for button in self._options_buttons:
+            button.move(x, y)
+        self._selected_button.move(x, y)
+
+    def set_alpha(self, alpha: int) -> None:
+        """
+        Set the opacity of the drop down menu and its buttons
+        :param alpha: int from 0 (invisible) to 255 (opaque)
+        :return: None
+        """
+        super().set_alpha(alpha)
+        for button in self._options_buttons:
+            button.set_alpha(self._alpha)
+        self._selected_button.set_alpha(self._alpha)
+
+    def set_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the color of the option buttons
+        :param color: tuple[int, int, int] with the new color
+        :return: None
+        """
+        self.set_style(self._style.replace(color=color))
+
+    def set_border_radius(self, radius: int) -> None:
+        """
+        Set the border radius of the option buttons and of the selected option button
+        :param radius: int with the new border radius
+        :return: None
+        """
+        self.set_style(self._style.replace(border_radius=radius), self._selected_style.replace(border_radius=radius))
+
+    def set_size(self, size: tuple[int, int]) -> None:
+        """
+        Set the size of the selected option button, the options are placed below it
+        :param size: tuple[int, int] with the new width and height
+        :return: None
+        """
+        size = (int(size[0]), int(size[1]))
+        if size == self._rect.size:
+            return
+
+        super().set_size(size)
+        self._index_options_buttons(False)
+        self._options_buttons = self._generate_options_buttons()
+        self._index_options_buttons(self._is_open)
+        self._selected_button = self._generate_selected_button()
+
+    def set_options(self, options: list[str]) -> None:
+        """
+        Set the options of the drop down menu
+        :param options: list[str] with the new options
+        :return: None
+        """
+        self._options = options
+        self._selected_option_index = 0
+        self._index_options_buttons(False)
+        self._options_buttons = self._generate_options_buttons()
+        self._index_options_buttons(self._is_open)
+        self._selected_button = self._generate_selected_button()
+        self._mark_dirty()
+
+    def set_selected_option(self, option: str) -> None:
+        """
+        Set the selected option of the drop down menu
+        :param selected_option: str with the new selected option
+        :return: None
+        """
+        if option not in self._options:
+            raise ValueError("Selected option is not in the options list")
+
+        self._selected_option_index = self._options.index(option)
+        self._update_selected_button()
+        self._mark_dirty()
+
+    def set_selected_index(self, index: int) -> None:
+        """
+        Set the selected option of the drop down menu
+        :param selected_option_index: int with the new selected option index
+        :return: None
+        """
+        if index < 0 or index >= len(self._options):
+            raise ValueError("Selected option index is out of range")
+
+        self._selected_option_index = index
+        self._update_selected_button()
+        self._mark_dirty()
+
+    def set_style(self, style: Style, selected_style: Style = None) -> None:
+        """
+        Set the styles of the option buttons and of the selected option button
+        :param style: Style of the option buttons
+        :param selected_style: Style of the selected option button, kept if None
+        :return: None
+        """
+        self._style = style
+        self._color = style.color
+        self._border_radius = style.border_radius
+        for button in self._options_buttons:
+            button.set_style(style)
+
+        if selected_style is not None:
+            self._selected_style = selected_style
+            self._selected_button.set_style(selected_style)
+
+        self._mark_dirty()
+
+    """
+    Getters
+    """
+
+    def get_style(self) -> Style:
+        """
+        Get the style of the option buttons
+        :return: Style of the option buttons
+        """
+        return self._style
+
+    def get_selected_style(self) -> Style:
+        """
+        Get the style of the selected option button
+        :return: Style of the selected option button
+        """
+        return self._selected_style
+
+    def get_selected_option(self) -> str:
+        """
+        Get the selected option
+        :return: str with the selected option
+        """
+        return self._options[self._selected_option_index]
+
+    def get_selected_index(self) -> int:
+        """
+        Get the selected option index
+        :return: int with the selected option index
+        """
+        return self._selected_option_index
+
+    def get_options(self) -> list[str]:
+        """
+        Get the options of the drop down menu
+        :return: list[str] with the options
+        """
+        return self._options
+
+    def pop_dirty_rects(self) -> list[pygame.Rect]:
+        """
+        Get the screen areas that must be redrawn since the last call, including the areas of the option buttons
+        :return: list[pygame.Rect] with the dirty areas, empty if nothing changed
+        """
+        dirty_rects = super().pop_dirty_rects()
+
+        dirty_rects += self._selected_button.pop_dirty_rects()
+        for button in self._options_buttons:
+            button_rects = button.pop_dirty_rects()
+            # Closed options are not drawn, so their changes do not need a redraw
+            if self._is_open:
+                dirty_rects += button_rects
+
+        return dirty_rects
+
+    """
+    Internal methods
+    """
+
+    def _set_open(self, state: bool) -> None:
+        """
+        Open or close the menu
+        :param state: True to open the menu, False to close it
+        :return: None
+        """
+        if state != self._is_open:
+            self._is_open = state
+            self._index_options_buttons(state)
+            self._mark_dirty()
+
+    def _set_spatial_index(self, spatial_index: "SpatialGrid") -> None:
+        """
+        Set the spatial index of the UIManager the menu belongs to, the open option buttons are stored in it too
+        :param spatial_index: SpatialGrid the menu is stored in, None when it is removed from the manager
+        :return: None
+        """
+        self._index_options_buttons(False)
+        super()._set_spatial_index(spatial_index)
+        self._index_options_buttons(self._is_open)
+
+    def _index_options_buttons(self, indexed: bool) -> None:
+        """
+        Add the option buttons to the spatial index of the menu or remove them from it
+        Open options are drawn over the elements below the menu, so they are found under the mouse instead of them
+        :param indexed: True to add the buttons, False to remove them
+        :return: None
+        """
+        for button in self._options_buttons:
+            if button._spatial_index is not None:
+                button._spatial_index.remove(button)
+                button._spatial_index = None
+
+        if indexed and self._spatial_index is not None:
+            for button in self._options_buttons:
+                self._spatial_index.insert(button)
+                button._spatial_index = self._spatial_index
+
+    def _get_draw_rect(self) -> pygame.Rect:
+        """
+        Get the screen area covered when the menu is drawn, including the options when the menu is open
+        :return: pygame.Rect with the area
+        """
+        rect = self._selected_button._get_draw_rect()
+        if self._is_open:
+            rect.unionall_ip([button._get_draw_rect() for button in self._options_buttons])
+
+        return rect
+
+    def _generate_selected_button(self) -> Button:
+        """
+        Return a button with the selected option
+        :return: Button with the selected option
+        """
+        selected_button = Button((self._rect.x, self._rect.y),
+                                 self._rect.width, self._rect.height,
+                                 label=str(self._options[self._selected_option_index]),
+                                 style=self._selected_style)
+        selected_button.set_alpha(self._alpha)
+
+        return selected_button
+
+    def _update_selected_button(self) -> None:
+        """
+        Show the selected option on the selected option button, the existing button is relabeled instead of rebuilt
+        :return: None
+        """
+        self._selected_button.set_label(str(self._options[self._selected_option_index]))
+
+    def _generate_options_buttons(self) -> list[Button]:
+        """
+        Generate the buttons for the options
+        :return: list of buttons with the options
+        """
+        options_buttons = []
+
+        for index, label in enumerate(self._options):
+            multiplier_x = index // self._max_elements_per_column
+            offset_x = self._element_spacing + self._element_width * multiplier_x * self._wrap_direction + self._element_spacing * (multiplier_x-1)
+
+            multiplier_y = index - index // self._max_elements_per_column * self._max_elements_per_column
+            offset_y = self._rect.height + self._element_height * multiplier_y + self._element_spacing * (multiplier_y+1)
+
+            x_cordinate = self._rect.x + offset_x
+            y_cordinate = self._rect.y + offset_y
+
+            button = Button((x_cordinate, y_cordinate),
+                            self._element_width, self._element_height,
+                            label=str(label),
+                            style=self._style)
+            button.set_alpha(self._alpha)
+
+            options_buttons.append(button)
+
+        return options_buttons
+
+    """
+    Basic methods
+    """
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Draw the drop down menu
+        :param surface: pygame.Surface where the drop down menu will be drawn
+        :return: None
+        """
+
+        if not self._display:
+            return
+
+        self._selected_button.draw(surface)
+
+        if self._is_open:
+            for button in self._options_buttons:
+                button.draw(surface)
+
+    def update(self, _=None) -> None:
+        """
+        Update the drop down menu
+        :return: None
+        """
+        super().update()
+
+        # Update the buttons
+        self._selected_button.update()
+        for button in self._options_buttons:
+            button.update()
+
+        if self._is_open:
+            # Check if any of the buttons were clicked, if so, set the selected option to the clicked button
+            for button in self._options_buttons:
+                if button.was_clicked():
+                    self._selected_option_index = self._options_buttons.index(button)
+                    self._update_selected_button()
+                    # Close the menu after selecting an option
+                    self._set_open(False)
+
+                    if self._onchange:
+                        self._onchange()
+                    return
+
+            if self._selected_button.was_clicked():
+                self._set_open(False)
+                return
+
+            # Check if the menu was clicked outside, if so, close it
+            if mouse_state.get_pressed()[0] == 1 and not self.is_clicked():
+                # Check that we haven't clicked any other button from the menu
+                for button in self._options_buttons:
+                    if button.is_hovered():
+                        return
+
+                self._set_open(False)
+                return
+
+        # Check if the menu was clicked, if so, open it
+        if self._selected_button.was_clicked():
+            self._set_open(True)
+
+class Table(Element):
+    """
+    Table element for displaying a grid of data, innherited from Element class.
+    Aggrigates a Button object to display the table cells.
+    """
+    __slots__ = (
+        "_content", "_columns", "_rows", "_cell_width", "_cell_height", "_style", "_items"
+    )
+
+    # Event types passed to update by a UIManager
+    _event_types = ()
+
+    def __init__(self,
+                 position,
+                 content: list[list[str]],
+                 width = 200,
+                 height = 50,
+                 color = (255, 255, 255),
+                 hover_color = (200, 200, 200),
+                 text_color = (0, 0, 0),
+                 border_color = (200, 200, 200),
+                 border_width = 2,
+                 border_radius = 0,
+                 centered = False,
+                 style: Style = None) -> None:
+        """
+        Create a table element
+        :param position: Where the table will be positioned
+        :param content: 2D list of strings representing the table data
+        :param width: Width of the entire table
+        :param height: Height of the entire table
+        :param color: Background color of the cells
+        :param hover_color: Background color of the cells when hovered
+        :param text_color: Color of the text in cells
+        :param border_color: Color of the cell borders
+        :param border_width: Width of the cell borders
+        :param border_radius: Radius for rounded corners of cells
+        :param centered: If True, the table is centered on the provided position
+        :param style: Optional Style of the cells, replaces the cell appearance parameters
+        """
+        if style is None:
+            style = Style(color, hover_color, text_color=text_color,
+                          border_color=border_color, border_width=border_width, border_radius=border_radius)
+
+        super().__init__(position, width, height, style.color, style.border_radius, style.border_color, style.border_width, centered=centered)
+
+        # Table attributes
+        self._content = [list(row) for row in content]
+        self._columns = len(content[0])
+        self._rows = len(content)
+        self._cell_width = width // self._columns
+        self._cell_height = height // self._rows
+        # Colors, border and font of the cells, shared by every cell button
+        self._style = style
+
+        # Drawing
+        self._items = self._generate_table()
+
+    """
+    Setters
+    """
+
+    def move(self, x: int, y: int) -> None:
+        """
+        Move the position of the elment by x, y value
+        (Note moving has no effect when animating)
+        :param x: int for movement in x direction
+        :param y: int for movement in y direction
+        """
+        super().move(x, y)
+        for button in self._items:
+            button.move(x, y)
+
+    def set_alpha(self, alpha: int) -> None:
+        """
+        Set the opacity of the table and its cells
+        :param alpha: int from 0 (invisible) to 255 (opaque)
+        :return: None
+        """
+        super().set_alpha(alpha)
+        for button in self._items:
+            button.set_alpha(self._alpha)
+
+    def set_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the color of the cells
+        :param color: tuple[int, int, int] with the new color
+        :return: None
+        """
+        self.set_style(self._style.replace(color=color))
+
+    def set_border_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the border color of the cells
+        :param color: tuple[int, int, int] with the new border color
+        :return: None
+        """
+        self.set_style(self._style.replace(border_color=color))
+
+    def set_border_radius(self, radius: int) -> None:
+        """
+        Set the border radius of the cells
+        :param radius: int with the new border radius
+        :return: None
+        """
+        self.set_style(self._style.replace(border_radius=radius))
+
+    def set_border_width(self, width: int) -> None:
+        """
+        Set the border width of the cells
+        :param width: int with the new border width
+        :return: None
+        """
+        self.set_style(self._style.replace(border_width=width))
+
+    def set_size(self, size: tuple[int, int]) -> None:
+        """
+        Set the size of the table, the cells are resized to fill it
+        :param size: tuple[int, int] with the new width and height
+        :return: None
+        """
+        size = (int(size[0]), int(size[1]))
+        if size == self._rect.size:
+            return
+
+        super().set_size(size)
+        self._items = self._generate_table()
+
+    def set_content(self, content: list[list[str]]) -> pygame.Rect:
+        """
+        Set the content of the table
+        If the new content has the same shape, only the cells that changed are re-rendered,
+        otherwise the whole table is rebuilt.
+        :param content: list[list[str]] with the new content
+        :return: pygame.Rect with the region that changed, None if nothing changed
+        """
+        if len(content) != self._rows or len(content[0]) != self._columns:
+            self._content = [list(row) for row in content]
+            self._columns = len(content[0])
+            self._rows = len(content)
+            self._items = self._generate_table()
+            self._mark_dirty()
+            return self._rect.copy()
+
+        dirty_region = None
+        for row in range(self._rows):
+            dirty_region = self._union_region(dirty_region, self.set_row(row, content[row]))
+
+        return dirty_region
+
+    def set_row(self, row: int, values: list[str]) -> pygame.Rect:
+        """
+        Set the content of a row, only the cells that changed are re-rendered
+        :param row: int with the index of the row
+        :param values: list[str] with one value per column
+        :return: pygame.Rect with the region that changed, None if nothing changed
+        """
+        if len(values) != self._columns:
+            raise ValueError("Row length does not match the number of columns")
 
-        return False
+        dirty_region = None
+        for column, value in enumerate(values):
+            dirty_region = self._union_region(dirty_region, self.set_cell(row, column, value))
 
-    def _handle_keys(self, events: list) -> None:
+        return dirty_region
+
+    def set_cell(self, row: int, column: int, value: str) -> pygame.Rect:
         """
-        Handle the typing of the input
-        :param events: List of pygame events to process for keyboard input
-        :return: None
+        Set the content of a single cell, the cell is only re-rendered if the value changed
+        :param row: int with the index of the row
+        :param column: int with the index of the column
+        :param value: The new value, will be converted to string if not already a string
+        :return: pygame.Rect with the region of the cell, None if the value did not change
         """
-        for event in events:
-            if event.type != pygame.KEYDOWN: # We only want to handle key down events
-                continue
-            # Handle copy/paste
-            if event.key == pygame.K_v and event.mod & pygame.KMOD_CTRL:
-                pasted_text = pygame.scrap.get("text/plain;charset=utf-8").decode()
-                # Remove all non-printable characters
-                pasted_text = re.sub(r'[^\x20-\x7E]+', '', pasted_text)
+        if not 0 <= row < self._rows or not 0 <= column < self._columns:
+            raise ValueError("Cell index is out of range")
 
-                for char in pasted_text:
-                    if not self._allow_key(char):
-                        pasted_text = pasted_text.replace(char, "")
+        self._content[row][column] = value
 
-                if self._max_length and len(pasted_text) + len(self._text) > self._max_length:
-                    pasted_text = pasted_text[:self._max_length - len(self._text)]
+        cell = self._items[row * self._columns + column]
+        label = str(value)
+        if label == cell._label:
+            return None
 
-                self._text = self._text[:self._cursor_index] + pasted_text + self._text[self._cursor_index:]
-                self._cursor_index += len(pasted_text)
-                continue
-            elif event.key == pygame.K_c and event.mod & pygame.KMOD_CTRL:
-                pygame.scrap.put(pygame.SCRAP_TEXT, self._text.encode('utf-8'))
-                continue
-            elif event.key == pygame.K_x and event.mod & pygame.KMOD_CTRL:
-                pygame.scrap.put(pygame.SCRAP_TEXT, self._text.encode('utf-8'))
-                self._text = ""
-                self._cursor_index = 0
-                continue
-            elif event.key in self._exit_keys: # Check if the key should exit the input
-                self.active = False
-            elif event.key in self._exclude_keys: # Check the key should be ignored
-                continue
-            # Cursor
-            elif event.key == pygame.K_RIGHT:
-                if not self._cursor:
-                    continue
-                if self._cursor_index >= len(self._text):
-                    continue
-                self._cursor_index += 1
-            elif event.key == pygame.K_LEFT:
-                if not self._cursor:
-                    continue
-                if self._cursor_index <= 0:
-                    continue
-                self._cursor_index -= 1
-            # Backspace and delete
-            elif event.key == pygame.K_BACKSPACE:
-                if self._cursor_index == 0:
-                    continue
+        cell.set_label(label)
+        return cell._rect.copy()
 
-                self._text = self._text[:self._cursor_index-1] + self._text[self._cursor_index:]
-                self._cursor_index -= 1
-            elif event.key == pygame.K_DELETE:
-                if self._cursor_index == len(self._text):
-                    continue
+    def set_style(self, style: Style) -> None:
+        """
+        Set the colors, border and font of the cells
+        :param style: Style of the cells
+        :return: None
+        """
+        self._style = style
+        self._color = style.color
+        self._border_color = style.border_color
+        self._border_width = style.border_width
+        self._border_radius = style.border_radius
+        for cell in self._items:
+            cell.set_style(style)
 
-                self._text = self._text[:self._cursor_index] + self._text[self._cursor_index+1:]
-            # Normal keys
-            else:
-                if not self._allow_key(event.unicode):
-                    continue
+        self._mark_dirty()
 
-                self._text = self._text[:self._cursor_index] + event.unicode + self._text[self._cursor_index:]
-                self._cursor_index += 1
+    """
+    Getters
+    """
 
-        self.set_content(self._text)
+    def get_style(self) -> Style:
+        """
+        Get the colors, border and font of the cells
+        :return: Style of the cells
+        """
+        return self._style
 
-    def _draw_cursor(self, surface: pygame.Surface) -> None:
+    def get_content(self) -> list[list[str]]:
         """
-        Draw the cursor
-        :param surface: pygame.Surface where the cursor will be drawn
+        Get the content of the table
+        :return: list[list[str]] with the content
         """
-        if not self._cursor:
-            return
+        return self._content
 
-        font = pygame.font.SysFont(self._font_family, self._font_size)
-        cursor_surface = font.render("|", True, self._active_text_color)
+    def get_cell(self, row: int, column: int) -> str:
+        """
+        Get the content of a single cell
+        :param row: int with the index of the row
+        :param column: int with the index of the column
+        :return: The value of the cell
+        """
+        return self._content[row][column]
 
-        text_to_cursor = Text(self.get_position(), self._text[:self._cursor_index], self._active_text_color,
-                              self._font_size, self._font_family, self._centered)
+    def pop_dirty_rects(self) -> list[pygame.Rect]:
+        """
+        Get the screen areas that must be redrawn since the last call, including the areas of the changed cells
+        :return: list[pygame.Rect] with the dirty areas, empty if nothing changed
+        """
+        dirty_rects = super().pop_dirty_rects()
+        for item in self._items:
+            dirty_rects += item.pop_dirty_rects()
 
-        cursor_position = (self._rect.x + text_to_cursor._rect.width - 2, self._rect.y)
+        return dirty_rects
 
-        if self._centered:
-            start = self._rect.centerx - super()._get_text_rect_dimensions()[0] // 2
-            result = start + text_to_cursor._rect.width - 2
-            cursor_position = (result, self._rect.y + self._rect.height//4)
+    """
+    Internal methods
+    """
 
+    def _get_draw_rect(self) -> pygame.Rect:
+        """
+        Get the screen area covered when the table is drawn
+        :return: pygame.Rect with the area
+        """
+        return self._rect.unionall([item._get_draw_rect() for item in self._items])
 
-        surface.blit(cursor_surface, cursor_position)
+    @staticmethod
+    def _union_region(region: pygame.Rect, other: pygame.Rect) -> pygame.Rect:
+        """
+        Combine two dirty regions where either may be None
+        :param region: pygame.Rect or None
+        :param other: pygame.Rect or None
+        :return: pygame.Rect covering both regions, None if both are None
+        """
+        if region is None:
+            return other
+        if other is None:
+            return region
+        return region.union(other)
 
-    def _handle_cursor_clicks(self) -> None:
+    def _generate_table(self) -> None:
         """
-        Handle the clicks on the cursor
+        Generate the table
         :return: None
         """
-        mouse_pos = pygame.mouse.get_pos()
-        if not self._rect.collidepoint(mouse_pos):
-            return
-
-        if not self._cursor:
-            return
+        items_to_draw = []
 
-        if not self.active:
-            return
+        self._cell_width = self._rect.width // self._columns
+        self._cell_height = self._rect.height // self._rows
 
-        if not pygame.mouse.get_pressed()[0]:
-            return
+        for row in range(self._rows):
+            for column in range(self._columns):
+                x = self._rect.x + column * self._cell_width
+                y = self._rect.y + row * self._cell_height
 
-        # Get the position of the mouse in the input
-        mouse_x = mouse_pos[0] - self._rect.x
+                # Draw the text in the cell
+                cell = Button((x, y), label=str(self._content[row][column]), width=self._cell_width, height=self._cell_height, style=self._style)
+                cell.set_alpha(self._alpha)
+                items_to_draw.append(cell)
 
-        # Get the index of the character that is closest to the mouse position
-        for i in range(len(self._text) + 1):
-            text_to_cursor = Text(self.get_position(), self._text[:i], self._active_text_color, self._font_size,
-                                  self._font_family, self._centered)
-            if text_to_cursor._rect.width >= mouse_x:
-                self._cursor_index = i
-                break
-        else:
-            self._cursor_index = len(self._text)
+        return items_to_draw
 
     """
     Basic methods
@@ -888,180 +4173,275 @@ class Input(Text):
 
     def draw(self, surface: pygame.Surface) -> None:
         """
-        Draw the input and the cursor
-        :param surface: pygame.Surface where the input will be drawn
+        Draw the table
+        :param surface: pygame.Surface where the table will be drawn
+        :return: None
         """
+        if not self._display:
+            return
 
-        super().draw(surface)
-
-        if self.active:
-            self._draw_cursor(surface)
-            pygame.draw.rect(surface, self._active_border_color, self._rect, self._border_width, border_radius=self._border_radius)
-        else:
-            pygame.draw.rect(surface, self._passive_border_color, self._rect, self._border_width, border_radius=self._border_radius)
+        for item in self._items:
+            item.draw(surface)
 
-    def update(self, events: list) -> None:
+    def update(self, events=None) -> None:
         """
-        Update the input
-        :param events: list with the events
+        Update the table and its elements
+        :param events: Optional pygame events list, kept for API consistency
+        :return: None
         """
-        super().update()
+        self._update_tweens()
 
-        # Check if the input was clicked
-        if self.was_clicked():
-            self.active = True
-        # Check if the input was clicked outside, if so, deactivate it
-        elif self.active:
-            self._handle_cursor_clicks()
-            self._handle_keys(events)
-            if pygame.mouse.get_pressed()[0] == 1 and not self.is_clicked():
-                self.active = False
-                if self._text != "":
-                    self.set_content(self._text)
-                else:
-                    self.set_content(self._hint)
+        for item in self._items:
+            item.update()
 
-class Button(Element):
+class VirtualTable(Element):
     """
-    Clickable button that also displays text, innherited from Element class.
-    Aggrigates a Text object to display the text in the button.
+    Table element for large data sets, innherited from Element class.
+    Keeps the cells as plain strings and only renders the rows inside the viewport into a reused surface,
+    so memory and frame time depend on the viewport size and not on the amount of data.
     """
+    __slots__ = (
+        "_content", "_columns", "_rows", "_row_height", "_cell_color", "_cell_color_hover", "_text_color",
+        "_font_family", "_font_size", "_scroll_offset", "_scroll_speed", "_hovered_cell", "_surface", "_needs_redraw"
+    )
+
+    # Event types passed to update by a UIManager
+    _event_types = (pygame.MOUSEWHEEL,)
+
     def __init__(self,
-                 position: tuple[int, int],
-                 width: int = 200,
-                 height: int = 50,
-                 border_radius: int = 10,
-                 border_color: tuple[int, int, int] = None,
-                 border_width: int = 2,
-                 label: str = "Click me.",
-                 color: tuple[int, int, int] = (255, 255, 255),
-                 hover_color: tuple[int, int, int] = (200, 200, 200),
-                 click_color: tuple[int, int, int] = (150, 150, 150),
-                 text_color: tuple[int, int, int] = (100, 100, 100),
-                 text_hover_color: tuple[int, int, int] = (0, 0, 0),
-                 text_click_color: tuple[int, int, int] = (0, 0, 0),
+                 position,
+                 content: list[list[str]],
+                 width: int = 400,
+                 height: int = 300,
+                 row_height: int = 30,
+                 scroll_speed: int = 30,
+                 color = (255, 255, 255),
+                 hover_color = (200, 200, 200),
+                 text_color = (0, 0, 0),
+                 border_color = (200, 200, 200),
+                 border_width = 2,
                  font_size: int = 20,
                  font_family: str = "Arial",
-                 centered: bool = False) -> None:
+                 centered = False) -> None:
         """
-        Create a button element
-        :param position: Where the button will be positioned
-        :param width: Width of the button
-        :param height: Height of the button
-        :param label: Text of the button
-        :param color: Color of the button
-        :param hover_color: Color of the button when hovered
-        :param click_color: Color of the button when clicked
-        :param font_size: Size of the font
-        :param font_family: Font family of the text
-        :param centered: If the button will be centered in the position
+        Create a virtual table element
+        :param position: Where the table will be positioned
+        :param content: 2D list of strings representing the table data
+        :param width: Width of the visible part of the table
+        :param height: Height of the visible part of the table
+        :param row_height: Height of each row in pixels
+        :param scroll_speed: Pixels scrolled for each step of the mouse wheel
+        :param color: Background color of the cells
+        :param hover_color: Background color of the cell under the mouse
+        :param text_color: Color of the text in cells
+        :param border_color: Color of the cell borders, set to None to disable the borders
+        :param border_width: Width of the cell borders
+        :param font_size: Size of the text font
+        :param font_family: Font family used for text
+        :param centered: If True, the table is centered on the provided position
         """
+        super().__init__(position, width, height, color, centered=centered)
 
-        super().__init__(position, width, height, color, border_radius, border_color, border_width, centered)
+        # Table attributes
+        self._content = content
+        self._columns = len(content[0]) if content else 0
+        self._rows = len(content)
+        self._row_height = row_height
+        self._cell_color = color
+        self._cell_color_hover = hover_color
+        self._text_color = text_color
+        self._border_color = border_color
+        self._border_width = border_width
+        self._font_family = font_family
+        self._font_size = font_size
 
-        self._text_object = Text(
-            position=self._rect.center,
-            content=label,
-            color=text_color,
-            font_size=font_size,
-            font_family=font_family,
-            width=width,
-            height=height,
-            centered=True # Center the text in the button
-        )
+        # Scrolling
+        self._scroll_offset = 0
+        self._scroll_speed = scroll_speed
 
-        # Button attributes
-        self._label = label
-        self._color = color
-        self._hover_color = hover_color
-        self._click_color = click_color
+        # The cell under the mouse as (row, column), None if no cell is hovered
+        self._hovered_cell = None
 
-        # Border attributes
-        self._border_color = border_color # Color of the border, set to None to disable the border
-        self._border_width = border_width
-        self._border_radius = border_radius
+        # Drawing, the surface is reused and only redrawn when something visible changed
+        self._surface = pygame.Surface(self._rect.size)
+        _counters["surface_allocations"] += 1
+        self._needs_redraw = True
 
-        # Text attributes
-        self._text_color = text_color
-        self._text_hover_color = text_hover_color
-        self._text_click_color = text_click_color
+    """
+    Setters
+    """
 
-        # States
-        self._hovered = False
+    def set_content(self, content: list[list[str]]) -> None:
+        """
+        Set the content of the table, the scroll offset is kept inside the new content
+        :param content: list[list[str]] with the new content
+        :return: None
+        """
+        self._content = content
+        self._columns = len(content[0]) if content else 0
+        self._rows = len(content)
+        self.set_scroll(self._scroll_offset)
+        self._needs_redraw = True
+        self._mark_dirty()
+
+    def set_scroll(self, offset: int) -> None:
+        """
+        Set the vertical scroll offset of the table
+        :param offset: int with the offset in pixels from the first row, clamped to the content
+        :return: None
+        """
+        offset = max(0, min(int(offset), self.get_max_scroll()))
+        if offset == self._scroll_offset:
+            return
+
+        self._scroll_offset = offset
+        self._needs_redraw = True
+        self._mark_dirty()
+
+    def set_size(self, size: tuple[int, int]) -> None:
+        """
+        Set the size of the visible part of the table
+        :param size: tuple[int, int] with the new width and height
+        :return: None
+        """
+        size = (int(size[0]), int(size[1]))
+        if size == self._rect.size:
+            return
+
+        super().set_size(size)
+        self._surface = pygame.Surface(self._rect.size)
+        _counters["surface_allocations"] += 1
+        self._needs_redraw = True
+        self.set_scroll(self._scroll_offset)
+
+    def set_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Set the color of the cells
+        :param color: tuple[int, int, int] with the new color
+        :return: None
+        """
+        super().set_color(color)
+        self._cell_color = color
+        self._needs_redraw = True
+
+    def scroll(self, amount: int) -> None:
+        """
+        Scroll the table
+        :param amount: int with the number of pixels to scroll, positive values scroll down
+        :return: None
+        """
+        self.set_scroll(self._scroll_offset + amount)
+
+    def scroll_to_row(self, row: int) -> None:
+        """
+        Scroll the table so the given row is at the top of the viewport
+        :param row: int with the index of the row
+        :return: None
+        """
+        self.set_scroll(row * self._row_height)
 
     """
-    Setters
+    Getters
     """
 
-    def move(self, x: int, y: int) -> None:
+    def get_content(self) -> list[list[str]]:
         """
-        Move the position of the elment by x, y value
-        (Note moving has no effect when animating)
-        :param x: int for movement in x direction
-        :param y: int for movement in y direction
+        Get the content of the table
+        :return: list[list[str]] with the content
         """
-        super().move(x, y)
-        if self._centered:
-            # Update text element
-            self._text_object._rect.centerx += x
-            self._text_object._rect.centery += y
-        else:
-            # Update text element
-            self._text_object._rect.x += x
-            self._text_object._rect.y += y
+        return self._content
 
-    def set_label(self, label: str) -> None:
+    def get_scroll(self) -> int:
         """
-        Set the text of the button
-        :param label: Text to display on the button
-        :return: None
+        Get the vertical scroll offset of the table
+        :return: int with the offset in pixels
         """
-        self._label = label
-        self._text_object.set_content(label)
+        return self._scroll_offset
 
-    def set_color(self, color: tuple[int, int, int]) -> None:
+    def get_max_scroll(self) -> int:
         """
-        Set the background color of the button
-        :param color: tuple[int, int, int] with the new color
+        Get the largest possible scroll offset
+        :return: int with the offset in pixels
         """
-        self._color = color
+        return max(0, self._rows * self._row_height - self._rect.height)
 
-    def set_hover_color(self, color: tuple[int, int, int]) -> None:
+    def get_visible_rows(self) -> range:
         """
-        Set the hover color of the button
-        :param color: tuple[int, int, int]
+        Get the indexes of the rows that are at least partially visible
+        :return: range with the row indexes
         """
-        self._hover_color = color
+        first = self._scroll_offset // self._row_height
+        last = -(-(self._scroll_offset + self._rect.height) // self._row_height)
+        return range(first, min(last, self._rows))
 
-    def set_click_color(self, color: tuple[int, int, int]) -> None:
+    def get_hovered_cell(self) -> tuple[int, int]:
         """
-        Set the click color of the button
-        :param color: tuple[int, int, int]
+        Get the cell under the mouse
+        :return: tuple with the (row, column) of the cell, None if no cell is hovered
         """
-        self._click_color = color
+        return self._hovered_cell
 
-    def set_text_color(self, color: tuple[int, int, int]) -> None:
+    """
+    Internal methods
+    """
+
+    def _get_tween_properties(self) -> dict:
         """
-        Set the text color of the button
-        :param color: tuple[int, int, int]
+        Get the properties that can be animated with tween, the table is drawn without rounded corners
+        :return: dict with the property name as key and a tuple of (getter, setter, rounding step) as value
         """
-        self._text_color = color
-        self._text_object.set_color(color)
+        properties = super()._get_tween_properties()
+        del properties["border_radius"]
+        return properties
 
-    def set_text_hover_color(self, color: tuple[int, int, int]) -> None:
+    def _get_cell_at(self, position: tuple[int, int]) -> tuple[int, int]:
         """
-        Set the hover color of the text
-        :param color: tuple[int, int, int]
+        Get the cell at a screen position
+        :param position: tuple[int, int] with the screen position
+        :return: tuple with the (row, column) of the cell, None if there is no cell at the position
         """
-        self._text_hover_color = color
+        if not self._columns or not self._rect.collidepoint(position):
+            return None
 
-    def set_text_click_color(self, color: tuple[int, int, int]) -> None:
+        row = (position[1] - self._rect.y + self._scroll_offset) // self._row_height
+        # Same cell width as _render, the pixels left over on the right belong to the last column
+        cell_width = max(self._rect.width // self._columns, 1)
+        column = min((position[0] - self._rect.x) // cell_width, self._columns - 1)
+
+        if row >= self._rows:
+            return None
+
+        return row, column
+
+    def _render(self) -> None:
         """
-        Set the color of the text when the button is clicked
-        :param color: RGB tuple (r, g, b) for the text color when clicked
+        Render the visible rows into the table surface
         :return: None
         """
-        self._text_click_color = color
+        self._surface.fill(self._cell_color)
+
+        if not self._columns:
+            return
+
+        cell_width = self._rect.width // self._columns
+        font_key = (self._font_family, self._font_size, False, False)
+
+        for row in self.get_visible_rows():
+            y = row * self._row_height - self._scroll_offset
+            for column in range(self._columns):
+                cell_rect = pygame.Rect(column * cell_width, y, cell_width, self._row_height)
+
+                if self._hovered_cell == (row, column):
+                    pygame.draw.rect(self._surface, self._cell_color_hover, cell_rect)
+
+                text_surface = text_surface_cache.render(str(self._content[row][column]), font_key, self._text_color)
+                # Keep long texts inside their cell
+                self._surface.set_clip(cell_rect)
+                self._surface.blit(text_surface, text_surface.get_rect(center=cell_rect.center))
+                self._surface.set_clip(None)
+
+                if self._border_color:
+                    pygame.draw.rect(self._surface, self._border_color, cell_rect, self._border_width)
 
     """
     Basic methods
@@ -1069,775 +4449,1181 @@ class Button(Element):
 
     def draw(self, surface: pygame.Surface) -> None:
         """
-        Draw the button
-        :param surface: pygame.Surface where the button will be drawn
+        Draw the table
+        :param surface: pygame.Surface where the table will be drawn
+        :return: None
         """
-
         if not self._display:
             return
 
-        if any(self._clicked.values()):
-            pygame.draw.rect(surface, self._click_color, self._rect, border_radius=self._border_radius)
-            self._text_object.set_color(self._text_click_color)
-        elif self._hovered:
-            pygame.draw.rect(surface, self._hover_color, self._rect, border_radius=self._border_radius)
-            self._text_object.set_color(self._text_hover_color)
-        else:
-            pygame.draw.rect(surface, self._color, self._rect, border_radius=self._border_radius)
-            self._text_object.set_color(self._text_color)
-
-        self._text_object.draw(surface)
+        if self._needs_redraw:
+            self._render()
+            self._needs_redraw = False
 
-        if self._border_color:
-            pygame.draw.rect(surface, self._border_color, self._rect, width=self._border_width, border_radius=self._border_radius)
+        # The rendered surface belongs to the table, so the alpha is set on it directly
+        self._surface.set_alpha(self._alpha if self._alpha < 255 else None)
+        surface.blit(self._surface, self._rect)
 
-    def update(self,  _=None) -> None:
+    def update(self, events=None) -> None:
         """
-        Update the button,
-        Collects the events and updates the button
+        Update the table, handles hovering and scrolling with the mouse wheel
+        :param events: Optional list of pygame events, mouse wheel events scroll the table when it is hovered
+        :return: None
         """
-        self._text_object.update()
+        super().update()
 
-        # Check if the button is hovered
-        self._hovered = self.is_hovered()
+        hovered = self.is_hovered()
 
-class ProgressBar(Element):
+        if hovered and events:
+            for event in events:
+                if event.type == pygame.MOUSEWHEEL:
+                    self.scroll(-event.y * self._scroll_speed)
+
+        hovered_cell = self._get_cell_at(mouse_state.get_pos()) if hovered else None
+        if hovered_cell != self._hovered_cell:
+            self._hovered_cell = hovered_cell
+            self._needs_redraw = True
+            self._mark_dirty()
+
+class Checkbox(Element):
     """
-    Its a progress bar, innherited from Element class.
+    Checkbox, clickable, it can be checked or unchecked, and it can be disabled or enabled, innherited from Element class.
     """
+    __slots__ = ("_checked", "_disabled", "_mark_color", "_mark_width", "_checked_style", "_unchecked_style", "_mark_surface")
+
+    # Event types passed to update by a UIManager
+    _event_types = ()
+
+    # Mark surfaces shared by every checkbox, keyed by (size, color, mark width, style)
+    # The checkboxes hold the mark they draw, so a surface lives as long as a checkbox uses it
+    _mark_surfaces = weakref.WeakValueDictionary()
+
     def __init__(self,
-                 position: tuple[int, int],
-                 width: int = 200,
+                 position,
+                 width: int = 50,
                  height: int = 50,
-                 progress: int = 0,
-                 max_progress: int = 100,
-                 min_progress: int = 0,
-                 color: tuple[int, int, int] = (150, 255, 150),
-                 background_color: tuple[int, int, int] = (100, 100, 100),
+                 style: Literal["checkmark", "cross", "circle", "square", "none"] = "checkmark",
+                 unchecked_style: Literal["checkmark", "cross", "circle", "square", "none"] ="none",
+                 mark_width: int = 5,
+                 color: tuple[int,int,int] = (100, 255, 100),
+                 background_color: tuple[int,int,int] = (200,200,200),
                  border_radius: int = 0,
-                 border_color: tuple[int, int, int] = (200, 200, 200),
+                 border_color: tuple[int, int, int] = (0, 0, 0),
                  border_width: int = 2,
                  centered: bool = False) -> None:
         """
-        Create a progress element
-        :param position: Where the progress will be positioned
-        :param width: Width of the progress
-        :param height: Height of the progress
-        :param progress: Current progress amount
-        :param max_progress: Maximum progress amount
-        :param min_progress: Minimum progress amount
-        :param color: Color of the progress
-        :param border_radius: Radius of the border
-        :param background_color: Color of the background, set to None to disable the background
-        :param border_color: Color of the border, set to None to disable the border
+        Create a checkbox element
+        :param position: Where the checkbox will be positioned
+        :param width: Width of the checkbox
+        :param height: Height of the checkbox
+        :param style: The style of mark when checked:
+            - "checkmark": A checkmark symbol (✓)
+            - "cross": An X symbol (✗)
+            - "circle": A circle (○)
+            - "square": A square (□)
+            - "none": No mark shown
+        :param unchecked_style: The style of mark when unchecked (same options as style)
+        :param mark_width: Width of the mark lines/borders
+        :param color: Color of the mark
+        :param background_color: Color of the checkbox background
+        :param border_radius: Radius for rounded corners
+        :param border_color: Color of the checkbox border
         :param border_width: Width of the border
-        :param centered: If the progress will be centered in the position
+        :param centered: If True, the checkbox is centered on the provided position
         """
-        super().__init__(position, width, height, color, border_radius, centered=centered)
 
-        # Progress attributes
-        self._progress = progress
-        self._max_progress = max_progress
-        self._min_progress = min_progress
+        super().__init__(position, width, height, background_color, border_radius, border_color, border_width, centered)
 
-        # Progress bar attributes
-        self._progress_bar = pygame.Rect(self._rect.x, self._rect.y, 0, self._rect.height)
-        self._progress_bar_color = color
-        self._progress_bar_width = width
-        self._progress_bar_height = height
-        self._progress_bar_centered = centered
+        self._checked = False
+        self._disabled = False
 
-        # Border attributes
-        self._border_color = border_color
-        self._border_width = border_width
-        self._border_radius = border_radius
+        # Mark attributes, the mark surfaces are shared between checkboxes and built on first use
+        self._mark_color = color
+        self._mark_width = mark_width
 
-        # Background attributes
-        self._background_color = background_color
+        self._checked_style = style
+        self._unchecked_style = unchecked_style
+        # Mark surface drawn last, kept alive while the checkbox uses it
+        self._mark_surface = None
 
     """
     Setters
     """
 
-    def move(self, x: int, y: int) -> None:
+    def set_checked(self, checked: bool) -> None:
         """
-        Move the position of the elment by x, y value
-        (Note moving has no effect when animating)
-        :param x: int for movement in x direction
-        :param y: int for movement in y direction
+        Set the checked state of the checkbox
+        :param checked: bool with the new checked state
         """
-        super().move(x, y)
-        if self._centered:
-            self._progress_bar.centerx += x
-            self._progress_bar.centery += y
+        if checked != self._checked:
+            self._checked = checked
+            self._mark_dirty()
+
+    def disable(self) -> None:
+        """
+        Disable the checkbox, allows the user to click to check it
+        """
+        self._disabled = True
+
+    def enable(self) -> None:
+        """
+        Enable the checkbox, allows the user to click to check it
+        """
+        self._disabled = False
+
+    """
+    Getters
+    """
+
+    def is_checked(self) -> bool:
+        """
+        Get the checked state of the checkbox
+        :return: bool with the checked state
+        """
+        return self._checked
+
+    def is_enabled(self) -> bool:
+        """
+        Get the enabled state of the checkbox
+        :return: bool with the enabled state
+        """
+        return not self._disabled
+
+    """
+    Internal methods
+    """
+
+    @classmethod
+    def _get_mark_surface(cls,
+                          size: tuple[int, int],
+                          color: tuple[int, int, int],
+                          mark_width: int,
+                          style: str) -> pygame.Surface:
+        """
+        Get the surface of a mark, drawing it only the first time it is requested by any checkbox
+        :param size: tuple[int, int] with the width and height of the checkbox
+        :param color: Color of the mark
+        :param mark_width: Width of the mark lines/borders
+        :param style: "checkmark", "cross", "square" or "circle"
+        :return: pygame.Surface with the mark, shared so it must not be drawn on
+        """
+        key = (tuple(size), tuple(color), mark_width, style)
+        mark_surface = cls._mark_surfaces.get(key)
+        if mark_surface is not None:
+            return mark_surface
+
+        width, height = size
+        mark_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        _counters["surface_allocations"] += 1
+        mark_surface.fill((0, 0, 0, 0))
+
+        if style == "checkmark":
+            pygame.draw.line(mark_surface, color, (width//4, height//2), (width//2, height*3//4), mark_width)
+            pygame.draw.line(mark_surface, color, (width//2, height*3//4), (width*3//4, height//4), mark_width)
+        elif style == "cross":
+            pygame.draw.line(mark_surface, color, (width//4, height//4), (width*3//4, height*3//4), mark_width)
+            pygame.draw.line(mark_surface, color, (width//4, height*3//4), (width*3//4, height//4), mark_width)
+        elif style == "square":
+            square_size = min(width, height) * 0.6  # Make square 60% of the smallest dimension
+            square_x = (width - square_size) // 2   # Center horizontally
+            square_y = (height - square_size) // 2  # Center vertically
+            pygame.draw.rect(mark_surface, color, (square_x, square_y, square_size, square_size), mark_width)
+        elif style == "circle":
+            pygame.draw.circle(mark_surface, color, (width//2, height//2), width//3, mark_width)
         else:
-            self._progress_bar.x += x
-            self._progress_bar.y += y
+            raise ValueError(f"Unknown checkbox style: {style}")
 
-    def set_progress(self, progress: int) -> None:
+        cls._mark_surfaces[key] = mark_surface
+        return mark_surface
+
+    """
+    Basic methods
+    """
+
+    def draw(self, surface: pygame.surface) -> None:
         """
-        Set the progress amount
-        :param progress: int with the new progress amount
+        Draw the checkbox
+        :param surface: pygame.Surface where the checkbox will be drawn
         """
-        self._progress = progress
+        if not self._display:
+            return
 
-        if self._progress > self._max_progress:
-            self._progress = self._max_progress
-        elif self._progress < self._min_progress:
-            self._progress = self._min_progress
+        super().draw(surface)
+        # Draw the checkmark
+        style = self._checked_style if self._checked else self._unchecked_style
+        if not style == "none":
+            mark_surface = self._get_mark_surface(self._rect.size, self._mark_color, self._mark_width, style)
+            self._mark_surface = mark_surface
+            surface.blit(self._apply_alpha(mark_surface), self._rect.topleft)
 
-        self._update_progress_bar()
+    def update(self, events=None) -> None:
+        """
+        Update the checkbox state and handle click events
+        :param events: Optional pygame events list, kept for API consistency
+        :return: None
+        """
+        super().update()
 
-    def set_max_progress(self, max_progress: int) -> None:
+        # Check if the checkbox was clicked
+        if self.was_clicked() and not self._disabled:
+            self._checked = not self._checked
+            self._mark_dirty()
+
+class AnimationTicker:
+    """
+    Advances the movement animations of many elements in one batched pass per frame.
+    The running animations are stored in contiguous arrays and evaluated with one vectorized step
+    when NumPy is installed, or with a tight loop over the arrays otherwise.
+    Elements added to the ticker no longer advance their animation in update.
+    """
+    # Fields stored for every running animation, one array per field
+    _FIELDS = ("start_x", "start_y", "end_x", "end_y", "start_time", "duration", "loop", "jump", "start_share")
+
+    def __init__(self) -> None:
         """
-        Set the maximum progress amount
-        :param max_progress: int with the new maximum progress amount
+        Create an animation ticker
         """
-        self._max_progress = max_progress
+        self._elements = []
 
-        self._update_progress_bar()
+        # Arrays of the running animations, rebuilt when an animation starts, stops or changes
+        self._running = []
+        self._arrays = {}
+        self._easing_masks = {}
+        self._needs_rebuild = True
 
-    def set_min_progress(self, min_progress: int) -> None:
+    """
+    Setters
+    """
+
+    def add(self, *elements: Element) -> None:
         """
-        Set the minimum progress amount
-        :param min_progress: int with the new minimum progress amount
+        Let the ticker advance the animations of elements, including animations started later with flow or jump
+        :param elements: The elements to add
+        :return: None
         """
-        self._min_progress = min_progress
-        # Update the progress bar width
-        if self._progress < self._min_progress:
-            self._progress = self._min_progress
+        for element in elements:
+            if element._animation_ticker is self:
+                continue
+            if element._animation_ticker:
+                element._animation_ticker.remove(element)
 
-        self._update_progress_bar()
+            element._animation_ticker = self
+            self._elements.append(element)
+
+        self._needs_rebuild = True
+
+    def remove(self, element: Element) -> None:
+        """
+        Give an element back its own animation updates
+        :param element: The element to remove
+        :return: None
+        """
+        self._elements.remove(element)
+        element._animation_ticker = None
+        self._needs_rebuild = True
 
-    def change_progress(self, amount: float) -> None:
+    def refresh(self) -> None:
         """
-        Change the progress amount
-        :param amount: Float or int with the amount to change the progress by
+        Rebuild the arrays on the next tick, called by the elements when an animation starts, pauses or resumes
         :return: None
         """
-        self._progress += amount
-
-        self.set_progress(self._progress)
+        self._needs_rebuild = True
 
     """
     Getters
     """
 
-    def get_progress(self) -> int:
+    def get_elements(self) -> list[Element]:
         """
-        Get the progress amount
-        :return: int with the progress amount
+        Get the elements advanced by the ticker
+        :return: list[Element]
         """
-        return self._progress
+        return self._elements
+
+    def get_running_count(self) -> int:
+        """
+        Get the number of running animations
+        :return: int with the count
+        """
+        if self._needs_rebuild:
+            self._rebuild()
+        return len(self._running)
 
     """
     Internal methods
     """
 
-    def _update_progress_bar(self) -> None:
+    def _rebuild(self) -> None:
         """
-        Update the progress bar width
+        Copy the parameters of the running animations into contiguous arrays
         :return: None
         """
-        self._progress_bar.width = int(self._rect.width * (self._progress / self._max_progress))
+        self._running = [element for element in self._elements
+                         if element._is_being_animated and element._animation]
+        self._arrays = {field: array("d") for field in self._FIELDS}
+        easings = []
+
+        for element in self._running:
+            animation = element._animation
+            values = (animation._start_position[0], animation._start_position[1],
+                      animation._end_position[0], animation._end_position[1],
+                      animation._start_time, animation._duration,
+                      animation._loop, animation._style == "jump",
+                      0.5 * animation._ratio * animation._duration)
+            for field, value in zip(self._FIELDS, values):
+                self._arrays[field].append(value)
+            easings.append(animation._easing)
+
+        self._easing_masks = {}
+        if numpy is not None:
+            # Views on the same memory, no copy is made
+            self._arrays = {field: numpy.frombuffer(values, dtype=numpy.float64) if len(values) else numpy.zeros(0)
+                            for field, values in self._arrays.items()}
+            easings = numpy.array(easings, dtype=object)
+            for easing in set(easings):
+                self._easing_masks[easing] = easings == easing
+        else:
+            self._easing_masks = easings
+
+        self._needs_rebuild = False
+
+    def _advance_vectorized(self, now: float) -> tuple:
+        """
+        Evaluate every running animation with NumPy
+        :param now: The current time in milliseconds
+        :return: tuple with the x positions, y positions and finished flags
+        """
+        a = self._arrays
+        elapsed = numpy.maximum(now - a["start_time"], 0)
+        duration = a["duration"]
+        loop = a["loop"] > 0
+        jump = a["jump"] > 0
+
+        # Flow, looping animations go to the end position and back again
+        phase = elapsed % (2 * duration) / duration
+        progress = numpy.where(loop, numpy.where(phase <= 1, phase, 2 - phase), numpy.minimum(elapsed / duration, 1))
+        for easing, mask in self._easing_masks.items():
+            if easing != "linear":
+                progress[mask] = EASINGS[easing](progress[mask])
+
+        # Jump, the back and forth cycle of looping animations is start, end, end, start
+        start_share = a["start_share"]
+        loop_phase = elapsed % (2 * duration)
+        at_start = numpy.where(loop,
+                               (loop_phase < start_share) | (loop_phase >= 2 * duration - start_share),
+                               (elapsed < start_share) & (elapsed < duration))
+        progress = numpy.where(jump, numpy.where(at_start, 0.0, 1.0), progress)
+
+        x = a["start_x"] + (a["end_x"] - a["start_x"]) * progress
+        y = a["start_y"] + (a["end_y"] - a["start_y"]) * progress
+        finished = ~loop & (elapsed >= duration)
+
+        return x.tolist(), y.tolist(), finished.tolist()
+
+    def _advance_loop(self, now: float) -> tuple:
+        """
+        Evaluate every running animation with a loop over the arrays, used when NumPy is not installed
+        :param now: The current time in milliseconds
+        :return: tuple with the x positions, y positions and finished flags
+        """
+        a = self._arrays
+        xs, ys, finished = [], [], []
+
+        for i, easing in enumerate(self._easing_masks):
+            elapsed = max(now - a["start_time"][i], 0)
+            duration = a["duration"][i]
+            loop = a["loop"][i]
+
+            if a["jump"][i]:
+                start_share = a["start_share"][i]
+                if loop:
+                    loop_phase = elapsed % (2 * duration)
+                    at_start = loop_phase < start_share or loop_phase >= 2 * duration - start_share
+                else:
+                    at_start = elapsed < start_share and elapsed < duration
+                progress = 0.0 if at_start else 1.0
+            elif loop:
+                phase = elapsed % (2 * duration) / duration
+                progress = EASINGS[easing](phase if phase <= 1 else 2 - phase)
+            else:
+                progress = EASINGS[easing](min(elapsed / duration, 1))
+
+            xs.append(a["start_x"][i] + (a["end_x"][i] - a["start_x"][i]) * progress)
+            ys.append(a["start_y"][i] + (a["end_y"][i] - a["start_y"][i]) * progress)
+            finished.append(not loop and elapsed >= duration)
+
+        return xs, ys, finished
 
     """
     Basic methods
     """
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """"
-        Draw the progress bar
-        :param surface: pygame.Surface where the progress bar will be drawn
+    def tick(self, now: float = None) -> None:
+        """
+        Advance every running animation and move the elements, call once per frame
+        :param now: The current time in milliseconds, defaults to now
         :return: None
         """
-        if not self._display:
+        if self._needs_rebuild:
+            self._rebuild()
+
+        if not self._running:
             return
 
-        # Draw the background
-        if self._background_color:
-            pygame.draw.rect(surface, self._background_color, self._rect, border_radius=self._border_radius)
-        # Draw the progress bar
-        pygame.draw.rect(surface, self._progress_bar_color, self._progress_bar, border_radius=self._border_radius)
-        # Draw the border
-        if self._border_color:
-            pygame.draw.rect(surface, self._border_color, self._rect, self._border_width, border_radius=self._border_radius)
+        if now is None:
+            now = _get_ticks()
 
-    def update(self, events=None) -> None:
-        """
-        Update the progress bar state
-        :param events: Optional list of pygame events (not used in ProgressBar class but included for API consistency)
-        :return: None
-        """
-        super().update()
-        self._update_progress_bar()
+        if numpy is not None:
+            xs, ys, finished = self._advance_vectorized(now)
+        else:
+            xs, ys, finished = self._advance_loop(now)
 
-class DropdownMenu(Element):
+        any_finished = False
+        for element, x, y, done in zip(self._running, xs, ys, finished):
+            element.set_position((x, y))
+            if done:
+                element._is_being_animated = False
+                any_finished = True
+
+        if any_finished:
+            self._needs_rebuild = True
+
+class SpatialGrid:
     """
-    Dropdown menu element for displaying a list of options, innherited from Element class.
-    Aggrigates a Button object to display the dropdown items.
+    Uniform grid spatial index for finding the element under a point without testing every element.
+    Each element is stored in the grid cells its rect overlaps, so a point query only tests
+    the few elements sharing the cell of the point.
     """
-    def __init__(self,
-                 position: tuple[int, int],
-                 options: list[str],
-                 width: int = 200,
-                 height: int = 50,
-                 on_change: callable = None,
-                 element_width: int = 200,
-                 element_height: int = 50,
-                 element_spacing: int = 2,
-                 max_elements_per_column: int = 5,
-                 wrap_reverse: bool = False,
-                 color = (255, 255, 255),
-                 hover_color = (200, 200, 200),
-                 click_color = (150, 150, 150),
-                 font_size = 20,
-                 font_family = "Arial",
-                 text_color = (0, 0, 0),
-                 text_hover_color = (0, 0, 0),
-                 text_click_color = (0, 0, 0),
-                 selected_option_color = (200, 200, 200),
-                 selected_option_hover_color = (150, 150, 150),
-                 selected_option_click_color = (100, 100, 100),
-                 selected_option_text_color = (0, 0, 0),
-                 selected_option_text_hover_color = (0, 0, 0),
-                 selected_option_text_click_color = (0, 0, 0),
-                 border_radius = 0,
-                 centered = False) -> None:
+    def __init__(self, cell_size: int = 64) -> None:
         """
-        Create a dropdown menu element
-        :param position: Where the dropdown menu will be positioned
-        :param options: List of options to be displayed in the dropdown menu
-        :param width: Width of the dropdown menu
-        :param height: Height of the dropdown menu
-        :param on_change: Function to be called when the selected option changes
-        :param element_width: Width of each option button in the dropdown
-        :param element_height: Height of each option button in the dropdown
-        :param element_spacing: Spacing between option buttons
-        :param max_elements_per_column: Maximum number of options per column before wrapping
-        :param wrap_reverse: If True, wraps options in reverse order
-        :param color: Default background color of the option buttons
-        :param hover_color: Background color when an option is hovered over
-        :param click_color: Background color when an option is clicked
-        :param font_size: Size of the text font
-        :param font_family: Font family used for text
-        :param text_color: Default text color
-        :param text_hover_color: Text color when hovered over
-        :param text_click_color: Text color when clicked
-        :param selected_option_color: Background color of the main button
-        :param selected_option_hover_color: Background color of the main button when hovered
-        :param selected_option_click_color: Background color of the main button when clicked
-        :param selected_option_text_color: Text color of the main button
-        :param selected_option_text_hover_color: Text color of the main button when hovered
-        :param selected_option_text_click_color: Text color of the main button when clicked
-        :param border_radius: Radius for rounded corners
-        :param centered: If True, the dropdown is centered on the provided position
+        Create a spatial grid
+        :param cell_size: Width and height of the grid cells in pixels
         """
-
-        super().__init__(position, width, height, color, border_radius, centered=centered)
-
-        # Visuals
-        self._color = color
-        self._hover_color = hover_color
-        self._click_color = click_color
-        self._text_color = text_color
-        self._text_color_hover = text_hover_color
-        self._text_color_click = text_click_color
-
-        self._onchange = on_change
-
-        self._font_size = font_size
-        self._font_family = font_family
-
-        self._selected_option_color = selected_option_color
-        self._selected_option_text_color = selected_option_text_color
-        self._selected_option_hover_color = selected_option_hover_color
-        self._selected_option_click_color = selected_option_text_color
-        self._selected_option_text_hover_color = selected_option_text_hover_color
-        self._selected_option_text_click_color = selected_option_text_click_color
-
-        self._border_radius = border_radius
-
-        self._element_width = element_width
-        self._element_height = element_height
-        self._element_spacing = element_spacing
-
-        # Drop down menu attributes
-        self._options = options
-        self._selected_option_index = 0
-        self._wrap_direction = -1 if wrap_reverse else 1
-        self._max_elements_per_column = max_elements_per_column
-        self._options_buttons = self._generate_options_buttons()
-        self._selected_button = self._generate_selected_button()
-        self._is_open = False
+        self._cell_size = cell_size
+        # Grid cell (column, row) -> set of elements overlapping the cell
+        self._cells = {}
+        # Element -> (cells it is stored in, rect it was stored with, z order)
+        self._entries = {}
+        self._next_z = 0
+        # Element under the last queried mouse position, queried again when the position or the index changes
+        self._hover_position = None
+        self._hovered = None
 
     """
     Setters
     """
 
-    def move(self, x: int, y: int) -> None:
+    def insert(self, element: Element) -> None:
         """
-        Move the position of the elment by x, y value
-        (Note moving has no effect when animating)
-        :param x: int for movement in x direction
-        :param y: int for movement in y direction
+        Add an element on top of the elements already in the index
+        :param element: The element to add
+        :return: None
         """
-        super().move(x, y)
-        for button in self._options_buttons:
-            button.move(x, y)
-        self._selected_button.move(x,y)
+        if element in self._entries:
+            self.remove(element)
 
-    def set_options(self, options: list[str]) -> None:
+        cells = self._get_cells(element._rect)
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(element)
+
+        self._entries[element] = (cells, element._rect.copy(), self._next_z)
+        self._next_z += 1
+        self._hover_position = None
+
+    def remove(self, element: Element) -> None:
         """
-        Set the options of the drop down menu
-        :param options: list[str] with the new options
+        Remove an element from the index
+        :param element: The element to remove
         :return: None
         """
-        self._options = options
-        self._selected_option_index = 0
-        self._options_buttons = self._generate_options_buttons()
-        self._selected_button = self._generate_selected_button()
+        cells, _, _ = self._entries.pop(element)
+        self._remove_from_cells(element, cells)
+        self._hover_position = None
 
-    def set_selected_option(self, option: str) -> None:
+    def update(self, element: Element) -> None:
         """
-        Set the selected option of the drop down menu
-        :param selected_option: str with the new selected option
+        Move an element to the cells of its current rect, keeping its z order
+        :param element: The element that moved or changed size
         :return: None
         """
-        if option not in self._options:
-            raise ValueError("Selected option is not in the options list")
+        cells, rect, z = self._entries[element]
+        if rect == element._rect:
+            return
 
-        self._selected_option_index = self._options.index(option)
-        self._selected_button = self._generate_selected_button()
+        new_cells = self._get_cells(element._rect)
+        if new_cells != cells:
+            self._remove_from_cells(element, cells)
+            for cell in new_cells:
+                self._cells.setdefault(cell, set()).add(element)
 
-    def set_selected_index(self, index: int) -> None:
+        self._entries[element] = (new_cells, element._rect.copy(), z)
+        self._hover_position = None
+
+    def clear(self) -> None:
         """
-        Set the selected option of the drop down menu
-        :param selected_option_index: int with the new selected option index
+        Remove every element from the index
         :return: None
         """
-        if index < 0 or index >= len(self._options):
-            raise ValueError("Selected option index is out of range")
+        self._cells.clear()
+        self._entries.clear()
+        self._next_z = 0
+        self._hover_position = None
 
-        self._selected_option_index = index
-        self._selected_button = self._generate_selected_button()
+    def invalidate(self) -> None:
+        """
+        Query the hovered element again on the next call, for example after an element was shown or hidden
+        :return: None
+        """
+        self._hover_position = None
 
     """
     Getters
     """
 
-    def get_selected_option(self) -> str:
+    def query_point(self, position: tuple[int, int]) -> Element:
         """
-        Get the selected option
-        :return: str with the selected option
+        Get the top-most displayed element containing a point
+        :param position: tuple[int, int] with the point
+        :return: Element under the point, None if there is none
         """
-        return self._options[self._selected_option_index]
+        candidates = self._cells.get((position[0] // self._cell_size, position[1] // self._cell_size))
+        if not candidates:
+            return None
 
-    def get_selected_index(self) -> int:
-        """
-        Get the selected option index
-        :return: int with the selected option index
-        """
-        return self._selected_option_index
+        top_element = None
+        top_z = -1
+        for element in candidates:
+            if not element._display or not element._rect.collidepoint(position):
+                continue
 
-    def get_options(self) -> list[str]:
+            z = self._entries[element][2]
+            if z > top_z:
+                top_element, top_z = element, z
+
+        return top_element
+
+    def query_hovered(self, position: tuple[int, int]) -> Element:
         """
-        Get the options of the drop down menu
-        :return: list[str] with the options
+        Get the top-most displayed element under the mouse, the point is only queried again
+        when the mouse moves or the index changes, so every element can check it every frame
+        :param position: tuple[int, int] with the mouse position
+        :return: Element under the mouse, None if there is none
         """
-        return self._options
+        position = tuple(position)
+        if position != self._hover_position:
+            self._hovered = self.query_point(position)
+            self._hover_position = position
+
+        return self._hovered
 
     """
     Internal methods
     """
 
-    def _generate_selected_button(self) -> Button:
+    def _get_cells(self, rect: pygame.Rect) -> tuple[tuple[int, int], ...]:
         """
-        Return a button with the selected option
-        :return: Button with the selected option
+        Get the grid cells a rect overlaps
+        :param rect: pygame.Rect to look up
+        :return: tuple with the (column, row) of every overlapped cell
         """
-        selected_button = Button((self._rect.x, self._rect.y),
-                                 self._rect.width, self._rect.height,
-                                 label=str(self._options[self._selected_option_index]),
-                                 color=self._selected_option_color,
-                                 hover_color=self._selected_option_hover_color,
-                                 click_color=self._selected_option_click_color,
-                                 text_color=self._selected_option_text_color,
-                                 text_click_color=self._selected_option_text_click_color,
-                                 text_hover_color=self._selected_option_text_hover_color,
-                                 border_radius=self._border_radius)
+        size = self._cell_size
+        return tuple((column, row)
+                     for column in range(rect.left // size, (rect.right - 1) // size + 1)
+                     for row in range(rect.top // size, (rect.bottom - 1) // size + 1))
 
-        return selected_button
-
-    def _generate_options_buttons(self) -> list[Button]:
+    def _remove_from_cells(self, element: Element, cells: tuple[tuple[int, int], ...]) -> None:
         """
-        Generate the buttons for the options
-        :return: list of buttons with the options
+        Remove an element from grid cells, dropping cells that become empty
+        :param element: The element to remove
+        :param cells: The cells to remove it from
+        :return: None
         """
-        options_buttons = []
-
-        for index, label in enumerate(self._options):
-            multiplier_x = index // self._max_elements_per_column
-            offset_x = self._element_spacing + self._element_width * multiplier_x * self._wrap_direction + self._element_spacing * (multiplier_x-1)
-
-            multiplier_y = index - index // self._max_elements_per_column * self._max_elements_per_column
-            offset_y = self._rect.height + self._element_height * multiplier_y + self._element_spacing * (multiplier_y+1)
-
-            x_cordinate = self._rect.x + offset_x
-            y_cordinate = self._rect.y + offset_y
-
-            button = Button((x_cordinate, y_cordinate),
-                            self._element_width, self._element_height,
-                            label=str(label),
-                            color=self._color,
-                            hover_color=self._hover_color,
-                            click_color=self._click_color,
-                            text_color=self._text_color,
-                            text_click_color=self._text_color_click,
-                            text_hover_color=self._text_color_hover,
-                            font_family=self._font_family,
-                            font_size=self._font_size,
-                            border_radius=self._border_radius)
-
-            options_buttons.append(button)
-
-        return options_buttons
+        for cell in cells:
+            elements = self._cells[cell]
+            elements.discard(element)
+            if not elements:
+                del self._cells[cell]
 
+class DirtyRectManager:
     """
-    Basic methods
+    Collects the areas of the screen that changed since the last frame, so only those have to be redrawn
+    and passed to pygame.display.update instead of redrawing and flipping the whole screen.
     """
-
-    def draw(self, surface: pygame.Surface) -> None:
+    def __init__(self,
+                 elements: list[Element] = None,
+                 background: tuple[int, int, int] = (0, 0, 0)) -> None:
         """
-        Draw the drop down menu
-        :param surface: pygame.Surface where the drop down menu will be drawn
-        :return: None
+        Create a dirty rect manager
+        :param elements: Elements to manage, drawn in the given order
+        :param background: Color or surface drawn behind the elements where the screen is redrawn
         """
+        self._elements = list(elements) if elements else []
+        self._background = background
+        # Areas of removed elements, redrawn on the next draw
+        self._removed_rects = []
+        # The first draw has to cover the whole screen
+        self._full_redraw = True
 
-        if not self._display:
-            return
-
-        self._selected_button.draw(surface)
-
-        if self._is_open:
-            for button in self._options_buttons:
-                button.draw(surface)
+    """
+    Setters
+    """
 
-    def update(self, _=None) -> None:
+    def add(self, *elements: Element) -> None:
         """
-        Update the drop down menu
+        Add elements to the manager, they are drawn on top of the elements already added
+        :param elements: The elements to add
         :return: None
         """
-        super().update()
-
-        # If the menu is being animated, update the buttons so they are in the right position
-        if self._is_being_animated:
-            self._options_buttons = self._generate_options_buttons()
-            self._selected_button = self._generate_selected_button()
-
-        # Update the buttons
-        self._selected_button.update()
-        for button in self._options_buttons:
-            button.update()
-
-        if self._is_open:
-            # Check if any of the buttons were clicked, if so, set the selected option to the clicked button
-            for button in self._options_buttons:
-                if button.was_clicked():
-                    self._selected_option_index = self._options_buttons.index(button)
-                    self._selected_button = self._generate_selected_button()
-                    # Close the menu after selecting an option
-                    self._is_open = False
-
-                    if self._onchange:
-                        self._onchange()
-                    return
-
-            if self._selected_button.was_clicked():
-                self._is_open = False
-                return
+        for element in elements:
+            self._elements.append(element)
+            element._mark_dirty()
 
-            # Check if the menu was clicked outside, if so, close it
-            if pygame.mouse.get_pressed()[0] == 1 and not self.is_clicked():
-                # Check that we haven't clicked any other button from the menu
-                for button in self._options_buttons:
-                    if button.is_hovered():
-                        return
+    def remove(self, element: Element) -> None:
+        """
+        Remove an element from the manager, the area it covered is redrawn on the next draw
+        :param element: The element to remove
+        :return: None
+        """
+        self._elements.remove(element)
+        if element._last_drawn_rect:
+            self._removed_rects.append(element._last_drawn_rect)
 
-                self._is_open = False
-                return
+    def set_background(self, background: tuple[int, int, int]) -> None:
+        """
+        Set what is drawn behind the elements, the whole screen is redrawn on the next draw
+        :param background: Color or surface
+        :return: None
+        """
+        self._background = background
+        self._full_redraw = True
 
-        # Check if the menu was clicked, if so, open it
-        if self._selected_button.was_clicked():
-            self._is_open = True
+    def invalidate(self) -> None:
+        """
+        Redraw the whole screen on the next draw, for example after the window was resized
+        :return: None
+        """
+        self._full_redraw = True
 
-class Table(Element):
     """
-    Table element for displaying a grid of data, innherited from Element class.
-    Aggrigates a Button object to display the table cells.
+    Getters
     """
-    def __init__(self,
-                 position,
-                 content: list[list[str]],
-                 width = 200,
-                 height = 50,
-                 color = (255, 255, 255),
-                 hover_color = (200, 200, 200),
-                 text_color = (0, 0, 0),
-                 border_color = (200, 200, 200),
-                 border_width = 2,
-                 border_radius = 0,
-                 centered = False) -> None:
+
+    def get_elements(self) -> list[Element]:
         """
-        Create a table element
-        :param position: Where the table will be positioned
-        :param content: 2D list of strings representing the table data
-        :param width: Width of the entire table
-        :param height: Height of the entire table
-        :param color: Background color of the cells
-        :param hover_color: Background color of the cells when hovered
-        :param text_color: Color of the text in cells
-        :param border_color: Color of the cell borders
-        :param border_width: Width of the cell borders
-        :param border_radius: Radius for rounded corners of cells
-        :param centered: If True, the table is centered on the provided position
+        Get the managed elements
+        :return: list[Element] in drawing order
         """
-        super().__init__(position, width, height, color, border_radius, centered=centered)
-
-        # Table attributes
-        self._content = content
-        self._columns = len(content[0])
-        self._rows = len(content)
-        self._cell_width = width // self._columns
-        self._cell_height = height // self._rows
-        self._cell_color = color
-        self._cell_color_hover = hover_color
-
-        self._text_color = text_color
+        return self._elements
 
-        self._border_color = border_color
-        self._border_width = border_width
+    def collect_dirty_rects(self) -> list[pygame.Rect]:
+        """
+        Collect the dirty areas of every element and merge the overlapping ones
+        :return: list[pygame.Rect] with the areas that changed since the last call
+        """
+        dirty_rects = self._removed_rects
+        self._removed_rects = []
+        for element in self._elements:
+            dirty_rects += element.pop_dirty_rects()
 
-        # Drawing
-        self._items = self._generate_table()
+        return self._merge_rects(dirty_rects)
 
     """
-    Setters
+    Internal methods
     """
 
-    def move(self, x: int, y: int) -> None:
+    @staticmethod
+    def _merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
         """
-        Move the position of the elment by x, y value
-        (Note moving has no effect when animating)
-        :param x: int for movement in x direction
-        :param y: int for movement in y direction
+        Merge overlapping rects into their union until no rects overlap
+        :param rects: list[pygame.Rect] to merge
+        :return: list[pygame.Rect] without overlapping rects
         """
-        super().move(x, y)
-        for button in self._items:
-            button.move(x, y)
+        merged = []
+        for rect in rects:
+            rect = rect.copy()
+            index = rect.collidelist(merged)
+            # Growing a rect can make it overlap rects that were already merged
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
 
-    def set_content(self, content: list[list[str]]) -> None:
+        return merged
+
+    def _draw_background(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
         """
-        Set the content of the table
-        :param content: list[list[str]] with the new content
+        Draw the background in an area of the surface
+        :param surface: pygame.Surface to draw on
+        :param rect: pygame.Rect with the area
         :return: None
         """
-        self._content = content
-        self._columns = len(content[0])
-        self._rows = len(content)
-        self._items = self._generate_table()
+        if isinstance(self._background, pygame.Surface):
+            surface.blit(self._background, rect, rect)
+        else:
+            surface.fill(self._background, rect)
 
     """
-    Internal methods
+    Basic methods
     """
 
-    def _generate_table(self) -> None:
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
         """
-        Generate the table
-        :return: None
+        Redraw the areas that changed since the last draw
+        Pass the returned rects to pygame.display.update instead of calling pygame.display.flip
+        :param surface: pygame.Surface where the elements will be drawn, usually the screen
+        :return: list[pygame.Rect] with the areas that were redrawn
         """
-        items_to_draw = []
+        dirty_rects = self.collect_dirty_rects()
 
-        self._cell_width = self._rect.width // self._columns
-        self._cell_height = self._rect.height // self._rows
+        if self._full_redraw:
+            self._full_redraw = False
+            dirty_rects = [surface.get_rect()]
 
-        for row in range(self._rows):
-            for column in range(self._columns):
-                x = self._rect.x + column * self._cell_width
-                y = self._rect.y + row * self._cell_height
+        for rect in dirty_rects:
+            surface.set_clip(rect)
+            self._draw_background(surface, rect)
+            for element in self._elements:
+                if element._last_drawn_rect and element._last_drawn_rect.colliderect(rect):
+                    element.draw(surface)
+        surface.set_clip(None)
 
-                # Draw the text in the cell
-                cell = Button((x, y), label=str(self._content[row][column]), width=self._cell_width, height=self._cell_height, color=self._cell_color, border_radius=self._border_radius, border_color=self._border_color, border_width=self._border_width, text_color=self._text_color, hover_color=self._cell_color_hover)
-                items_to_draw.append(cell)
+        return dirty_rects
 
-        return items_to_draw
+class UIManager(DirtyRectManager):
+    """
+    Container that updates and draws its elements in one pass, innherited from DirtyRectManager class.
+    The mouse is read once per frame, and each element only receives the event types it handles
+    (see the _event_types class attribute of the elements).
+    """
+    def __init__(self,
+                 elements: list[Element] = None,
+                 background: tuple[int, int, int] = (0, 0, 0),
+                 dirty_rects: bool = True) -> None:
+        """
+        Create a UI manager
+        :param elements: Elements to manage, updated and drawn in the given order
+        :param background: Color or surface drawn behind the elements where the screen is redrawn
+        :param dirty_rects: If True, draw only redraws the areas that changed, otherwise every element is drawn every frame
+        """
+        super().__init__(elements, background)
+
+        self._use_dirty_rects = dirty_rects
+
+        # Spatial index used to find the element under the mouse
+        self._spatial_index = SpatialGrid()
+        for element in self._elements:
+            self._add_to_spatial_index(element)
+
+        # Timing of the last frame
+        self._frame_stats = {
+            "update_ms": 0.0,
+            "draw_ms": 0.0,
+            "elements": 0,
+            "events": 0,
+            "dirty_rects": 0,
+        }
 
     """
-    Basic methods
+    Setters
     """
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def add(self, *elements: Element) -> None:
         """
-        Draw the table
-        :param surface: pygame.Surface where the table will be drawn
+        Add elements to the manager, they are drawn on top of the elements already added
+        :param elements: The elements to add
         :return: None
         """
-        if not self._display:
-            return
-
-        for item in self._items:
-            item.draw(surface)
+        super().add(*elements)
+        for element in elements:
+            self._add_to_spatial_index(element)
 
-    def update(self, events=None) -> None:
+    def remove(self, element: Element) -> None:
         """
-        Update the table and its elements
-        :param events: Optional pygame events list, kept for API consistency
+        Remove an element from the manager, the area it covered is redrawn on the next draw
+        :param element: The element to remove
         :return: None
         """
-        for item in self._items:
-            item.update()
+        super().remove(element)
+        self._spatial_index.remove(element)
+        element._set_spatial_index(None)
 
-class Checkbox(Element):
     """
-    Checkbox, clickable, it can be checked or unchecked, and it can be disabled or enabled, innherited from Element class.
+    Getters
     """
-    def __init__(self,
-                 position,
-                 width: int = 50,
-                 height: int = 50,
-                 style: Literal["checkmark", "cross", "circle", "square", "none"] = "checkmark",
-                 unchecked_style: Literal["checkmark", "cross", "circle", "square", "none"] ="none",
-                 mark_width: int = 5,
-                 color: tuple[int,int,int] = (100, 255, 100),
-                 background_color: tuple[int,int,int] = (200,200,200),
-                 border_radius: int = 0,
-                 border_color: tuple[int, int, int] = (0, 0, 0),
-                 border_width: int = 2,
-                 centered: bool = False) -> None:
+
+    def get_element_at(self, position: tuple[int, int]) -> Element:
         """
-        Create a checkbox element
-        :param position: Where the checkbox will be positioned
-        :param width: Width of the checkbox
-        :param height: Height of the checkbox
-        :param style: The style of mark when checked:
-            - "checkmark": A checkmark symbol (✓)
-            - "cross": An X symbol (✗)
-            - "circle": A circle (○)
-            - "square": A square (□)
-            - "none": No mark shown
-        :param unchecked_style: The style of mark when unchecked (same options as style)
-        :param mark_width: Width of the mark lines/borders
-        :param color: Color of the mark
-        :param background_color: Color of the checkbox background
-        :param border_radius: Radius for rounded corners
-        :param border_color: Color of the checkbox border
-        :param border_width: Width of the border
-        :param centered: If True, the checkbox is centered on the provided position
+        Get the top-most displayed element at a position
+        :param position: tuple[int, int] with the position
+        :return: Element at the position, None if there is none
         """
+        return self._spatial_index.query_point(position)
 
-        super().__init__(position, width, height, background_color, border_radius, border_color, border_width, centered)
+    def get_hovered_element(self) -> Element:
+        """
+        Get the top-most displayed element under the mouse
+        :return: Element under the mouse, None if there is none
+        """
+        return self._spatial_index.query_hovered(mouse_state.get_pos())
 
-        self._checked = False
-        self._disabled = False
+    def get_frame_stats(self) -> dict:
+        """
+        Get the timing of the last frame
+        :return: dict with the update and draw time in milliseconds, and the number of elements, events and dirty rects
+        """
+        return self._frame_stats
 
-        self._checkstyles = {
-            "checkmark": pygame.Surface((width, height), pygame.SRCALPHA),
-            "cross": pygame.Surface((width, height), pygame.SRCALPHA),
-            "square": pygame.Surface((width, height), pygame.SRCALPHA),
-            "circle": pygame.Surface((width, height), pygame.SRCALPHA),
-        }
-        self._checkstyles["checkmark"].fill((0,0,0,0))
-        self._checkstyles["cross"].fill((0,0,0, 0))
-        self._checkstyles["square"].fill((0,0,0, 0))
-        self._checkstyles["circle"].fill((0,0,0, 0))
+    """
+    Internal methods
+    """
 
-        pygame.draw.line(self._checkstyles["checkmark"], color, (width//4, height//2), (width//2, height*3//4), mark_width)
-        pygame.draw.line(self._checkstyles["checkmark"], color, (width//2, height*3//4), (width*3//4, height//4), mark_width)
+    def _add_to_spatial_index(self, element: Element) -> None:
+        """
+        Add an element to the spatial index and let the element keep it up to date when it moves
+        :param element: The element to add
+        :return: None
+        """
+        self._spatial_index.insert(element)
+        element._set_spatial_index(self._spatial_index)
 
-        pygame.draw.line(self._checkstyles["cross"], color, (width//4, height//4), (width*3//4, height*3//4), mark_width)
-        pygame.draw.line(self._checkstyles["cross"], color, (width//4, height*3//4), (width*3//4, height//4), mark_width)
+    @staticmethod
+    def _group_events(events: list) -> dict:
+        """
+        Group events by their type
+        :param events: list of pygame events
+        :return: dict with the event type as key and the list of events of that type as value
+        """
+        grouped = {}
+        for event in events:
+            grouped.setdefault(event.type, []).append(event)
 
-        square_size = min(width, height) * 0.6  # Make square 60% of the smallest dimension
-        square_x = (width - square_size) // 2   # Center horizontally
-        square_y = (height - square_size) // 2  # Center vertically
-        pygame.draw.rect(self._checkstyles["square"], color, (square_x, square_y, square_size, square_size), mark_width)
+        return grouped
 
-        pygame.draw.circle(self._checkstyles["circle"], color, (width//2, height//2), width//3, mark_width)
+    @staticmethod
+    def _merge_events(events: list, grouped_events: dict, event_types: tuple) -> list:
+        """
+        Get the events of several types from the grouped events, in the order they were received
+        :param events: list of pygame events of the frame
+        :param grouped_events: dict returned by _group_events for the same events
+        :param event_types: tuple with the event types to get
+        :return: list with the events of the given types
+        """
+        groups = [grouped_events[event_type] for event_type in event_types if event_type in grouped_events]
+        if not groups:
+            return []
+        if len(groups) == 1:
+            return groups[0]
 
-        self._checked_style = style
-        self._unchecked_style = unchecked_style
+        # Events of different types can be interleaved (e.g. key presses and text input), keep their order
+        order = {id(event): index for index, event in enumerate(events)}
+        return sorted((event for group in groups for event in group), key=lambda event: order[id(event)])
 
     """
-    Setters
+    Basic methods
     """
 
-    def set_checked(self, checked: bool) -> None:
+    def update(self, events: list = None) -> None:
         """
-        Set the checked state of the checkbox
-        :param checked: bool with the new checked state
+        Update every element
+        :param events: list of pygame events of the frame
+        :return: None
         """
-        self._checked = checked
+        start = time.perf_counter()
 
-    def disable(self) -> None:
+        # Swap in the images decoded in the background
+        asset_manager.update()
+
+        events = events or []
+        grouped_events = self._group_events(events)
+
+        # Events of the elements listening to several types, built once per distinct filter
+        filtered_events = {}
+
+        mouse_state.capture()
+        try:
+            # Find the hovered element once, the elements compare themselves to it in is_hovered
+            self._spatial_index.invalidate()
+            self._spatial_index.query_hovered(mouse_state.get_pos())
+
+            for element in self._elements:
+                event_types = element._event_types
+                if event_types is None:
+                    element_events = events
+                elif not event_types:
+                    element_events = []
+                elif len(event_types) == 1:
+                    element_events = grouped_events.get(event_types[0], [])
+                else:
+                    element_events = filtered_events.get(event_types)
+                    if element_events is None:
+                        element_events = self._merge_events(events, grouped_events, event_types)
+                        filtered_events[event_types] = element_events
+
+                element.update(element_events)
+        finally:
+            mouse_state.release()
+
+        self._frame_stats["update_ms"] = (time.perf_counter() - start) * 1000
+        self._frame_stats["elements"] = len(self._elements)
+        self._frame_stats["events"] = len(events)
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
         """
-        Disable the checkbox, allows the user to click to check it
+        Draw the elements
+        Pass the returned rects to pygame.display.update instead of calling pygame.display.flip
+        :param surface: pygame.Surface where the elements will be drawn, usually the screen
+        :return: list[pygame.Rect] with the areas that were redrawn
         """
-        self._disabled = True
+        start = time.perf_counter()
 
-    def enable(self) -> None:
+        if self._use_dirty_rects:
+            dirty_rects = super().draw(surface)
+        else:
+            self._draw_background(surface, surface.get_rect())
+            for element in self._elements:
+                element.draw(surface)
+            dirty_rects = [surface.get_rect()]
+
+        self._frame_stats["draw_ms"] = (time.perf_counter() - start) * 1000
+        self._frame_stats["dirty_rects"] = len(dirty_rects)
+
+        return dirty_rects
+
+class Profiler:
+    """
+    Opt-in timing of the update and draw methods of every element class.
+    While enabled, the methods of Element and its subclasses are wrapped with timers that record the call count,
+    total and max time, and the font renders and surface allocations per class and per instance.
+    When disabled the original methods are put back, so there is no cost unless profiling.
+    Times include nested elements, a DropdownMenu draw includes the draw of its buttons.
+    """
+    # Methods wrapped on every element class
+    _methods = ("update", "draw")
+
+    def __init__(self) -> None:
         """
-        Enable the checkbox, allows the user to click to check it
+        Create a profiler, use the shared pygameui.profiler instance instead of creating new ones
         """
-        self._disabled = False
+        self._enabled = False
+        self._originals = {}
+        # Element and method currently being timed, nested super() calls are not timed twice
+        self._active = set()
+
+        self._class_stats = {}
+        self._instance_stats = {}
 
     """
     Getters
     """
 
-    def is_checked(self) -> bool:
+    def is_enabled(self) -> bool:
         """
-        Get the checked state of the checkbox
-        :return: bool with the checked state
+        Check if the profiler is enabled
+        :return: bool, True if the element methods are being timed
         """
-        return self._checked
+        return self._enabled
 
-    def is_enabled(self) -> bool:
+    def get_stats(self) -> dict:
         """
-        Get the enabled state of the checkbox
-        :return: bool with the enabled state
+        Get the recorded statistics
+        Each entry has update and draw dicts with count, total_ms and max_ms, plus font_renders and surface_allocations
+        :return: dict with "classes" keyed by class name and "instances" keyed by class name and instance id
         """
-        return not self._disabled
+        return {
+            "classes": {name: self._copy_stats(stats) for name, stats in self._class_stats.items()},
+            "instances": {name: self._copy_stats(stats) for name, stats in self._instance_stats.items()},
+        }
 
     """
     Basic methods
     """
 
-    def draw(self, surface: pygame.surface) -> None:
+    def enable(self) -> None:
         """
-        Draw the checkbox
-        :param surface: pygame.Surface where the checkbox will be drawn
+        Start timing the update and draw methods of Element and every subclass defined so far
+        :return: None
         """
-        if not self._display:
+        if self._enabled:
             return
 
-        super().draw(surface)
-        # Draw the checkmark
-        if self._checked:
-            if not self._checked_style == "none":
-                surface.blit(self._checkstyles[self._checked_style], self._rect.topleft)
-        else:
-            if not self._unchecked_style == "none":
-                surface.blit(self._checkstyles[self._unchecked_style], self._rect.topleft)
+        for cls in self._get_element_classes():
+            for name in self._methods:
+                method = cls.__dict__.get(name)
+                if method is None:
+                    continue
+                self._originals[(cls, name)] = method
+                setattr(cls, name, self._wrap(method, name))
 
+        self._enabled = True
 
-    def update(self, events=None) -> None:
+    def disable(self) -> None:
         """
-        Update the checkbox state and handle click events
-        :param events: Optional pygame events list, kept for API consistency
+        Stop timing and restore the original methods, the recorded statistics are kept
         :return: None
         """
-        super().update()
+        if not self._enabled:
+            return
 
-        # Check if the checkbox was clicked
-        if self.was_clicked() and not self._disabled:
-            self._checked = not self._checked
+        for (cls, name), method in self._originals.items():
+            setattr(cls, name, method)
+
+        self._originals.clear()
+        self._active.clear()
+        self._enabled = False
+
+    def reset(self) -> None:
+        """
+        Remove the recorded statistics
+        :return: None
+        """
+        self._class_stats.clear()
+        self._instance_stats.clear()
+
+    def draw_overlay(self,
+                     surface: pygame.Surface,
+                     position: tuple[int, int] = (10, 10),
+                     max_rows: int = 10,
+                     font_size: int = 14,
+                     color: tuple[int, int, int] = (255, 255, 255),
+                     background_color: tuple[int, int, int] = (0, 0, 0)) -> None:
+        """
+        Draw the classes with the highest total time on a surface
+        :param surface: Where the overlay will be drawn
+        :param position: Top left corner of the overlay
+        :param max_rows: Maximum number of classes shown
+        :param font_size: Size of the overlay text
+        :param color: Color of the overlay text
+        :param background_color: Color behind the overlay text
+        :return: None
+        """
+        rows = sorted(self._class_stats.items(),
+                      key=lambda item: item[1]["update"]["total_ms"] + item[1]["draw"]["total_ms"],
+                      reverse=True)[:max_rows]
+
+        lines = ["class            update ms (max)      draw ms (max)   fonts  surfaces"]
+        for name, stats in rows:
+            update, draw = stats["update"], stats["draw"]
+            lines.append(f"{name[:14]:<14} {update['total_ms']:9.2f} ({update['max_ms']:6.2f}) "
+                         f"{draw['total_ms']:9.2f} ({draw['max_ms']:6.2f}) "
+                         f"{stats['font_renders']:7d} {stats['surface_allocations']:9d}")
+
+        # Rendered directly with the font so the overlay does not fill the text cache or the counters
+        font = font_cache.get_font("Courier New", font_size)
+        line_surfaces = [font.render(line, True, color) for line in lines]
+
+        width = max(line.get_width() for line in line_surfaces) + 8
+        height = sum(line.get_height() for line in line_surfaces) + 8
+        pygame.draw.rect(surface, background_color, (position[0], position[1], width, height))
+
+        y = position[1] + 4
+        for line in line_surfaces:
+            surface.blit(line, (position[0] + 4, y))
+            y += line.get_height()
+
+    """
+    Internal methods
+    """
+
+    @staticmethod
+    def _get_element_classes() -> list[type]:
+        """
+        Get Element and all of its subclasses
+        :return: list[type] with the classes
+        """
+        classes = [Element]
+        for cls in classes:
+            for subclass in cls.__subclasses__():
+                if subclass not in classes:
+                    classes.append(subclass)
+        return classes
+
+    @staticmethod
+    def _new_stats() -> dict:
+        """
+        Create an empty statistics entry
+        :return: dict with zeroed statistics
+        """
+        return {
+            "update": {"count": 0, "total_ms": 0.0, "max_ms": 0.0},
+            "draw": {"count": 0, "total_ms": 0.0, "max_ms": 0.0},
+            "font_renders": 0,
+            "surface_allocations": 0,
+        }
+
+    @staticmethod
+    def _copy_stats(stats: dict) -> dict:
+        """
+        Copy a statistics entry so callers can not change the recorded values
+        :param stats: dict with the statistics
+        :return: dict with a copy of the statistics
+        """
+        return {
+            "update": dict(stats["update"]),
+            "draw": dict(stats["draw"]),
+            "font_renders": stats["font_renders"],
+            "surface_allocations": stats["surface_allocations"],
+        }
+
+    def _wrap(self, method, name: str):
+        """
+        Create a timed version of an element method
+        :param method: The original function
+        :param name: Name of the method, "update" or "draw"
+        :return: function recording the time of each call
+        """
+        profiler = self
+
+        def timed(element, *args, **kwargs):
+            key = (id(element), name)
+            if key in profiler._active:
+                return method(element, *args, **kwargs)
+
+            profiler._active.add(key)
+            font_renders = _counters["font_renders"]
+            surface_allocations = _counters["surface_allocations"]
+            start = time.perf_counter()
+            try:
+                return method(element, *args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000
+                profiler._active.discard(key)
+                profiler._record(element,
+                                 name,
+                                 elapsed,
+                                 _counters["font_renders"] - font_renders,
+                                 _counters["surface_allocations"] - surface_allocations)
+
+        timed.__name__ = method.__name__
+        timed.__qualname__ = method.__qualname__
+        timed.__doc__ = method.__doc__
+        timed.__wrapped__ = method
+        return timed
+
+    def _record(self, element: Element, name: str, elapsed: float, font_renders: int, surface_allocations: int) -> None:
+        """
+        Add a timed call to the class and instance statistics
+        :param element: The element the method was called on
+        :param name: Name of the method
+        :param elapsed: Time of the call in milliseconds
+        :param font_renders: Number of font renders during the call
+        :param surface_allocations: Number of surfaces allocated during the call
+        :return: None
+        """
+        class_name = type(element).__name__
+        instance_name = f"{class_name} {id(element):#x}"
+
+        for stats_by_name, key in ((self._class_stats, class_name), (self._instance_stats, instance_name)):
+            stats = stats_by_name.get(key)
+            if stats is None:
+                stats = self._new_stats()
+                stats_by_name[key] = stats
+
+            method_stats = stats[name]
+            method_stats["count"] += 1
+            method_stats["total_ms"] += elapsed
+            if elapsed > method_stats["max_ms"]:
+                method_stats["max_ms"] = elapsed
+            stats["font_renders"] += font_renders
+            stats["surface_allocations"] += surface_allocations
+
+profiler = Profiler()